@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 14:10, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import time
+import queue
+import asyncio
+import threading
+import numpy as np
+from collections import Counter
+from concurrent.futures import Future
+from enoppy.utils.validator import check_int, check_float
+
+STOP = object()
+
+
+class BatchCoalescer:
+    """
+    Merge the concurrent single-solution evaluations of a problem into batch evaluations.
+
+    Clients (threads with ``evaluate``, asyncio tasks with ``evaluate_async``) submit one solution at a time. A background
+    thread takes the first waiting request, collects the requests that come within ``max_latency`` seconds after it (or
+    until ``max_batch_size`` requests), evaluates them with one ``problem.evaluate_full_batch`` call and returns each
+    client its own row. Since the problem is only evaluated by the background thread, it does not need the thread-safe
+    mode. Note that a population-level penalty strategy sees each batch as a population.
+
+    The histograms of the batch sizes and of the queue depths (the number of waiting requests when a batch starts) are
+    available with ``get_stats()``. Once the coalescer is closed, the futures of the new requests fail with a
+    ``RuntimeError``.
+
+    Parameters
+    ----------
+    problem : Engineer
+        The problem to evaluate
+    max_batch_size : int
+        The maximum number of solutions in a batch
+    max_latency : float
+        The maximum time in seconds a batch waits for more requests after its first one
+
+    Examples
+    --------
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from enoppy.paper_based.rwco_2020 import PressureVesselDesignProblem
+    >>> from enoppy.coalescer import BatchCoalescer
+    >>>
+    >>> problem = PressureVesselDesignProblem()
+    >>> with BatchCoalescer(problem, max_batch_size=64, max_latency=0.001) as coalescer:
+    >>>     with ThreadPoolExecutor(max_workers=32) as executor:
+    >>>         list_fits = list(executor.map(coalescer.evaluate, pop))
+    >>>     print(coalescer.get_stats())
+    """
+
+    def __init__(self, problem, max_batch_size=64, max_latency=0.001):
+        self.problem = problem
+        self.max_batch_size = check_int("max_batch_size", max_batch_size, [1, float("inf")])
+        self.max_latency = check_float("max_latency", max_latency, [0, float("inf")])
+        self.batch_sizes = Counter()
+        self.queue_depths = Counter()
+        self._queue = queue.Queue()
+        self._thread = None
+        self._closed = False
+        self._lock = threading.RLock()
+
+    @property
+    def closed(self):
+        """
+        Whether the coalescer is closed and rejects the new requests.
+        """
+        return self._closed
+
+    def start(self):
+        """
+        Start the background thread, if it is not running.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The coalescer is closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.run, name="BatchCoalescer", daemon=True)
+                self._thread.start()
+
+    def submit(self, x):
+        """
+        Queue a solution for evaluation.
+
+        Parameters
+        ----------
+        x : np.ndarray, list, tuple
+            The solution, a vector of length ``n_dims``. It is copied, so the caller can reuse it.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            The future of ``(list_objs, list_cons, val)``, failed with a ``RuntimeError`` if the coalescer is closed
+        """
+        self.problem.check_solution(x)
+        future = Future()
+        with self._lock:
+            if self._closed:
+                future.set_exception(RuntimeError("The coalescer is closed."))
+                return future
+            self.start()
+            self._queue.put((np.array(x, dtype=float), future))
+        return future
+
+    def evaluate_full(self, x):
+        """
+        Evaluate a solution in the next batch and wait for the result, see ``Engineer.evaluate_full``.
+        """
+        return self.submit(x).result()
+
+    def evaluate(self, x):
+        """
+        Evaluate a solution in the next batch and wait for the result, see ``Engineer.evaluate``.
+        """
+        return self.submit(x).result()[2]
+
+    async def evaluate_full_async(self, x):
+        """
+        Awaitable ``evaluate_full``.
+        """
+        return await asyncio.wrap_future(self.submit(x))
+
+    async def evaluate_async(self, x):
+        """
+        Awaitable ``evaluate``.
+        """
+        return (await self.evaluate_full_async(x))[2]
+
+    def collect(self, first):
+        """
+        Return the batch that starts with the request ``first``: the requests that come within ``max_latency`` seconds,
+        up to ``max_batch_size`` of them. The stop signal, if any, is put back in the queue.
+        """
+        batch = [first]
+        deadline = time.perf_counter() + self.max_latency
+        while len(batch) < self.max_batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            if item is STOP:
+                self._queue.put(STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def run(self):
+        """
+        The loop of the background thread.
+        """
+        while True:
+            first = self._queue.get()
+            if first is STOP:
+                break
+            self.queue_depths[self._queue.qsize() + 1] += 1
+            batch = self.collect(first)
+            self.batch_sizes[len(batch)] += 1
+            batch = [(x, future) for x, future in batch if future.set_running_or_notify_cancel()]
+            if len(batch) == 0:
+                continue
+            list_futures = [future for _, future in batch]
+            try:
+                list_objs, list_cons, list_fits = self.problem.evaluate_full_batch(np.array([x for x, _ in batch]))
+            except Exception as error:
+                for future in list_futures:
+                    future.set_exception(error)
+                continue
+            for idx, future in enumerate(list_futures):
+                future.set_result((list_objs[idx], list_cons[idx], list_fits[idx]))
+
+    def get_stats(self):
+        """
+        Return the number of batches and requests and the histograms of the batch sizes and of the queue depths.
+
+        Returns
+        -------
+        stats : dict
+            The keys are "n_batches", "n_requests", "batch_sizes" and "queue_depths", the histograms map a size to
+            its number of batches
+        """
+        return {"n_batches": sum(self.batch_sizes.values()),
+                "n_requests": sum(size * count for size, count in self.batch_sizes.items()),
+                "batch_sizes": dict(sorted(self.batch_sizes.items())),
+                "queue_depths": dict(sorted(self.queue_depths.items()))}
+
+    def close(self):
+        """
+        Evaluate the requests in the queue and stop the background thread. The later requests are rejected.
+        """
+        with self._lock:
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(STOP)
+                self._thread.join()
+                self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -4,27 +4,80 @@
 #       Github: https://github.com/thieu1995        %                         
 # --------------------------------------------------%
 
+import sys
+import threading
 import numpy as np
 from abc import ABC
+from contextlib import nullcontext
+from enoppy.utils.penalty import static_penalty, get_penalty, Penalty
+from enoppy.utils.cache import LRUCache, DiskCache
+from enoppy.utils.spec import encode, decode, decode_data, get_fingerprint, get_object_path, import_object
+from enoppy.utils.budget import EvaluationBudget
+from enoppy.utils.schema import VariableSchema
+from enoppy.utils.boundary import BOUND_HANDLERS
+from enoppy.utils.sampling import get_generator, sample_unit
+from enoppy.utils.validator import check_bool, check_str
+
+NO_LOCK = nullcontext()
+
+
+def is_plain_data(value):
+    """
+    Check that a value is None, a number, a boolean, a numeric array or a (nested) list of those.
+    """
+    if value is None or isinstance(value, (bool, int, float, np.ndarray)):
+        return True
+    return isinstance(value, list) and all(is_plain_data(item) for item in value)
+
+
+def unique_rows(X):
+    """
+    Find the distinct rows of a 2D-matrix.
+
+    The rows are hashed by a fixed random projection, so only a 1D sort is needed, and the result is checked exactly;
+    in the (unlikely) case of a hash collision, the rows are returned as they are.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        A 2D-matrix of shape (n_rows, n_cols)
+
+    Returns
+    -------
+    (X_unique, inverse) : tuple
+        The distinct rows and the indices such that ``X_unique[inverse] == X``
+    """
+    coefs = np.random.default_rng(len(X[0])).uniform(0.5, 1.5, len(X[0]))
+    _, idx, inverse = np.unique(X @ coefs, return_index=True, return_inverse=True)
+    X_unique = X[idx]
+    if not np.array_equal(X_unique[inverse], X):
+        return X, np.arange(len(X))
+    return X_unique, inverse
 
 
 class Engineer(ABC):
     """
     Defines an abstract class for engineering design problems.
 
-    All subclasses should implement the ``evaluate`` method for a particular problem.
+    All subclasses should implement the ``get_objs`` and ``get_cons`` methods for a particular problem, or ``get_objs_cons``
+    when the objectives and constraints share intermediate expressions.
 
     Attributes
     ----------
-    bounds : list
+    bounds : np.ndarray
         The lower/upper bounds of the problem. This a 2D-matrix of [lower, upper] array that contain the lower and upper bounds.
         By default, each problem has its own bounds. But user can try to put different bounds to test the problem.
+        The bounds are stored as a read-only float 2D-matrix of shape (n_dims, 2), whatever the form they are given in.
     n_dims : int
         The dimensionality of the problem. It is calculated from bounds
     lb : np.ndarray
         The lower bounds for the problem
     ub : np.ndarray
         The upper bounds for the problem
+    range : np.ndarray
+        The width ``ub - lb`` of the bounds
+    center : np.ndarray
+        The center ``(lb + ub) / 2`` of the bounds
     f_global : float
         The global optimum of the evaluated function.
     x_global : np.ndarray
@@ -32,6 +85,25 @@ class Engineer(ABC):
         Note that some problems have multiple global minima, not all of which may be listed.
     n_fe : int
         The number of function evaluations that the object has been asked to calculate.
+    cache : LRUCache, None
+        The optional evaluation cache, see ``set_cache``.
+    n_saved : int
+        The number of evaluations of duplicated rows skipped by the batch evaluation, see ``deduplicate``.
+    n_hits : int
+        The number of solutions whose objectives and constraints were read from the cache.
+    eval_time : float
+        The wall time in seconds spent by worker processes or threads evaluating for this problem, see ``add_counters``.
+    thread_safe : bool
+        Whether the problem can be evaluated by several threads at once, see ``set_thread_safe``.
+    budget : EvaluationBudget, None
+        The optional budget and target controller, see ``set_budget``.
+    workspace : bool
+        Whether single solutions are evaluated into preallocated buffers, see ``set_workspace``.
+    schema : VariableSchema, None
+        The types of the variables (integer and discrete-table variables are amended before every evaluation),
+        None when all the variables are continuous.
+    bound_handling : str, None
+        The repair of the out-of-bounds variables before every evaluation, see ``set_bound_handling``.
     """
 
     name = "Benchmark name"
@@ -39,6 +111,12 @@ class Engineer(ABC):
     convex = True
     differentiable = True
     parametric = True
+    vectorized = False
+    deduplicate = False
+    scalar = False
+    counter_attrs = ("n_fe", "n_saved", "n_hits", "eval_time")
+    runtime_attrs = ("f_penalty", "cache", "count_hits", "budget", "workspace", "copy_results",
+                     "_bound_rng", "_bounds_cache", "_lock", "_scratch", "_async", "_async_thread_safe") + counter_attrs
 
     def __init__(self):
         self._bounds = None
@@ -55,6 +133,36 @@ class Engineer(ABC):
         self.paras = {}
         self.epsilon = 1e-8
         self.w = 1e8
+        self.schema = None
+        self.bound_handling = None
+        self._bound_rng = None
+        self.cache = None
+        self.count_hits = False
+        self.n_saved = 0
+        self.n_hits = 0
+        self.eval_time = 0.
+        self.budget = None
+        self.workspace = False
+        self.copy_results = False
+        self._lock = None
+        self._scratch = threading.local()
+        self._async = None
+        self._async_thread_safe = False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = self._lock is not None
+        state["_async"] = None
+        state["_async_thread_safe"] = False
+        state.pop("_scratch", None)
+        state.pop("_bounds_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._bounds = state.get("_bounds")
+        self._lock = threading.Lock() if state.get("_lock") else None
+        self._scratch = threading.local()
 
     def get_objs(self, x):
         """
@@ -80,6 +188,97 @@ class Engineer(ABC):
         """
         pass
 
+    def get_objs_cons(self, x):
+        """
+        Compute the values of the objective and constraint functions together.
+
+        By default, it calls ``get_objs`` and ``get_cons``. Problems whose objectives and constraints share intermediate
+        expressions override it to compute them once, and then ``get_objs``/``get_cons`` are views over it.
+
+        Returns
+        -------
+        (list_objs, list_cons) : tuple
+            The objective values and the constraint values
+        """
+        return self.get_objs(x), self.get_cons(x)
+
+    def get_objs_cons_scalar(self, x, objs, cons):
+        """
+        Scalar kernel of ``evaluate_scalar``: compute the objective and constraint values of one solution, given as a list
+        of Python floats, and write them into the lists ``objs`` (length n_objs) and ``cons`` (length n_cons).
+
+        Problems with ``scalar = True`` override it with ``math`` functions on Python floats, which avoids the overhead of
+        NumPy on small vectors. The kernel may raise ``ArithmeticError`` or ``ValueError`` (e.g. a division by zero), the
+        solution is then evaluated by this default, which goes through ``get_objs_cons``.
+        """
+        list_objs, list_cons = self.get_objs_cons(np.array(x, dtype=float))
+        objs[:] = np.ravel(list_objs).tolist()
+        cons[:] = np.ravel(list_cons).tolist()
+
+    def get_objs_batch(self, X):
+        """
+        Compute the values of the objective functions for a population of solutions.
+
+        Problems with ``vectorized = True`` evaluate the whole population at once by passing the columns of X to ``get_objs``,
+        others fall back to a row-by-row loop.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The population, a 2D-matrix of shape (n_pop, n_dims)
+
+        Returns
+        -------
+        list_objs : np.ndarray
+            The objective values, a 2D-matrix of shape (n_pop, n_objs)
+        """
+        X = self.check_population(X)
+        if self.vectorized:
+            return np.asarray(self.get_objs(np.ascontiguousarray(X.T)), dtype=float).T
+        return np.array([self.get_objs(x) for x in X], dtype=float).reshape(X.shape[0], self.n_objs)
+
+    def get_cons_batch(self, X):
+        """
+        Compute the values of the constraint functions for a population of solutions.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The population, a 2D-matrix of shape (n_pop, n_dims)
+
+        Returns
+        -------
+        list_cons : np.ndarray
+            The constraint values, a 2D-matrix of shape (n_pop, n_cons)
+        """
+        X = self.check_population(X)
+        if self.vectorized:
+            return np.asarray(self.get_cons(np.ascontiguousarray(X.T)), dtype=float).T
+        return np.array([self.get_cons(x) for x in X], dtype=float).reshape(X.shape[0], self.n_cons)
+
+    def get_objs_cons_batch(self, X):
+        """
+        Compute the values of the objective and constraint functions for a population of solutions in a single pass.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The population, a 2D-matrix of shape (n_pop, n_dims)
+
+        Returns
+        -------
+        (list_objs, list_cons) : tuple
+            The objective values of shape (n_pop, n_objs) and the constraint values of shape (n_pop, n_cons)
+        """
+        X = self.check_population(X)
+        if self.vectorized:
+            list_objs, list_cons = self.get_objs_cons(np.ascontiguousarray(X.T))
+            return np.asarray(list_objs, dtype=float).T, np.asarray(list_cons, dtype=float).T
+        list_results = [self.get_objs_cons(x) for x in X]
+        list_objs = np.array([res[0] for res in list_results], dtype=float).reshape(X.shape[0], self.n_objs)
+        list_cons = np.array([res[1] for res in list_results], dtype=float).reshape(X.shape[0], self.n_cons)
+        return list_objs, list_cons
+
     def get_paras(self):
         """
         Return the parameters of the problem. Depended on function
@@ -87,6 +286,10 @@ class Engineer(ABC):
         default = {"bounds": self._bounds, "n_dims": self._n_dims, }
         return {**default, **self.paras}
 
+    @property
+    def thread_safe(self):
+        return self._lock is not None
+
     @property
     def bounds(self):
         """
@@ -95,6 +298,37 @@ class Engineer(ABC):
         """
         return self._bounds
 
+    @bounds.setter
+    def bounds(self, bounds):
+        self._bounds = bounds
+
+    @property
+    def _bounds(self):
+        return self.__dict__.get("_bounds")
+
+    @_bounds.setter
+    def _bounds(self, bounds):
+        if bounds is not None:
+            bounds = np.array(bounds, dtype=float)
+            if bounds.ndim != 2 or bounds.shape[1] != 2:
+                raise ValueError("The bounds should be a 2D-matrix of shape (n_dims, 2)!")
+            bounds.setflags(write=False)
+        self.__dict__["_bounds"] = bounds
+        self.__dict__["_bounds_cache"] = None
+
+    def get_bounds_cache(self):
+        """
+        Return the read-only vectors ``(lb, ub, range, center)``, computed once after each assignment of the bounds.
+        """
+        cache = self.__dict__.get("_bounds_cache")
+        if cache is None:
+            lb, ub = self._bounds[:, 0], self._bounds[:, 1]
+            width, center = ub - lb, (lb + ub) / 2
+            width.setflags(write=False)
+            center.setflags(write=False)
+            cache = self.__dict__["_bounds_cache"] = (lb, ub, width, center)
+        return cache
+
     @property
     def n_dims(self):
         """
@@ -138,9 +372,9 @@ class Engineer(ABC):
         Returns
         -------
         lb : 1D-vector
-            The lower bounds for the problem
+            The lower bounds for the problem, a read-only view of ``bounds``
         """
-        return np.array([x[0] for x in self.bounds])
+        return self.get_bounds_cache()[0]
 
     @property
     def ub(self):
@@ -150,20 +384,127 @@ class Engineer(ABC):
         Returns
         -------
         ub : 1D-vector
-            The upper bounds for the problem
+            The upper bounds for the problem, a read-only view of ``bounds``
         """
-        return np.array([x[1] for x in self.bounds])
+        return self.get_bounds_cache()[1]
+
+    @property
+    def range(self):
+        """
+        The width ``ub - lb`` of the bounds, a read-only vector
+        """
+        return self.get_bounds_cache()[2]
+
+    @property
+    def center(self):
+        """
+        The center ``(lb + ub) / 2`` of the bounds, a read-only vector
+        """
+        return self.get_bounds_cache()[3]
+
+    @property
+    def var_types(self):
+        """
+        The type of each variable: "float", "int" or "discrete", see ``VariableSchema``.
+        """
+        return self.get_schema().var_types
+
+    def get_schema(self):
+        """
+        Return the variable schema of the problem, an all-continuous one when ``schema`` is None.
+        """
+        return VariableSchema(self._n_dims) if self.schema is None else self.schema
 
     def amend_position(self, x, lb=None, ub=None):
         """
-        Amend position to fit the format of the problem
+        Amend position to fit the format of the problem: repair the out-of-bounds variables (see ``set_bound_handling``),
+        then round the integer variables and decode the discrete variables declared by ``schema``.
 
         Parameters
         ----------
         x : np.ndarray
             The current position (solution)
+        lb : np.ndarray, optional
+            The lower bounds, default is ``lb``
+        ub : np.ndarray, optional
+            The upper bounds, default is ``ub``
+
+        Returns
+        -------
+        x : np.ndarray
+            The amended copy of the solution, or the solution itself when there is nothing to amend
+        """
+        if self.bound_handling is None:
+            if self.schema is None:
+                return x
+            return self.schema.amend(np.array(x, dtype=float))
+        x = self.repair_bounds(np.array(x, dtype=float), lb, ub)
+        return x if self.schema is None else self.schema.amend(x)
+
+    def repair_bounds(self, X, lb=None, ub=None):
+        """
+        Repair the out-of-bounds variables of a solution or a population in place, with the method of ``set_bound_handling``.
+        """
+        lb = self.lb if lb is None else lb
+        ub = self.ub if ub is None else ub
+        return BOUND_HANDLERS[self.bound_handling](X, lb, ub, self._bound_rng)
+
+    def amend_scalar(self, x):
         """
-        return x
+        Amend a solution given as a list of Python floats before the scalar kernel, the same way ``evaluate_full`` does.
+
+        Returns
+        -------
+        x : list
+            The amended solution
+        """
+        return x if self.schema is None else self.schema.amend_list(x)
+
+    def amend_batch(self, X, lb=None, ub=None):
+        """
+        Amend a population to fit the format of the problem. The input population is not modified.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The population, a 2D-matrix of shape (n_pop, n_dims)
+
+        Returns
+        -------
+        X : np.ndarray
+            The amended copy of the population
+
+        Notes
+        -----
+        The out-of-bounds variables (see ``set_bound_handling``) and the variables declared by ``schema`` are amended
+        in one vectorized pass over the copy. A subclass that overrides ``amend_position`` instead is called row by row.
+        """
+        X = np.array(X, dtype=float)
+        if type(self).amend_position is not Engineer.amend_position:
+            for idx in range(X.shape[0]):
+                X[idx] = self.amend_position(X[idx], lb, ub)
+            return X
+        if self.bound_handling is not None:
+            self.repair_bounds(X, lb, ub)
+        if self.schema is not None:
+            self.schema.amend(X)
+        return X
+
+    def pack_population(self, X):
+        """
+        Store a population column by column with compact dtypes, see ``VariableSchema.pack``.
+
+        Parameters
+        ----------
+        X : np.ndarray, list
+            The population, a 2D-matrix of shape (n_pop, n_dims)
+
+        Returns
+        -------
+        population : CompactPopulation
+            The packed population, accepted by the batch evaluation methods
+        """
+        return self.get_schema().pack(self.check_population(X))
 
     def create_solution(self):
         """
@@ -176,6 +517,43 @@ class Engineer(ABC):
         """
         return np.random.uniform(self.lb, self.ub)
 
+    def create_population(self, n, method="uniform", seed=None, stream=None):
+        """
+        Create ``n`` random solutions at once, from a local random generator instead of the global ``np.random`` state.
+
+        The points are drawn in the unit hypercube by :func:`enoppy.utils.sampling.sample_unit` (``scipy.stats.qmc`` for
+        the Latin hypercube and Sobol designs), scaled to the bounds in place and amended in one vectorized pass, so the
+        integer and discrete variables are valid.
+
+        Parameters
+        ----------
+        n : int
+            The number of solutions
+        method : str
+            "uniform", "lhs" (Latin hypercube) or "sobol" (scrambled Sobol sequence, best with a power of 2 for ``n``)
+        seed : int, np.random.SeedSequence, np.random.Generator, optional
+            The seed of the random generator, or the generator itself
+        stream : int, optional
+            The number of an independent stream spawned from ``seed``, e.g. the rank of a worker process,
+            see :func:`enoppy.utils.sampling.get_generator`
+
+        Returns
+        -------
+        X : np.ndarray
+            The population, a 2D-matrix of shape (n, n_dims)
+
+        Examples
+        --------
+        >>> X = problem.create_population(1024, method="sobol", seed=42)
+        >>> X_worker = problem.create_population(100, seed=42, stream=rank)     # a different stream in each worker
+        """
+        X = sample_unit(n, self._n_dims, method, get_generator(seed, stream))
+        X *= self.range
+        X += self.lb
+        if type(self).amend_position is not Engineer.amend_position:
+            return self.amend_batch(X, self.lb, self.ub)
+        return X if self.schema is None else self.schema.amend(X)
+
     def check_solution(self, x):
         """
         Raise the error if the problem size is not equal to the solution length
@@ -188,19 +566,525 @@ class Engineer(ABC):
         if len(x) != self._n_dims:
             raise ValueError(f"The length of solution should has {self._n_dims} variables!")
 
-    def default_penalty(self, list_objs=None, list_cons=None):
-        list_objs_new = np.zeros_like(list_objs)
-        for idx, val in enumerate(list_objs):
-            temp = val + self.w * np.sum([max(0, f_con) for f_con in list_cons])
-            list_objs_new[idx] = temp
-        return list_objs_new
+    def check_population(self, X):
+        """
+        Raise the error if the population is not a 2D-matrix with ``n_dims`` columns
+
+        Parameters
+        ----------
+        X : np.ndarray, list
+            The population of solutions
+
+        Returns
+        -------
+        X : np.ndarray
+            The population as a float 2D-matrix of shape (n_pop, n_dims)
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != self._n_dims:
+            raise ValueError(f"The population should be a 2D-matrix with {self._n_dims} columns!")
+        return X
+
+    def default_penalty(self, list_objs=None, list_cons=None, out=None, work=None, violation=None):
+        """
+        Static penalty: add ``w * sum(max(0, g))`` to every objective value.
+
+        Works on a single solution or on a whole population (2D-matrices of objectives and constraints).
+        See :func:`enoppy.utils.penalty.static_penalty` for the optional preallocated buffers.
+        """
+        return static_penalty(list_objs, list_cons, self.w, out=out, work=work, violation=violation)
+
+    def get_penalty_batch(self, list_objs, list_cons, out=None):
+        """
+        Apply the penalty function to a population.
+
+        The default penalty and the strategies with ``vectorized = True`` run over all rows at once,
+        a custom ``f_penalty(list_objs, list_cons)`` is called row by row.
+
+        Parameters
+        ----------
+        list_objs : np.ndarray
+            The objective values, a 2D-matrix of shape (n_pop, n_objs)
+        list_cons : np.ndarray
+            The constraint values, a 2D-matrix of shape (n_pop, n_cons)
+        out : np.ndarray, optional
+            Preallocated output buffer of shape (n_pop, n_objs), only used by the default penalty
+
+        Returns
+        -------
+        val : np.ndarray
+            The penalized values, the first axis has length ``n_pop``
+        """
+        if getattr(self.f_penalty, "__func__", None) is Engineer.default_penalty:
+            list_cons = np.asarray(list_cons, dtype=float)
+            work = self.get_scratch("work", list_cons.shape)
+            violation = self.get_scratch("violation", list_cons.shape[:1])
+            return self.f_penalty(list_objs, list_cons, out=out, work=work, violation=violation)
+        with self.get_penalty_lock():
+            if getattr(self.f_penalty, "vectorized", False):
+                return self.f_penalty(list_objs, list_cons)
+            return np.array([self.f_penalty(objs, cons) for objs, cons in zip(list_objs, list_cons)])
+
+    def get_penalty_lock(self):
+        """
+        Return the lock that serializes the calls of a stateful penalty function (see ``Penalty.stateful``) in thread-safe mode,
+        or a no-op context.
+        """
+        if self._lock is not None and getattr(self.f_penalty, "stateful", False):
+            return self._lock
+        return NO_LOCK
 
     def check_penalty_func(self, func=None):
+        """
+        Set the penalty function.
+
+        Parameters
+        ----------
+        func : callable, str, None
+            A callable ``func(list_objs, list_cons)``, the name of a built-in constraint-handling strategy
+            ("static", "death", "adaptive", "epsilon", "feasibility", see :mod:`enoppy.utils.penalty`),
+            or None for the default static penalty.
+        """
         if callable(func):
             self.f_penalty = func
+        elif type(func) is str:
+            self.f_penalty = self.default_penalty if func == "static" else get_penalty(func)
         else:
             self.f_penalty = self.default_penalty
 
+    def set_cache(self, maxsize=1024, count_hits=False, path=None):
+        """
+        Turn on the evaluation cache (or turn it off with ``maxsize=None``).
+
+        The objective and constraint values computed by ``evaluate_full`` (and so ``evaluate``, ``evaluate_batch``) are memoized,
+        keyed by the bytes of the solution that is actually evaluated, i.e. after ``amend_position`` for the problems with
+        discrete variables. The penalty function is always applied to the cached values, so changing it does not invalidate
+        the cache and population-level strategies see the whole population.
+
+        Parameters
+        ----------
+        maxsize : int, None
+            The maximum number of cached solutions, None to turn off the cache
+        count_hits : bool
+            Whether a cache hit (or a duplicated row skipped by ``deduplicate``) increases ``n_fe``,
+            default is False so ``n_fe`` counts the real evaluations only
+        path : str, None
+            None for an in-memory LRU cache (:class:`enoppy.utils.cache.LRUCache`), or the path of a SQLite file for a
+            persistent cache shared across runs and processes (:class:`enoppy.utils.cache.DiskCache`), where the entries
+            of this problem are grouped under ``fingerprint(penalty=False)``
+        """
+        self.count_hits = check_bool("count_hits", count_hits)
+        if maxsize is None:
+            self.cache = None
+        elif path is None:
+            self.cache = LRUCache(maxsize)
+        else:
+            self.cache = DiskCache(path, namespace=self.fingerprint(penalty=False), maxsize=maxsize)
+
+    def set_budget(self, max_fe=None, max_time=None, f_target=None, tol=1e-8, stop_on_target=True, on_stop="raise"):
+        """
+        Turn on the budget and target controller (or turn it off when no limit and no target is given).
+
+        The evaluations are stopped when ``max_fe`` or ``max_time`` is spent, or after a feasible solution within ``tol``
+        of ``f_target`` (default is ``f_global``) was found. A stopped evaluation raises
+        :class:`enoppy.utils.budget.BudgetExhaustedError` (:class:`enoppy.utils.budget.TargetReachedError` for the target),
+        which optimizers can catch, or returns infinite values with ``on_stop="inf"``. The number of evaluations at which
+        the target was first reached is recorded in ``budget.hit_fe``. See :class:`enoppy.utils.budget.EvaluationBudget`.
+
+        Parameters
+        ----------
+        max_fe : int, optional
+            The maximum value of ``n_fe``
+        max_time : float, optional
+            The maximum wall time in seconds, counted from now
+        f_target : float, list, np.ndarray, optional
+            The target objective values, default is ``f_global`` (no target if both are None)
+        tol : float
+            The tolerance on the objective values
+        stop_on_target : bool
+            Whether to stop the evaluations once the target is reached, otherwise it is only recorded
+        on_stop : str
+            "raise" or "inf"
+
+        Examples
+        --------
+        >>> problem.set_budget(max_fe=20000, f_target=263.8958, tol=1e-4)
+        >>> try:
+        >>>     run_optimizer(problem)
+        >>> except BudgetExhaustedError as error:
+        >>>     print(error.reason, problem.budget.hit_fe)
+        """
+        f_target = self.f_global if f_target is None else f_target
+        if max_fe is None and max_time is None and f_target is None:
+            self.budget = None
+        else:
+            self.budget = EvaluationBudget(max_fe, max_time, f_target, tol, stop_on_target, on_stop)
+
+    def set_bound_handling(self, method="clip", seed=None):
+        """
+        Repair the out-of-bounds variables of every solution before it is evaluated (or turn it off with ``method=None``).
+
+        By default, the solutions are evaluated as they are, so each optimizer handles the bounds itself. With a method,
+        ``amend_position`` and ``amend_batch`` (hence ``evaluate`` and ``evaluate_batch``) repair the variables outside
+        [lb, ub] in place on a copy of the input, before the rounding of the integer and discrete variables. The methods
+        are those of :mod:`enoppy.utils.boundary`:
+
+        - "clip": move the variable to the violated bound,
+        - "reflect": reflect the variable back into the bounds,
+        - "wrap": wrap the variable around to the opposite side (periodic bounds),
+        - "random": draw the variable again, uniformly between its bounds,
+        - "midpoint": move the variable halfway between the violated bound and the center of the bounds.
+
+        Parameters
+        ----------
+        method : str, None
+            One of "clip", "reflect", "wrap", "random", "midpoint", or None
+        seed : int, np.random.Generator, optional
+            The seed of the random generator of the "random" method
+
+        Examples
+        --------
+        >>> problem.set_bound_handling("reflect")
+        >>> problem.amend_batch(np.array([[0.5, 2.2], [-0.3, 1.]]), lb=[0., 0.], ub=[1., 2.])
+        array([[0.5, 1.8],
+               [0.3, 1. ]])
+        """
+        self.bound_handling = None if method is None else check_str("bound_handling", method, list(BOUND_HANDLERS.keys()))
+        self._bound_rng = np.random.default_rng(seed) if method == "random" else None
+
+    def get_stop_values(self, n_pop=None):
+        """
+        Return the infinite objectives, constraints and values of a stopped evaluation, for a solution or ``n_pop`` solutions.
+        """
+        shape = () if n_pop is None else (n_pop, )
+        list_objs, list_cons = np.full(shape + (self.n_objs, ), np.inf), np.full(shape + (self.n_cons, ), np.inf)
+        return list_objs, list_cons, list_objs.copy()
+
+    def set_thread_safe(self, thread_safe=True):
+        """
+        Turn on (or off) the thread-safe mode, so one instance can be evaluated by the threads of a ``ThreadPoolExecutor``.
+
+        The batched NumPy kernels release the GIL, so large populations evaluated with ``evaluate_full_batch`` by several
+        threads scale across cores without the overhead of processes, including on free-threaded builds of CPython.
+        In thread-safe mode:
+
+        - the counters (``n_fe``, ``n_saved``, ``n_hits``) are updated under a lock, so no evaluation is lost,
+        - the population-level penalty strategies, which update their state at each call, are called under the same lock.
+
+        In any mode, the inputs are never modified (``amend_position`` works on a copy of the solution), the caches have
+        their own locks, and the temporary buffers of the penalty are private to each thread (see ``get_scratch``).
+        Evaluating the problem from a single thread does not need this mode, which is off by default.
+
+        Parameters
+        ----------
+        thread_safe : bool
+            Whether to turn on the thread-safe mode
+        """
+        thread_safe = check_bool("thread_safe", thread_safe)
+        self._lock = threading.Lock() if thread_safe else None
+
+    def set_executor(self, executor="thread", max_workers=None, max_concurrency=None):
+        """
+        Set the executor of the asyncio interface (``evaluate_async``, ``evaluate_batch_async``, ...), or turn it off
+        and shut down its workers with ``executor=None``.
+
+        Parameters
+        ----------
+        executor : str, concurrent.futures.Executor, None
+            "thread" for a pool of threads that evaluate this instance (which is switched to thread-safe mode, if it was
+            not, until the executor is turned off or replaced), "process" for a pool of warm worker processes (see
+            :mod:`enoppy.parallel`), or an executor whose workers can call the methods of this instance
+        max_workers : int, optional
+            The number of workers of a new pool, default is the number of CPUs
+        max_concurrency : int, optional
+            The maximum number of evaluations of an event loop in the executor at once, default is twice the number
+            of workers. The next calls wait for a free slot (backpressure)
+        """
+        from enoppy.parallel import AsyncRunner
+        if self._async is not None:
+            self._async.close()
+            self._async = None
+        if self._async_thread_safe:
+            self.set_thread_safe(False)
+            self._async_thread_safe = False
+        if executor is not None:
+            self._async_thread_safe = not self.thread_safe and not (isinstance(executor, str) and executor == "process")
+            if self._async_thread_safe:
+                self.set_thread_safe()
+            try:
+                self._async = AsyncRunner(self, executor, max_workers, max_concurrency)
+            except Exception:
+                self.set_executor(None)
+                raise
+
+    def get_async_runner(self):
+        """
+        Return the runner of the asyncio interface, starting the default thread executor if none is set.
+        """
+        if self._async is None:
+            self.set_executor("thread")
+        return self._async
+
+    def set_workspace(self, workspace=True, copy=False):
+        """
+        Evaluate single solutions into preallocated buffers instead of new arrays.
+
+        Each thread evaluating the problem owns an objective, a constraint and a penalized-value buffer, created on its first
+        call. ``evaluate_full`` and ``evaluate`` write the results into them and return the buffers themselves, which the next
+        call of the same thread overwrites, unless ``copy`` is set. With a scalar kernel (``scalar = True``) and the default
+        penalty, nothing is allocated per call; the NumPy kernels of the other problems still allocate their temporaries.
+        A custom penalty function returns its own values. The population methods and cached evaluations are unchanged.
+
+        Parameters
+        ----------
+        workspace : bool
+            Whether to use the buffers
+        copy : bool
+            Whether to return copies of the buffers
+
+        Examples
+        --------
+        >>> problem.set_workspace()
+        >>> list_objs, list_cons, val = problem.evaluate_full(x)       # views of the buffers
+        >>> best = min(problem.evaluate(x)[0] for x in pop)             # read the value before the next call
+        """
+        self.workspace = check_bool("workspace", workspace)
+        self.copy_results = check_bool("copy", copy)
+
+    def get_workspace(self):
+        """
+        Return the per-thread buffers ``(objs, cons, val)`` of the workspace mode, see ``set_workspace``.
+        """
+        buffers = getattr(self._scratch, "workspace", None)
+        if buffers is None or len(buffers[0]) != self.n_objs or len(buffers[1]) != self.n_cons:
+            buffers = self._scratch.workspace = (np.empty(self.n_objs), np.empty(self.n_cons), np.empty(self.n_objs))
+        return buffers
+
+    def get_scalar_buffers(self):
+        """
+        Return the per-thread lists ``(objs, cons)`` filled by the scalar kernel, see ``evaluate_scalar``.
+        """
+        buffers = getattr(self._scratch, "scalar", None)
+        if buffers is None or len(buffers[0]) != self.n_objs or len(buffers[1]) != self.n_cons:
+            buffers = self._scratch.scalar = ([0.] * self.n_objs, [0.] * self.n_cons)
+        return buffers
+
+    def get_scratch(self, name, shape):
+        """
+        Return a float scratch array of the calling thread. The memory is reused by the next calls with the same ``name``
+        from the same thread, and only reallocated when a larger array is needed, so the content is only valid until then.
+
+        Parameters
+        ----------
+        name : str
+            The name of the buffer
+        shape : tuple
+            The shape of the array
+
+        Returns
+        -------
+        scratch : np.ndarray
+            An uninitialized array of the given shape
+        """
+        size = int(np.prod(shape))
+        buffer = getattr(self._scratch, name, None)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size)
+            setattr(self._scratch, name, buffer)
+        return buffer[:size].reshape(shape)
+
+    def count(self, n_fe=0, n_saved=0, n_hits=0):
+        """
+        Increase the evaluation counters, atomically in thread-safe mode.
+        """
+        if self._lock is None:
+            self.n_fe += n_fe
+            self.n_saved += n_saved
+            self.n_hits += n_hits
+        else:
+            with self._lock:
+                self.n_fe += n_fe
+                self.n_saved += n_saved
+                self.n_hits += n_hits
+
+    def clear_cache(self):
+        """
+        Drop all cached evaluations.
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
+    def get_counters(self):
+        """
+        Return the evaluation counters listed in ``counter_attrs``: ``n_fe``, ``n_saved``, ``n_hits`` and ``eval_time``.
+        """
+        return {key: getattr(self, key) for key in self.counter_attrs}
+
+    def add_counters(self, counters):
+        """
+        Add the counters of evaluations made elsewhere (e.g. by a copy of the problem in a worker process, see
+        :mod:`enoppy.parallel`) to the counters of this problem.
+
+        Parameters
+        ----------
+        counters : dict
+            The increments, with keys from ``counter_attrs``
+        """
+        with self._lock or NO_LOCK:
+            for key, value in counters.items():
+                setattr(self, key, getattr(self, key) + value)
+
+    def get_state(self):
+        """
+        Return the configuration of the problem: its instance attributes (bounds, constants, epsilon, w, ...) without the
+        penalty function and the runtime state listed in ``runtime_attrs``.
+        """
+        return {key: value for key, value in vars(self).items() if key not in self.runtime_attrs}
+
+    def get_penalty_spec(self):
+        """
+        Return the identity of the penalty function: "static" for the default one, the name and parameters of a
+        built-in strategy, or the import path of a custom function.
+        """
+        if getattr(self.f_penalty, "__func__", None) is Engineer.default_penalty:
+            return "static"
+        if isinstance(self.f_penalty, Penalty):
+            return {"name": self.f_penalty.name, "paras": encode(self.f_penalty.get_paras())}
+        return encode(self.f_penalty)
+
+    def fingerprint(self, penalty=True):
+        """
+        Return a deterministic hash of the configured problem: class, module, bounds, constants, epsilon, w and the identity
+        of the penalty function. It is stable across processes and runs, so it can be used as a cache key.
+
+        Parameters
+        ----------
+        penalty : bool
+            Whether the penalty function is part of the identity
+
+        Returns
+        -------
+        fingerprint : str
+            The SHA-256 hex digest
+        """
+        identity = {"class": get_object_path(type(self)), "state": self.get_state()}
+        if penalty:
+            identity["penalty"] = self.get_penalty_spec()
+        return get_fingerprint(identity)
+
+    def to_spec(self):
+        """
+        Return a compact, JSON-serializable description of the problem, from which ``Engineer.from_spec`` rebuilds it.
+
+        Only the attributes that differ from a newly created instance of the class are stored.
+
+        Returns
+        -------
+        spec : dict
+            The keys are "class" (the import path), "penalty" (see ``get_penalty_spec``) and "attrs"
+        """
+        try:
+            default = {key: encode(value) for key, value in type(self)().get_state().items()}
+        except TypeError:
+            default = {}
+        attrs = {}
+        for key, value in self.get_state().items():
+            value = encode(value)
+            if key not in default or default[key] != value:
+                attrs[key] = value
+        return {"class": get_object_path(type(self)), "penalty": self.get_penalty_spec(), "attrs": attrs}
+
+    @staticmethod
+    def from_spec(spec, trusted=True):
+        """
+        Rebuild a problem from the output of ``to_spec``.
+
+        Only the attributes of the configuration (the keys of ``get_state`` of a new instance of the class) are set.
+        A spec from another process or machine must be read with ``trusted=False``: the class must then be an ``Engineer``
+        subclass of an already imported module, the attributes plain numbers, booleans, lists or numeric arrays and the
+        penalty "static" or a built-in strategy, so nothing is imported and no function or object is rebuilt.
+
+        Parameters
+        ----------
+        spec : dict
+            The problem description
+        trusted : bool
+            Whether the spec comes from a trusted source, e.g. ``to_spec`` in the same program
+
+        Returns
+        -------
+        problem : Engineer
+            A new instance of the problem with the same configuration and penalty function
+        """
+        trusted = check_bool("trusted", trusted)
+        path = spec["class"]
+        if not trusted and (not isinstance(path, str) or path.partition(":")[0] not in sys.modules):
+            raise ValueError(f"The class '{path}' is not in an imported module.")
+        problem_class = import_object(path)
+        if not (isinstance(problem_class, type) and issubclass(problem_class, Engineer)):
+            raise ValueError(f"'{path}' is not a subclass of Engineer.")
+        problem = problem_class()
+        penalty = spec["penalty"]
+        if isinstance(penalty, dict) and "name" in penalty:
+            paras = decode(penalty["paras"]) if trusted else decode_data(penalty["paras"])
+            problem.check_penalty_func(get_penalty(penalty["name"], **paras))
+        elif trusted:
+            problem.check_penalty_func(decode(penalty))
+        elif penalty == "static":
+            problem.check_penalty_func(None)
+        else:
+            raise ValueError("An untrusted spec should use the static penalty or a built-in strategy.")
+        state = problem.get_state()
+        for key, value in spec["attrs"].items():
+            if key not in state or key in problem.runtime_attrs or callable(getattr(problem_class, key, None)):
+                raise ValueError(f"'{key}' is not an attribute of the configuration of {problem_class.__name__}.")
+            value = decode(value) if trusted else decode_data(value)
+            if not trusted and not is_plain_data(value):
+                raise ValueError(f"The value of '{key}' should be a number, a boolean, a list or a numeric array.")
+            setattr(problem, key, value)
+        return problem
+
+    def evaluate_full(self, x):
+        """
+        Evaluation of the benchmark function in a single pass, returning the objectives, the constraints and the penalized values.
+
+        Parameters
+        ----------
+        x : np.ndarray, list, tuple
+            The candidate vector for evaluating the benchmark problem. Must have ``len(x) == self.n_dims``.
+
+        Returns
+        -------
+        (list_objs, list_cons, val) : tuple
+            The objective values, the constraint values and the evaluated benchmark function
+        """
+        self.check_solution(x)
+        if self.schema is not None or self.bound_handling is not None:
+            x = self.amend_position(x, self.lb, self.ub)
+        if self.budget is not None and self.budget.stop(self):
+            return self.get_stop_values()
+        if self.workspace and self.cache is None:
+            return self.evaluate_full_workspace(x)
+        if self.cache is None:
+            self.count(n_fe=1)
+            list_objs, list_cons = self.get_objs_cons(x)
+        else:
+            key = np.asarray(x, dtype=float).tobytes()
+            result = self.cache.get(key)
+            if result is None:
+                self.count(n_fe=1)
+                list_objs, list_cons = self.get_objs_cons(x)
+                self.cache.put(key, (np.array(list_objs, dtype=float), np.array(list_cons, dtype=float)))
+            else:
+                self.count(n_fe=int(self.count_hits), n_hits=1)
+                list_objs, list_cons = np.array(result[0]), np.array(result[1])
+        if self.budget is not None:
+            self.budget.observe(self, x, list_objs, list_cons)
+        if self._lock is None:
+            return list_objs, list_cons, self.f_penalty(list_objs, list_cons)
+        with self.get_penalty_lock():
+            return list_objs, list_cons, self.f_penalty(list_objs, list_cons)
+
     def evaluate(self, x):
         """
         Evaluation of the benchmark function.
@@ -215,4 +1099,210 @@ class Engineer(ABC):
         val : float
               the evaluated benchmark function
         """
-        pass
+        return self.evaluate_full(x)[2]
+
+    def evaluate_scalar(self, x, out=None):
+        """
+        Fast evaluation of a single solution, e.g. as the objective function of ``scipy.optimize.minimize``.
+
+        Problems with ``scalar = True`` run their ``get_objs_cons_scalar`` kernel, written with ``math`` on Python floats,
+        which fills reusable per-thread buffers; the static penalty is then added in pure Python. The other problems, and the
+        problems with a cache, a budget, a bound handling or another penalty function, go through ``evaluate``. ``n_fe``
+        increases by one.
+
+        Parameters
+        ----------
+        x : np.ndarray, list, tuple
+            The candidate vector for evaluating the benchmark problem. Must have ``len(x) == self.n_dims``.
+        out : np.ndarray, optional
+            Preallocated output buffer of shape (n_objs,) for multi-objective problems
+
+        Returns
+        -------
+        val : float, np.ndarray
+            The evaluated benchmark function, a plain float for single-objective problems, otherwise a vector of shape (n_objs,)
+        """
+        if not self.scalar or self.cache is not None or self.budget is not None or self.bound_handling is not None or \
+                getattr(self.f_penalty, "__func__", None) is not Engineer.default_penalty:
+            val = np.ravel(self.evaluate(x))
+            if self.n_objs == 1 and val.size == 1:
+                return float(val[0])
+            if out is None:
+                return val
+            out[:] = val
+            return out
+        self.check_solution(x)
+        objs, cons = self.run_scalar_kernel(self.amend_scalar(x.tolist() if type(x) is np.ndarray else list(x)))
+        self.count(n_fe=1)
+        violation = self.get_scalar_violation(cons)
+        if self.n_objs == 1:
+            return float(objs[0] + violation)
+        if out is None:
+            out = np.empty(self.n_objs)
+        for idx, value in enumerate(objs):
+            out[idx] = value + violation
+        return out
+
+    def run_scalar_kernel(self, x):
+        """
+        Run the scalar kernel on a solution given as a list, falling back on the NumPy kernel when ``math`` raises.
+
+        Returns
+        -------
+        (objs, cons) : tuple
+            The per-thread lists filled by the kernel, see ``get_scalar_buffers``
+        """
+        objs, cons = self.get_scalar_buffers()
+        try:
+            self.get_objs_cons_scalar(x, objs, cons)
+        except (ArithmeticError, ValueError):
+            Engineer.get_objs_cons_scalar(self, x, objs, cons)
+        return objs, cons
+
+    def get_scalar_violation(self, cons):
+        """
+        Return the static penalty ``w * sum(max(0, g))`` of a list of constraint values, in pure Python.
+        """
+        violation = 0.
+        for value in cons:
+            if value > 0:
+                violation += value
+        return violation * self.w
+
+    def evaluate_full_workspace(self, x):
+        """
+        ``evaluate_full`` in workspace mode: the results are written into the buffers of ``get_workspace``.
+        """
+        objs, cons, val = self.get_workspace()
+        self.count(n_fe=1)
+        if self.scalar:
+            list_objs, list_cons = self.run_scalar_kernel(x.tolist() if type(x) is np.ndarray else list(x))
+            objs[:] = list_objs
+            cons[:] = list_cons
+        else:
+            list_objs, list_cons = self.get_objs_cons(x)
+            objs[:] = np.ravel(list_objs)
+            cons[:] = np.ravel(list_cons)
+        if self.budget is not None:
+            self.budget.observe(self, x, objs, cons)
+        if getattr(self.f_penalty, "__func__", None) is not Engineer.default_penalty:
+            with self.get_penalty_lock():
+                val = self.f_penalty(objs, cons)
+        elif self.scalar:
+            violation = self.get_scalar_violation(list_cons)
+            for idx, value in enumerate(list_objs):
+                val[idx] = value + violation
+        else:
+            self.f_penalty(objs, cons, out=val, work=self.get_scratch("work", cons.shape),
+                           violation=self.get_scratch("violation", ()))
+        if self.copy_results:
+            return objs.copy(), cons.copy(), np.array(val, dtype=float)
+        return objs, cons, val
+
+    def evaluate_full_batch(self, X):
+        """
+        Evaluation of the benchmark function for a population of solutions in a single pass. ``n_fe`` increases by ``n_pop``.
+
+        Parameters
+        ----------
+        X : np.ndarray, list
+            The population for evaluating the benchmark problem, a 2D-matrix of shape (n_pop, n_dims).
+
+        Returns
+        -------
+        (list_objs, list_cons, val) : tuple
+            The objective values of shape (n_pop, n_objs), the constraint values of shape (n_pop, n_cons)
+            and the evaluated benchmark function for each solution
+
+        Notes
+        -----
+        The out-of-bounds variables (see ``set_bound_handling``) and the integer and discrete variables declared by ``schema``
+        are amended first. Problems with ``deduplicate = True`` (those whose amended variables make duplicated rows likely)
+        evaluate each distinct row once and scatter the results back. The skipped rows are added to ``n_saved``, and to
+        ``n_fe`` only when ``count_hits`` is set.
+        """
+        X = self.check_population(X)
+        if self.schema is not None or self.bound_handling is not None:
+            X = self.amend_batch(X, self.lb, self.ub)
+        if self.budget is not None and self.budget.stop(self, X.shape[0]):
+            return self.get_stop_values(X.shape[0])
+        if self.deduplicate and X.shape[0] > 1:
+            X_unique, inverse = unique_rows(X)
+            n_saved = X.shape[0] - X_unique.shape[0]
+            self.count(n_fe=n_saved if self.count_hits else 0, n_saved=n_saved)
+            list_objs, list_cons = self._get_objs_cons_cached_batch(X_unique)
+            list_objs, list_cons = list_objs[inverse], list_cons[inverse]
+        else:
+            list_objs, list_cons = self._get_objs_cons_cached_batch(X)
+        if self.budget is not None:
+            self.budget.observe(self, X, list_objs, list_cons)
+        return list_objs, list_cons, self.get_penalty_batch(list_objs, list_cons)
+
+    def _get_objs_cons_cached_batch(self, X):
+        """
+        Compute the objective and constraint values of a population through the cache (if any) and count the evaluations:
+        the cached rows are looked up in bulk, the other rows are computed together and stored.
+        """
+        if self.cache is None:
+            self.count(n_fe=X.shape[0])
+            return self.get_objs_cons_batch(X)
+        keys = [row.tobytes() for row in X]
+        list_results = self.cache.get_many(keys)
+        idx_miss = [idx for idx, result in enumerate(list_results) if result is None]
+        n_hits = len(keys) - len(idx_miss)
+        self.count(n_fe=len(idx_miss) + (n_hits if self.count_hits else 0), n_hits=n_hits)
+        list_objs = np.empty((X.shape[0], self.n_objs))
+        list_cons = np.empty((X.shape[0], self.n_cons))
+        for idx, result in enumerate(list_results):
+            if result is not None:
+                list_objs[idx], list_cons[idx] = result
+        if len(idx_miss) > 0:
+            list_objs[idx_miss], list_cons[idx_miss] = self.get_objs_cons_batch(X[idx_miss])
+            self.cache.put_many([keys[idx] for idx in idx_miss],
+                                [(list_objs[idx].copy(), list_cons[idx].copy()) for idx in idx_miss])
+        return list_objs, list_cons
+
+    async def evaluate_full_async(self, x):
+        """
+        Awaitable ``evaluate_full``, run in the executor set by ``set_executor`` so the event loop is not blocked.
+        """
+        return await self.get_async_runner().evaluate_full(x)
+
+    async def evaluate_async(self, x):
+        """
+        Awaitable ``evaluate``, run in the executor set by ``set_executor`` so the event loop is not blocked.
+
+        Examples
+        --------
+        >>> problem.set_executor("process", max_workers=4, max_concurrency=16)
+        >>> list_fits = await asyncio.gather(*[problem.evaluate_async(x) for x in pop])
+        """
+        return (await self.evaluate_full_async(x))[2]
+
+    async def evaluate_full_batch_async(self, X):
+        """
+        Awaitable ``evaluate_full_batch``, run in the executor set by ``set_executor`` as a single task.
+        """
+        return await self.get_async_runner().evaluate_full_batch(X)
+
+    async def evaluate_batch_async(self, X):
+        """
+        Awaitable ``evaluate_batch``, run in the executor set by ``set_executor`` as a single task.
+        """
+        return (await self.evaluate_full_batch_async(X))[2]
+
+    def evaluate_batch(self, X):
+        """
+        Evaluation of the benchmark function for a population of solutions. ``n_fe`` increases by ``n_pop``.
+
+        Parameters
+        ----------
+        X : np.ndarray, list
+            The population for evaluating the benchmark problem, a 2D-matrix of shape (n_pop, n_dims).
+
+        Returns
+        -------
+        val : np.ndarray
+            The evaluated benchmark function for each solution, the first axis has length ``n_pop``
+        """
+        return self.evaluate_full_batch(X)[2]
@@ -6,8 +6,10 @@
 
 # Paper: IHAOAVOA: An improved hybrid aquila optimizer and African vultures optimization algorithm for global optimization problems
 
+import math
 import numpy as np
 from enoppy.engineer import Engineer
+from enoppy.utils.schema import VariableSchema
 
 
 class TensionCompressionSpringProblem(Engineer):
@@ -16,6 +18,8 @@ class TensionCompressionSpringProblem(Engineer):
     """
 
     name = "Tension/compression spring design problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -36,12 +40,12 @@ class TensionCompressionSpringProblem(Engineer):
         g4 = (x[0] + x[1]) / 1.5 - 1
         return np.array([g1, g2, g3, g4])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = (x[2] + 2) * x[1]*x[0]**2
+        cons[0] = 1 - (x[1]**3 * x[2]) / (71785 * x[0]**4)
+        cons[1] = (4*x[1]**2 - x[0]*x[1])/(12566 * (x[1]*x[0]**3 - x[0]**4)) + 1. / (5108 * x[0]**2)
+        cons[2] = 1 - 140.45*x[0] / (x[1]**2 * x[2])
+        cons[3] = (x[0] + x[1]) / 1.5 - 1
 
 
 class WeldedBeamProblem(Engineer):
@@ -50,6 +54,8 @@ class WeldedBeamProblem(Engineer):
     """
 
     name = "Welded beam design problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -90,12 +96,24 @@ class WeldedBeamProblem(Engineer):
         g7 = 1.10471 * x[0]**2 + 0.04811 * x[2]*x[3]*(14 + x[1]) - 5
         return np.array([g1, g2, g3, g4, g5, g6, g7])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        Pc = 4.013*self.E*math.sqrt(x[2]**2 * x[3]**6 / 36) / self.L**2 * (1 - x[2]*math.sqrt(self.E/(4*self.G)) / (2*self.L))
+        theta_z = 6 * self.P * self.L**3 / (self.E * x[2]**2 * x[3])
+        xichma_z = 6*self.P*self.L / (self.E * x[2]**2 * x[3])
+        jj = 2*math.sqrt(2)*x[0]*x[1]*(x[1]**2 / 4 + ((x[0] + x[2])/2)**2)
+        R = math.sqrt(x[1]**2/4 + (x[0]+x[2])**2 / 4)
+        M = self.P * (self.L + x[1]/2)
+        tau2 = M * R / jj
+        tau1 = self.P / (math.sqrt(2) * x[0]*x[1])
+        tau = math.sqrt(tau1**2 + 2*tau1*tau2*x[1]/(2*R) + tau2**2)
+        objs[0] = 1.10471 * x[0]**2 * x[1] + 0.04811 * x[2] * x[3] * (14 + x[1])
+        cons[0] = tau - self.tau_max
+        cons[1] = xichma_z - self.xichma_max
+        cons[2] = theta_z - self.theta_max
+        cons[3] = x[0] - x[3]
+        cons[4] = self.P - Pc
+        cons[5] = 0.125 - x[0]
+        cons[6] = 1.10471 * x[0]**2 + 0.04811 * x[2]*x[3]*(14 + x[1]) - 5
 
 
 class CantileverBeamProblem(Engineer):
@@ -104,6 +122,8 @@ class CantileverBeamProblem(Engineer):
     """
 
     name = "Cantilever beam design problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -114,19 +134,16 @@ class CantileverBeamProblem(Engineer):
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
-        f1 = 0.6224 * np.sum(x)
+        f1 = 0.6224 * np.sum(x, axis=0)
         return np.array([f1, ])
 
     def get_cons(self, x):
         g1 = 61 / x[0]**3 + 27/x[1]**3 + 19/x[2]**3 + 7/x[3]**3 + 1/x[4]**3
         return np.array([g1, ])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 0.6224 * sum(x)
+        cons[0] = 61 / x[0]**3 + 27/x[1]**3 + 19/x[2]**3 + 7/x[3]**3 + 1/x[4]**3
 
 
 class SpeedReducerProblem(Engineer):
@@ -137,6 +154,8 @@ class SpeedReducerProblem(Engineer):
     """
 
     name = "Speed reducer design problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -164,12 +183,20 @@ class SpeedReducerProblem(Engineer):
         g11 = (1.1*x[6] + 1.9) / x[4] -1
         return np.array([g1, g2, g3, g4, g5, g6, g7, g8, g9, g10, g11])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 0.7584*x[0]*x[1]**2*(3.3333*x[2]**2 + 14.9334*x[2]-43.0934) - 1.508*x[0]*(x[5]**2+x[6]**2) + 7.4777*(x[5]**3 + x[6]**3) + 0.7854*(x[3]*x[5]**2 + x[4]*x[6]**2)
+        cons[0] = 27/(x[0]*x[1]**2*x[2]) - 1
+        cons[1] = 397.5 / (x[0]*x[1]**2*x[2]**2) - 1
+        cons[2] = 1.93*x[3]**3/ (x[1] * x[2]*x[5]**4) - 1
+        cons[3] = 1.93 * x[4]**3 / (x[1] * x[2] * x[6]**4) - 1
+        cons[4] = math.sqrt((745*x[3]/(x[1]*x[2]))**2 + 16.9*10**6) / (110*x[5]**3) - 1
+        t6 = (745*x[4]/(x[1]*x[2]))**2 - 157.5*10**6
+        cons[5] = math.sqrt(t6) / (85 * x[6]**3) - 1 if t6 >= 0 else math.nan
+        cons[6] = x[1]*x[2]/40 - 1
+        cons[7] = 5*x[1]/x[0] - 1
+        cons[8] = x[0]/(12 * x[1]) - 1
+        cons[9] = (1.5*x[5] + 1.9) / x[3] - 1
+        cons[10] = (1.1*x[6] + 1.9) / x[4] -1
 
 
 class RollingElementBearingProblem(Engineer):
@@ -178,6 +205,9 @@ class RollingElementBearingProblem(Engineer):
     """
 
     name = "Rolling element bearing design problem"
+    vectorized = True
+    deduplicate = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -189,20 +219,14 @@ class RollingElementBearingProblem(Engineer):
         self.Bw = 30
         self.ri = self.ro = 11.033
         self._bounds = [(125., 150.), (10.5, 31.5), (4, 50), (0.515, 0.6), (0.515, 0.6), (0.4, 0.5), (0.6, 0.7), (0.3, 0.4), (0.02, 0.1), (0.6, 0.85)]
+        self.schema = VariableSchema(self._n_dims, integers=[2])
         self.check_penalty_func(f_penalty)
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[2] = int(x[2])
-        return x
-
     def get_objs(self, x):
         gama = x[1] / x[0]
         t1 = 37.91*(1+(1.04*((1-gama)/(1+gama))**1.72*(x[3]/x[4] * (2*x[4] - 1)/(2*x[3] - 1))**0.41)**(10./3))**(-0.3)
         fc = t1 * (gama**0.3 *(1 - gama)**1.39 / ((1+gama)**(1./3))) * (2*x[3]/(2*x[3] - 1))**0.41
-        if x[1] <= 25.4:
-            f1 = fc * x[2]**(2./3) * x[1]**1.8
-        else:
-            f1 = 3.647 * fc * x[2]**(2./3) * x[1]**1.4
+        f1 = np.where(x[1] <= 25.4, fc * x[2]**(2./3) * x[1]**1.8, 3.647 * fc * x[2]**(2./3) * x[1]**1.4)
         return np.array([f1, ])
 
     def get_cons(self, x):
@@ -222,12 +246,27 @@ class RollingElementBearingProblem(Engineer):
         g9 = 0.515 - x[4]
         return np.array([g1, g2, g3, g4, g5, g6, g7, g8, g9])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        gama = x[1] / x[0]
+        t1 = 37.91*math.pow(1+math.pow(1.04*math.pow((1-gama)/(1+gama), 1.72)*math.pow(x[3]/x[4] * (2*x[4] - 1)/(2*x[3] - 1), 0.41), 10./3), -0.3)
+        fc = t1 * (math.pow(gama, 0.3) * math.pow(1 - gama, 1.39) / math.pow(1+gama, 1./3)) * math.pow(2*x[3]/(2*x[3] - 1), 0.41)
+        if x[1] <= 25.4:
+            objs[0] = fc * math.pow(x[2], 2./3) * math.pow(x[1], 1.8)
+        else:
+            objs[0] = 3.647 * fc * math.pow(x[2], 2./3) * math.pow(x[1], 1.4)
+        T = self.D - self.d - 2*x[1]
+        xx = ((self.D - self.d) / 2 - 3 * (T/4))**2 + (self.D/2 - T/4 - x[1])**2 - (self.d/2 + T/4)**2
+        yy = 2*((self.D - self.d)/2 - 3*T/4)*(self.D/2 - T/4 - x[1])
+        theta0 = 2*math.pi - 1. / math.cos(xx / yy)
+        cons[0] = theta0 / (2. / math.sin(x[1] / x[0])) - x[2] + 1
+        cons[1] = x[5]*(self.D - self.d) - 2*x[1]
+        cons[2] = 2*x[1] - x[6]*(self.D - self.d)
+        cons[3] = x[-1]*self.Bw - x[1]
+        cons[4] = 0.5*(self.D + self.d) - x[0]
+        cons[5] = x[0] - (0.5 + x[-2])*(self.D + self.d)
+        cons[6] = x[-3]*x[1] - 0.5*(self.D - x[0] - x[1])
+        cons[7] = 0.515 - x[3]
+        cons[8] = 0.515 - x[4]
 
 
 TCSP = TensionCompressionSpringProblem
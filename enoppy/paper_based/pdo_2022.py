@@ -6,9 +6,11 @@
 
 # Paper: Prairie Dog Optimization Algorithm (PDO-2022)
 
+import math
 import numpy as np
 from enoppy.engineer import Engineer
-from enoppy.utils.encoder import LabelEncoder
+from enoppy.utils.encoder import DiscreteCodec
+from enoppy.utils.schema import VariableSchema
 
 
 class WeldedBeamProblem(Engineer):
@@ -23,12 +25,14 @@ class WeldedBeamProblem(Engineer):
     """
 
     name = "Welded Beam Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
         self._n_dims = 4
         self._n_objs = 1
-        self._n_cons = 11
+        self._n_cons = 7
         self._bounds = [(0.1, 2.), (0.1, 10.), (0.1, 10.), (0.1, 2.)]
         self.xichma_max = 30000
         self.P = 6000
@@ -62,12 +66,22 @@ class WeldedBeamProblem(Engineer):
         g7 = self.P - Pc_X
         return np.array([g1, g2, g3, g4, g5, g6, g7])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        Pc_X = 4.013 * self.E * math.sqrt(x[2] ** 2 * x[3] ** 6 / 36) / self.L ** 2 * (1. - x[2] * math.sqrt(self.E / (4 * self.G)) / (2 * self.L))
+        J = 2 * (math.sqrt(2) * x[0] * x[1] * (x[1] ** 2 / 4 + (x[0] + x[2] / 2) ** 2))
+        M = self.P * (self.L + x[1] / 2)
+        R = math.sqrt(x[1] ** 2 / 4 + (x[0] + x[2]) ** 2 / 4)
+        t2 = M * R / J
+        t1 = self.P / (math.sqrt(2) * x[0] * x[1])
+        t_X = math.sqrt(t1 ** 2 + 2 * t1 * t2 * x[1] / (2 * R) + t2 ** 2)
+        objs[0] = x[0] ** 2 * x[1] * 1.10471 + 0.04811 * x[2] * x[3] * (14.0 + x[1])
+        cons[0] = t_X - self.theta_max
+        cons[1] = 6 * self.P * self.L / (x[3] * x[2] ** 2) - self.xichma_max
+        cons[2] = x[0] - x[3]
+        cons[3] = 0.10471 * x[0] ** 2 + 0.04811 * x[2] * x[3] * (14.0 + x[1]) - 5.0
+        cons[4] = 0.125 - x[0]
+        cons[5] = 4 * self.P * self.L ** 3 / (self.E * x[2] ** 3 * x[3]) - self.delta_max
+        cons[6] = self.P - Pc_X
 
 
 class PressureVesselProblem(Engineer):
@@ -81,6 +95,8 @@ class PressureVesselProblem(Engineer):
     """
 
     name = "Pressure Vessel Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -101,12 +117,12 @@ class PressureVesselProblem(Engineer):
         g4 = -240 + x[3]
         return np.array([g1, g2, g3, g4])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 0.6224 * x[2] * x[0] * x[3] + 1.7781 * x[2] ** 2 * x[1] + 3.1611 * x[0] ** 2 * x[3] + 19.8621 * x[2] * x[0] ** 2
+        cons[0] = -x[0] + 0.0193 * x[2]
+        cons[1] = -x[2] + 0.00954 * x[2]
+        cons[2] = -math.pi * x[1] ** 2 * x[3] - 4. / 3 * math.pi * x[2] ** 3 + 750 * 1728
+        cons[3] = -240 + x[3]
 
 
 class CompressionSpringProblem(Engineer):
@@ -120,6 +136,8 @@ class CompressionSpringProblem(Engineer):
     """
 
     name = "Compression Spring Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -140,12 +158,12 @@ class CompressionSpringProblem(Engineer):
         g4 = (x[0] + x[1]) / 1.5 - 1
         return np.array([g1, g2, g3, g4])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = (x[2] + 2)*x[1]*x[0]**2
+        cons[0] = 1 - x[1] ** 3 * x[2] / (71785 * x[0] ** 4)
+        cons[1] = (4 * x[1] ** 2 - x[0] * x[1]) / (12566 * (x[2] * x[0] ** 3 - x[0] ** 4)) + 1. / (5108 * x[0] ** 2) - 1
+        cons[2] = 1 - 140.45 * x[0] / (x[1] ** 2 * x[2])
+        cons[3] = (x[0] + x[1]) / 1.5 - 1
 
 
 class SpeedReducerProblem(Engineer):
@@ -155,13 +173,17 @@ class SpeedReducerProblem(Engineer):
     """
 
     name = "Speed Reducer Design Problem"
+    vectorized = True
+    deduplicate = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
         self._n_dims = 7
         self._n_objs = 1
         self._n_cons = 11
-        self._bounds = [(2.6, 3.6), (0.7, 0.8), (17, 28.99), (7.3, 8.3), (7.3, 8,3), (2.9, 3.9), (5.0, 5.5)]
+        self._bounds = [(2.6, 3.6), (0.7, 0.8), (17, 28.99), (7.3, 8.3), (7.3, 8.3), (2.9, 3.9), (5.0, 5.5)]
+        self.schema = VariableSchema(self._n_dims, integers=[2])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
@@ -169,10 +191,6 @@ class SpeedReducerProblem(Engineer):
             7.4777*(x[5]**3 + x[6]**3) + 0.7854*(x[3]*x[5]**2 + x[4]*x[6]**2)
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[2] = int(x[2])
-        return x
-
     def get_cons(self, x):
         g1 = 27. / (x[0] * x[1] ** 2 * x[2]) - 1
         g2 = 397.5 / (x[0] * x[1] ** 2 * x[2] ** 2) - 1
@@ -187,12 +205,20 @@ class SpeedReducerProblem(Engineer):
         g11 = (1.1 * x[6] + 1.9) / x[4] - 1
         return np.array([g1, g2, g3, g4, g5, g6, g7, g8, g9, g10, g11])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 0.7854*x[0]*x[1]**2*(3.3333*x[2]**2 + 14.9334*x[2] - 43.0934) - 1.508*x[0]*(x[5]**2 + x[6]**2) +\
+            7.4777*(x[5]**3 + x[6]**3) + 0.7854*(x[3]*x[5]**2 + x[4]*x[6]**2)
+        cons[0] = 27. / (x[0] * x[1] ** 2 * x[2]) - 1
+        cons[1] = 397.5 / (x[0] * x[1] ** 2 * x[2] ** 2) - 1
+        cons[2] = 1.93 * x[3] ** 2 / (x[1] * x[5] ** 4 * x[2]) - 1
+        cons[3] = 1.93 * x[4] ** 2 / (x[1] * x[6] ** 4 * x[2]) - 1
+        cons[4] = math.sqrt((745 * x[3] / (x[1] * x[2])) ** 2 + 16 * 10 ** 6) / (110 * x[5] ** 3) - 1
+        cons[5] = math.sqrt((745 * x[4] / (x[1] * x[2])) ** 2 + 157.5 * 10 ** 6) / (85 * x[6] ** 3) - 1
+        cons[6] = x[1] * x[2] / 40 - 1
+        cons[7] = 5 * x[1] / x[0] - 1
+        cons[8] = x[0] / (12. * x[1]) - 1
+        cons[9] = (1.5 * x[5] + 1.9) / x[3] - 1
+        cons[10] = (1.1 * x[6] + 1.9) / x[4] - 1
 
 
 class ThreeBarTrussProblem(Engineer):
@@ -203,6 +229,8 @@ class ThreeBarTrussProblem(Engineer):
     """
 
     name = "Three Bar Truss Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -225,12 +253,11 @@ class ThreeBarTrussProblem(Engineer):
         g3 = self.P / (np.sqrt(2) * x[1] + x[0]) - self.xichma
         return np.array([g1, g2, g3])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = (2*math.sqrt(2)*x[0] + x[1]) * self.L
+        cons[0] = (math.sqrt(2) * x[0] + x[1]) / (math.sqrt(2) * x[0] ** 2 + 2 * x[0] * x[1]) * self.P - self.xichma
+        cons[1] = x[1] * self.P / (math.sqrt(x[0] ** 2 + 2 * x[0] * x[1])) - self.xichma
+        cons[2] = self.P / (math.sqrt(2) * x[1] + x[0]) - self.xichma
 
 
 class GearTrainProblem(Engineer):
@@ -240,6 +267,9 @@ class GearTrainProblem(Engineer):
     """
 
     name = "Gear Train Design Problem"
+    vectorized = True
+    deduplicate = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -247,24 +277,18 @@ class GearTrainProblem(Engineer):
         self._n_objs = 1
         self._n_cons = 0
         self._bounds = [(12, 60.99), (12, 60.99), (12, 60.99), (12, 60.99)]
+        self.schema = VariableSchema(self._n_dims, integers=[0, 1, 2, 3])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
         f1 = (1. / 6.931 - x[2]*x[1] / (x[0] * x[3]))**2
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        return np.asarray(x, int)
-
     def get_cons(self, x):
-        return np.array([])
+        return np.zeros((0,) + np.shape(x[0]))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = (1. / 6.931 - x[2]*x[1] / (x[0] * x[3]))**2
 
 
 class CantileverBeamProblem(Engineer):
@@ -274,6 +298,8 @@ class CantileverBeamProblem(Engineer):
     """
 
     name = "Cantilever Beam Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -284,19 +310,16 @@ class CantileverBeamProblem(Engineer):
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
-        f1 = 0.0624 * np.sum(x)
+        f1 = 0.0624 * np.sum(x, axis=0)
         return np.array([f1])
 
     def get_cons(self, x):
         g1 = 61./x[0]**3 + 37./x[1]**3 + 19./x[2]**3 + 7./x[3]**3 + 1./x[4]**3 - 1
         return np.array([g1, ])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 0.0624 * sum(x)
+        cons[0] = 61./x[0]**3 + 37./x[1]**3 + 19./x[2]**3 + 7./x[3]**3 + 1./x[4]**3 - 1
 
 
 class IBeamProblem(Engineer):
@@ -306,6 +329,8 @@ class IBeamProblem(Engineer):
     """
 
     name = "I Beam Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -325,12 +350,11 @@ class IBeamProblem(Engineer):
              15 * x[0] * 10 ** 3 / ((x[1] - 2 * x[3]) * x[2] ** 2 + 2 * x[2] * x[0] ** 3) - 56
         return np.array([g1, g2])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 500. / ( (x[2]*(x[1]-2*x[3])**3)/12 + (x[0]*x[3]**3/6) + 2*x[0]*x[3]*(x[1] - x[3])**2 )
+        cons[0] = 2 * x[0] * x[2] + x[2] * (x[1] - 2 * x[3]) - 300
+        cons[1] = (18 * x[1] * 10 ** 4) / (x[2] * (x[1] - 2 * x[3]) ** 3 + 2 * x[0] * x[2] * (4 * x[3] ** 2 + 3 * x[1] * (x[1] - 2 * x[3]))) + \
+            15 * x[0] * 10 ** 3 / ((x[1] - 2 * x[3]) * x[2] ** 2 + 2 * x[2] * x[0] ** 3) - 56
 
 
 class TubularColumnProblem(Engineer):
@@ -341,6 +365,8 @@ class TubularColumnProblem(Engineer):
     """
 
     name = "Tubular Column Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -368,12 +394,14 @@ class TubularColumnProblem(Engineer):
         g6 = x[1] / 8 - 1
         return np.array([g1, g2, g3, g4, g5, g6])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 9.8*x[0]*x[1] + 2*x[0]
+        cons[0] = self.P / (math.pi * x[0] * x[1] * self.xichma_y) - 1
+        cons[1] = (8 * self.P * self.L ** 2) / (math.pi ** 3 * self.E * x[0] * x[1] * (x[0] ** 2 + x[1] ** 2)) - 1
+        cons[2] = 2. / x[0] - 1
+        cons[3] = x[0] / 14 - 1
+        cons[4] = 0.2 / x[1] - 1
+        cons[5] = x[1] / 8 - 1
 
 
 class PistonLeverProblem(Engineer):
@@ -382,6 +410,8 @@ class PistonLeverProblem(Engineer):
     """
 
     name = "Piston Lever Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -396,29 +426,34 @@ class PistonLeverProblem(Engineer):
         self.theta = np.pi / 4
         self.check_penalty_func(f_penalty)
 
-    def get_objs(self, x):
+    def get_objs_cons(self, x):
         L1 = np.sqrt((x[3] - x[1]) ** 2 + x[0] ** 2)
         L2 = np.sqrt((x[3] * np.sin(self.theta) + x[0]) ** 2 + (x[1] - x[3] * np.cos(self.theta)) ** 2)
         f1 = 0.25*np.pi*x[2]**2 * (L2 - L1)
-        return np.array([f1])
-
-    def get_cons(self, x):
-        L1 = np.sqrt((x[3] - x[1]) ** 2 + x[0] ** 2)
-        L2 = np.sqrt((x[3] * np.sin(self.theta) + x[0]) ** 2 + (x[1] - x[3] * np.cos(self.theta)) ** 2)
-        R = np.abs(-x[3] * (x[3] * np.sin(self.theta) + x[0]) + x[0] * (x[1] - x[3] * np.cos(self.theta))) / np.sqrt((x[3] - x[1]) ** 2 + x[0] ** 2)
+        R = np.abs(-x[3] * (x[3] * np.sin(self.theta) + x[0]) + x[0] * (x[1] - x[3] * np.cos(self.theta))) / L1
         F = np.pi * self.P * x[2] ** 2 / 4
         g1 = self.Q * self.L * np.cos(self.theta) - R * F
         g2 = self.Q * (self.L - x[3]) - self.M_max
         g3 = 1.2 * (L2 - L1) - L1
         g4 = x[2] / 2 - x[1]
-        return np.array([g1, g2, g3, g4])
+        return np.array([f1]), np.array([g1, g2, g3, g4])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs(self, x):
+        return self.get_objs_cons(x)[0]
+
+    def get_cons(self, x):
+        return self.get_objs_cons(x)[1]
+
+    def get_objs_cons_scalar(self, x, objs, cons):
+        L1 = math.sqrt((x[3] - x[1]) ** 2 + x[0] ** 2)
+        L2 = math.sqrt((x[3] * math.sin(self.theta) + x[0]) ** 2 + (x[1] - x[3] * math.cos(self.theta)) ** 2)
+        R = abs(-x[3] * (x[3] * math.sin(self.theta) + x[0]) + x[0] * (x[1] - x[3] * math.cos(self.theta))) / L1
+        F = math.pi * self.P * x[2] ** 2 / 4
+        objs[0] = 0.25*math.pi*x[2]**2 * (L2 - L1)
+        cons[0] = self.Q * self.L * math.cos(self.theta) - R * F
+        cons[1] = self.Q * (self.L - x[3]) - self.M_max
+        cons[2] = 1.2 * (L2 - L1) - L1
+        cons[3] = x[2] / 2 - x[1]
 
 
 class CorrugatedBulkheadProblem(Engineer):
@@ -427,6 +462,8 @@ class CorrugatedBulkheadProblem(Engineer):
     """
 
     name = "Corrugated Bulkhead Design Problem"
+    vectorized = True
+    scalar = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -436,25 +473,32 @@ class CorrugatedBulkheadProblem(Engineer):
         self._bounds = [(0., 100), (0., 100.), (0., 100.), (0., 5.)]
         self.check_penalty_func(f_penalty)
 
-    def get_objs(self, x):
-        f1 = 5.885*x[3]*(x[0] + x[2]) / (x[0] + np.sqrt(np.abs(x[2]**2 - x[1]**2)))
-        return np.array([f1])
-
-    def get_cons(self, x):
-        g1 = -x[3] * x[2] * (0.4 * x[0] + x[2] / 6) + 8.94 * (x[0] + np.sqrt(np.abs(x[2] ** 2 - x[1] ** 2)))
-        g2 = -x[3] * x[1] ** 2 * (0.2 * x[0] + x[2] / 12) + 2.2 * (8.94 * (x[0] + np.sqrt(np.abs(x[2] ** 2 - x[1] ** 2)))) ** (4. / 3)
+    def get_objs_cons(self, x):
+        a = x[0] + np.sqrt(np.abs(x[2]**2 - x[1]**2))
+        f1 = 5.885*x[3]*(x[0] + x[2]) / a
+        g1 = -x[3] * x[2] * (0.4 * x[0] + x[2] / 6) + 8.94 * a
+        g2 = -x[3] * x[1] ** 2 * (0.2 * x[0] + x[2] / 12) + 2.2 * (8.94 * a) ** (4. / 3)
         g3 = -x[3] + 0.0156 * x[0] + 0.15
         g4 = -x[3] + 0.0156 * x[2] + 0.15
         g5 = -x[3] + 1.05
         g6 = -x[2] + x[1]
-        return np.array([g1, g2, g3, g4, g5, g6])
+        return np.array([f1]), np.array([g1, g2, g3, g4, g5, g6])
+
+    def get_objs(self, x):
+        return self.get_objs_cons(x)[0]
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_cons(self, x):
+        return self.get_objs_cons(x)[1]
+
+    def get_objs_cons_scalar(self, x, objs, cons):
+        a = x[0] + math.sqrt(abs(x[2]**2 - x[1]**2))
+        objs[0] = 5.885*x[3]*(x[0] + x[2]) / a
+        cons[0] = -x[3] * x[2] * (0.4 * x[0] + x[2] / 6) + 8.94 * a
+        cons[1] = -x[3] * x[1] ** 2 * (0.2 * x[0] + x[2] / 12) + 2.2 * math.pow(8.94 * a, 4. / 3)
+        cons[2] = -x[3] + 0.0156 * x[0] + 0.15
+        cons[3] = -x[3] + 0.0156 * x[2] + 0.15
+        cons[4] = -x[3] + 1.05
+        cons[5] = -x[2] + x[1]
 
 
 class ReinforcedConcreateBeamProblem(Engineer):
@@ -463,6 +507,9 @@ class ReinforcedConcreateBeamProblem(Engineer):
     """
 
     name = "Reinforced Concreate Beam Design Problem"
+    vectorized = True
+    scalar = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -470,16 +517,11 @@ class ReinforcedConcreateBeamProblem(Engineer):
         self._n_objs = 1
         self._n_cons = 2
         self.x0 = [6.0, 6.16, 6.32, 6.6, 7.0, 7.11, 7.2, 7.8, 7.9, 8.0, 8.4]
-        self.le = LabelEncoder()
-        self.le.fit(self.x0)
+        self.codec = DiscreteCodec(self.x0)
         self._bounds = [(0., 10.99), (28., 40.99), (5., 10.)]
+        self.schema = VariableSchema(self._n_dims, integers=[1], tables={0: self.codec})
         self.check_penalty_func(f_penalty)
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[0] = self.le.inverse_transform([int(x[0])])
-        x[1] = int(x[1])
-        return x
-
     def get_objs(self, x):
         f1 = 2.9*x[0] + 0.6*x[1]*x[2]
         return np.array([f1])
@@ -489,14 +531,10 @@ class ReinforcedConcreateBeamProblem(Engineer):
         g2 = 180 + 7.375 * x[0] ** 2 / x[2] - x[0] * x[1]
         return np.array([g1, g2])
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[0]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
+    def get_objs_cons_scalar(self, x, objs, cons):
+        objs[0] = 2.9*x[0] + 0.6*x[1]*x[2]
+        cons[0] = x[1] / x[2] - 4
+        cons[1] = 180 + 7.375 * x[0] ** 2 / x[2] - x[0] * x[1]
 
 
 WBP = WeldedBeamProblem
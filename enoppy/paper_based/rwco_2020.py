@@ -9,6 +9,8 @@
 import numpy as np
 from scipy.optimize import fminbound
 from enoppy.engineer import Engineer
+from enoppy.utils.encoder import DiscreteCodec
+from enoppy.utils.schema import VariableSchema
 
 
 class HeatExchangerNetworkDesignCase1Problem(Engineer):
@@ -19,6 +21,7 @@ class HeatExchangerNetworkDesignCase1Problem(Engineer):
     """
 
     name = "Heat Exchanger Network Design Case 1 (Industrial Chemical Processes)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -36,29 +39,21 @@ class HeatExchangerNetworkDesignCase1Problem(Engineer):
         return np.array([f1])
 
     def get_eq_cons(self, x):
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = 200 * x[0] * x[3] - x[2]
-        hx[1] = 200 * x[1] * x[5] - x[4]
-        hx[2] = x[2] - 10000 * (x[6] - 100)
-        hx[3] = x[4] - 10000 * (300 - x[6])
-        hx[4] = x[2] - 10000 * (600 - x[7])
-        hx[5] = x[4] - 10000 * (900 - x[8])
-        hx[6] = x[3] * np.log(x[7] - 100 + 1e-8) - x[3] * np.log((600 - x[6]) + 1e-8) - x[7] + x[6] + 500
-        hx[7] = x[5] * np.log(x[8] - x[6] + 1e-8) - x[5] * np.log(600) - x[8] + x[6] + 600
-        return hx
+        h1 = 200 * x[0] * x[3] - x[2]
+        h2 = 200 * x[1] * x[5] - x[4]
+        h3 = x[2] - 10000 * (x[6] - 100)
+        h4 = x[4] - 10000 * (300 - x[6])
+        h5 = x[2] - 10000 * (600 - x[7])
+        h6 = x[4] - 10000 * (900 - x[8])
+        h7 = x[3] * np.log(x[7] - 100 + 1e-8) - x[3] * np.log((600 - x[6]) + 1e-8) - x[7] + x[6] + 500
+        h8 = x[5] * np.log(x[8] - x[6] + 1e-8) - x[5] * np.log(600) - x[8] + x[6] + 600
+        return np.array([h1, h2, h3, h4, h5, h6, h7, h8])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        gx = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        gx = np.abs(hx_list) - self.epsilon
         return gx
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class HeatExchangerNetworkDesignCase2Problem(Engineer):
     """
@@ -68,6 +63,7 @@ class HeatExchangerNetworkDesignCase2Problem(Engineer):
     """
 
     name = "Heat Exchanger Network Design Case 2 (Industrial Chemical Processes)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -85,30 +81,22 @@ class HeatExchangerNetworkDesignCase2Problem(Engineer):
         return np.array([f1])
 
     def get_eq_cons(self, x):
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = x[0] - 1e4 * (x[6] - 100)
-        hx[1] = x[1] - 1e4 * (x[7] - x[6])
-        hx[2] = x[2] - 1e4 * (500 - x[7])
-        hx[3] = x[0] - 1e4 * (300 - x[8])
-        hx[4] = x[1] - 1e4 * (400 - x[9])
-        hx[5] = x[2] - 1e4 * (600 - x[10])
-        hx[6] = x[3] * np.log(np.abs(x[8] - 100) + 1e-8) - x[3] * np.log(300 - x[6] + 1e-8) - x[8] - x[6] + 400
-        hx[7] = x[4] * np.log(np.abs(x[9] - x[6]) + 1e-8) - x[4] * np.log(np.abs(400 - x[7]) + 1e-8) - x[9] + x[6] - x[7] + 400
-        hx[8] = x[5] * np.log(np.abs(x[10] - x[7]) + 1e-8) - x[5] * np.log(100) - x[10] + x[7] + 100
-        return hx
+        h1 = x[0] - 1e4 * (x[6] - 100)
+        h2 = x[1] - 1e4 * (x[7] - x[6])
+        h3 = x[2] - 1e4 * (500 - x[7])
+        h4 = x[0] - 1e4 * (300 - x[8])
+        h5 = x[1] - 1e4 * (400 - x[9])
+        h6 = x[2] - 1e4 * (600 - x[10])
+        h7 = x[3] * np.log(np.abs(x[8] - 100) + 1e-8) - x[3] * np.log(300 - x[6] + 1e-8) - x[8] - x[6] + 400
+        h8 = x[4] * np.log(np.abs(x[9] - x[6]) + 1e-8) - x[4] * np.log(np.abs(400 - x[7]) + 1e-8) - x[9] + x[6] - x[7] + 400
+        h9 = x[5] * np.log(np.abs(x[10] - x[7]) + 1e-8) - x[5] * np.log(100) - x[10] + x[7] + 100
+        return np.array([h1, h2, h3, h4, h5, h6, h7, h8, h9])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        gx = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        gx = np.abs(hx_list) - self.epsilon
         return gx
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class HaverlyPoolingProblem(Engineer):
     """
@@ -118,6 +106,7 @@ class HaverlyPoolingProblem(Engineer):
     """
 
     name = "Haverly's Pooling Problem (Industrial Chemical Processes)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -138,32 +127,23 @@ class HaverlyPoolingProblem(Engineer):
         return np.array([f1])
 
     def get_eq_cons(self, x):
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = x[6] + x[7] - x[2] - x[3]
-        hx[1] = x[0] - x[6] - x[4]
-        hx[2] = x[1] - x[7] - x[5]
-        hx[3] = x[8] * x[6] + x[8] * x[7] - 3 * x[2] - x[3]
-        return hx
+        h1 = x[6] + x[7] - x[2] - x[3]
+        h2 = x[0] - x[6] - x[4]
+        h3 = x[1] - x[7] - x[5]
+        h4 = x[8] * x[6] + x[8] * x[7] - 3 * x[2] - x[3]
+        return np.array([h1, h2, h3, h4])
 
     def get_ineq_cons(self, x):
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = x[8] * x[6] + 2 * x[4] - 2.5 * x[0]
-        gx[1] = x[8] * x[7] + 2 * x[5] - 1.5 * x[1]
-        return gx
+        g1 = x[8] * x[6] + 2 * x[4] - 2.5 * x[0]
+        g2 = x[8] * x[7] + 2 * x[5] - 1.5 * x[1]
+        return np.array([g1, g2])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         gx_values = self.get_ineq_cons(x)
         return np.concatenate((hx_values, gx_values))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class BlendingPoolingSeparationProblem(Engineer):
     """
@@ -173,6 +153,7 @@ class BlendingPoolingSeparationProblem(Engineer):
     """
 
     name = "Blending-Pooling-Separation problem (Industrial Chemical Processes)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -194,53 +175,46 @@ class BlendingPoolingSeparationProblem(Engineer):
         return np.array([f1])
 
     def get_eq_cons(self, x):
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = x[0] + x[1] + x[2] + x[3] - 300
-        hx[1] = x[5] - x[6] - x[7]
-        hx[2] = x[8] - x[9] - x[10] - x[11]
-        hx[3] = x[13] - x[14] - x[15] - x[16]
-        hx[4] = x[17] - x[18] - x[19]
-        hx[5] = x[4] * x[20] - x[5] * x[21] - x[8] * x[22]
-        hx[6] = x[4] * x[23] - x[5] * x[24] - x[8] * x[25]
-        hx[7] = x[4] * x[26] - x[5] * x[27] - x[8] * x[28]
-        hx[8] = x[12] * x[29] - x[13] * x[30] - x[17] * x[31]
-        hx[9] = x[12] * x[32] - x[13] * x[33] - x[17] * x[34]
-        hx[10] = x[12] * x[35] - x[13] * x[36] - x[17] * x[36]
-        hx[11] = 1 / 3 * x[0] + x[14] * x[30] - x[4] * x[20]
-        hx[12] = 1 / 3 * x[0] + x[14] * x[33] - x[4] * x[23]
-        hx[13] = 1 / 3 * x[0] + x[14] * x[36] - x[4] * x[26]
-        hx[14] = 1 / 3 * x[1] + x[9] * x[22] - x[12] * x[29]
-        hx[15] = 1 / 3 * x[1] + x[9] * x[25] - x[12] * x[32]
-        hx[16] = 1 / 3 * x[1] + x[9] * x[28] - x[12] * x[35]
-        hx[17] = 1 / 3 * x[2] + x[6] * x[21] + x[10] * x[22] + x[15] * x[30] + x[18] * x[31] - 30
-        hx[18] = 1 / 3 * x[2] + x[6] * x[24] + x[10] * x[25] + x[15] * x[33] + x[18] * x[34] - 50
-        hx[19] = 1 / 3 * x[2] + x[6] * x[27] + x[10] * x[28] + x[15] * x[36] + x[18] * x[37] - 30
-        hx[20] = x[20] + x[23] + x[26] - 1
-        hx[21] = x[21] + x[24] + x[27] - 1
-        hx[22] = x[22] + x[25] + x[28] - 1
-        hx[23] = x[29] + x[32] + x[35] - 1
-        hx[24] = x[30] + x[33] + x[36] - 1
-        hx[25] = x[31] + x[34] + x[37] - 1
-        hx[26] = x[24]
-        hx[27] = x[27]
-        hx[28] = x[22]
-        hx[29] = x[36]
-        hx[30] = x[31]
-        hx[31] = x[34]
-        return hx
+        h1 = x[0] + x[1] + x[2] + x[3] - 300
+        h2 = x[5] - x[6] - x[7]
+        h3 = x[8] - x[9] - x[10] - x[11]
+        h4 = x[13] - x[14] - x[15] - x[16]
+        h5 = x[17] - x[18] - x[19]
+        h6 = x[4] * x[20] - x[5] * x[21] - x[8] * x[22]
+        h7 = x[4] * x[23] - x[5] * x[24] - x[8] * x[25]
+        h8 = x[4] * x[26] - x[5] * x[27] - x[8] * x[28]
+        h9 = x[12] * x[29] - x[13] * x[30] - x[17] * x[31]
+        h10 = x[12] * x[32] - x[13] * x[33] - x[17] * x[34]
+        h11 = x[12] * x[35] - x[13] * x[36] - x[17] * x[36]
+        h12 = 1 / 3 * x[0] + x[14] * x[30] - x[4] * x[20]
+        h13 = 1 / 3 * x[0] + x[14] * x[33] - x[4] * x[23]
+        h14 = 1 / 3 * x[0] + x[14] * x[36] - x[4] * x[26]
+        h15 = 1 / 3 * x[1] + x[9] * x[22] - x[12] * x[29]
+        h16 = 1 / 3 * x[1] + x[9] * x[25] - x[12] * x[32]
+        h17 = 1 / 3 * x[1] + x[9] * x[28] - x[12] * x[35]
+        h18 = 1 / 3 * x[2] + x[6] * x[21] + x[10] * x[22] + x[15] * x[30] + x[18] * x[31] - 30
+        h19 = 1 / 3 * x[2] + x[6] * x[24] + x[10] * x[25] + x[15] * x[33] + x[18] * x[34] - 50
+        h20 = 1 / 3 * x[2] + x[6] * x[27] + x[10] * x[28] + x[15] * x[36] + x[18] * x[37] - 30
+        h21 = x[20] + x[23] + x[26] - 1
+        h22 = x[21] + x[24] + x[27] - 1
+        h23 = x[22] + x[25] + x[28] - 1
+        h24 = x[29] + x[32] + x[35] - 1
+        h25 = x[30] + x[33] + x[36] - 1
+        h26 = x[31] + x[34] + x[37] - 1
+        h27 = x[24]
+        h28 = x[27]
+        h29 = x[22]
+        h30 = x[36]
+        h31 = x[31]
+        h32 = x[34]
+        return np.array([h1, h2, h3, h4, h5, h6, h7, h8, h9, h10, h11, h12, h13, h14, h15, h16, h17, h18, h19, h20, h21, h22,
+                         h23, h24, h25, h26, h27, h28, h29, h30, h31, h32])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         return hx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class PropaneIsobutaneNButaneNonsharpSeparationProblem(Engineer):
     """
@@ -250,6 +224,7 @@ class PropaneIsobutaneNButaneNonsharpSeparationProblem(Engineer):
     """
 
     name = "Propane, Isobutane, n-Butane Nonsharp Separation (Industrial Chemical Processes)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -271,59 +246,52 @@ class PropaneIsobutaneNButaneNonsharpSeparationProblem(Engineer):
         return np.array([f1])
 
     def get_eq_cons(self, x):
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = x[0] + x[1] + x[2] + x[3] - 300
-        hx[1] = x[5] - x[6] - x[7]
-        hx[2] = x[8] - x[9] - x[10] - x[11]
-        hx[3] = x[13] - x[14] - x[15] - x[16]
-        hx[4] = x[17] - x[18] - x[19]
-        hx[5] = x[5] * x[20] - x[23] * x[24]
-        hx[6] = x[13] * x[21] - x[25] * x[26]
-        hx[7] = x[8] * x[22] - x[27] * x[28]
-        hx[8] = x[17] * x[29] - x[30] * x[31]
-        hx[9] = x[24] - x[4] * x[32]
-        hx[10] = x[28] - x[4] * x[33]
-        hx[11] = x[34] - x[4] * x[35]
-        hx[12] = x[36] - x[12] * x[37]
-        hx[13] = x[26] - x[12] * x[38]
-        hx[14] = x[31] - x[12] * x[39]
-        hx[15] = x[24] - x[5] * x[20] - x[8] * x[40]
-        hx[16] = x[28] - x[5] * x[41] - x[8] * x[22]
-        hx[17] = x[34] - x[5] * x[42] - x[8] * x[43]
-        hx[18] = x[36] - x[13] * x[44] - x[17] * x[45]
-        hx[19] = x[26] - x[13] * x[21] - x[17] * x[46]
-        hx[20] = x[31] - x[13] * x[47] - x[17] * x[29]
-        hx[21] = 1 / 3 * x[0] + x[14] * x[44] - x[24]
-        hx[22] = 1 / 3 * x[0] + x[14] * x[21] - x[28]
-        hx[23] = 1 / 3 * x[0] + x[14] * x[47] - x[34]
-        hx[24] = 1 / 3 * x[1] + x[9] * x[40] - x[36]
-        hx[25] = 1 / 3 * x[1] + x[9] * x[22] - x[26]
-        hx[26] = 1 / 3 * x[1] + x[9] * x[43] - x[31]
-        hx[27] = 1 / 3 * x[2] + x[6] * x[20] + x[10] * x[40] + x[15] * x[44] + x[18] * x[45] - 30
-        hx[28] = 1 / 3 * x[2] + x[6] * x[41] + x[10] * x[22] + x[15] * x[21] + x[18] * x[46] - 50
-        hx[29] = 1 / 3 * x[2] + x[6] * x[42] + x[10] * x[43] + x[15] * x[47] + x[18] * x[29] - 30
-        hx[30] = x[32] + x[33] + x[35] - 1
-        hx[31] = x[20] + x[41] + x[42] - 1
-        hx[32] = x[40] + x[22] + x[43] - 1
-        hx[33] = x[37] + x[38] + x[39] - 1
-        hx[34] = x[44] + x[21] + x[47] - 1
-        hx[35] = x[45] + x[46] + x[29] - 1
-        hx[36] = x[42]
-        hx[37] = x[45]
-        return hx
+        h1 = x[0] + x[1] + x[2] + x[3] - 300
+        h2 = x[5] - x[6] - x[7]
+        h3 = x[8] - x[9] - x[10] - x[11]
+        h4 = x[13] - x[14] - x[15] - x[16]
+        h5 = x[17] - x[18] - x[19]
+        h6 = x[5] * x[20] - x[23] * x[24]
+        h7 = x[13] * x[21] - x[25] * x[26]
+        h8 = x[8] * x[22] - x[27] * x[28]
+        h9 = x[17] * x[29] - x[30] * x[31]
+        h10 = x[24] - x[4] * x[32]
+        h11 = x[28] - x[4] * x[33]
+        h12 = x[34] - x[4] * x[35]
+        h13 = x[36] - x[12] * x[37]
+        h14 = x[26] - x[12] * x[38]
+        h15 = x[31] - x[12] * x[39]
+        h16 = x[24] - x[5] * x[20] - x[8] * x[40]
+        h17 = x[28] - x[5] * x[41] - x[8] * x[22]
+        h18 = x[34] - x[5] * x[42] - x[8] * x[43]
+        h19 = x[36] - x[13] * x[44] - x[17] * x[45]
+        h20 = x[26] - x[13] * x[21] - x[17] * x[46]
+        h21 = x[31] - x[13] * x[47] - x[17] * x[29]
+        h22 = 1 / 3 * x[0] + x[14] * x[44] - x[24]
+        h23 = 1 / 3 * x[0] + x[14] * x[21] - x[28]
+        h24 = 1 / 3 * x[0] + x[14] * x[47] - x[34]
+        h25 = 1 / 3 * x[1] + x[9] * x[40] - x[36]
+        h26 = 1 / 3 * x[1] + x[9] * x[22] - x[26]
+        h27 = 1 / 3 * x[1] + x[9] * x[43] - x[31]
+        h28 = 1 / 3 * x[2] + x[6] * x[20] + x[10] * x[40] + x[15] * x[44] + x[18] * x[45] - 30
+        h29 = 1 / 3 * x[2] + x[6] * x[41] + x[10] * x[22] + x[15] * x[21] + x[18] * x[46] - 50
+        h30 = 1 / 3 * x[2] + x[6] * x[42] + x[10] * x[43] + x[15] * x[47] + x[18] * x[29] - 30
+        h31 = x[32] + x[33] + x[35] - 1
+        h32 = x[20] + x[41] + x[42] - 1
+        h33 = x[40] + x[22] + x[43] - 1
+        h34 = x[37] + x[38] + x[39] - 1
+        h35 = x[44] + x[21] + x[47] - 1
+        h36 = x[45] + x[46] + x[29] - 1
+        h37 = x[42]
+        h38 = x[45]
+        return np.array([h1, h2, h3, h4, h5, h6, h7, h8, h9, h10, h11, h12, h13, h14, h15, h16, h17, h18, h19, h20, h21, h22,
+                         h23, h24, h25, h26, h27, h28, h29, h30, h31, h32, h33, h34, h35, h36, h37, h38])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         return hx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class OptimalOperationAlkylationUnitProblem(Engineer):
     """
@@ -333,6 +301,7 @@ class OptimalOperationAlkylationUnitProblem(Engineer):
     """
 
     name = "Optimal Operation of Alkylation Unit (Industrial Chemical Processes)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -349,34 +318,26 @@ class OptimalOperationAlkylationUnitProblem(Engineer):
         return np.array([f1])
 
     def get_ineq_cons(self, x):
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = 0.0059553571 * x[5] ** 2 * x[0] + 0.88392857 * x[2] - 0.1175625 * x[5] * x[0] - x[0]
-        gx[1] = 1.1088 * x[0] + 0.1303533 * x[0] * x[5] - 0.0066033 * x[0] * x[5] ** 2 - x[2]
-        gx[2] = 6.66173269 * x[5] ** 2 + 172.39878 * x[4] - 56.596669 * x[3] - 191.20592 * x[5] - 10000
-        gx[3] = 1.08702 * x[5] + 0.32175 * x[3] - 0.03762 * x[5] ** 2 - x[4] + 56.85075
-        gx[4] = 0.006198 * x[6] * x[3] * x[2] + 2462.3121 * x[1] - 25.125634 * x[1] * x[3] - x[2] * x[3]
-        gx[5] = 161.18996 * x[2] * x[3] + 5000.0 * x[1] * x[3] - 489510.0 * x[1] - x[2] * x[3] * x[6]
-        gx[6] = 0.33 * x[6] - x[4] + 44.333333
-        gx[7] = 0.022556 * x[4] - 0.007595 * x[6] - 1.0
-        gx[8] = 0.00061 * x[2] - 0.0005 * x[0] - 1.0
-        gx[9] = 0.819672 * x[0] - x[2] + 0.819672
-        gx[10] = 24500.0 * x[1] - 250.0 * x[1] * x[3] - x[2] * x[3]
-        gx[11] = 1020.4082 * x[3] * x[1] + 1.2244898 * x[2] * x[3] - 100000 * x[1]
-        gx[12] = 6.25 * x[0] * x[5] + 6.25 * x[0] - 7.625 * x[2] - 100000
-        gx[13] = 1.22 * x[2] - x[5] * x[0] - x[0] + 1.0
-        return gx
+        g1 = 0.0059553571 * x[5] ** 2 * x[0] + 0.88392857 * x[2] - 0.1175625 * x[5] * x[0] - x[0]
+        g2 = 1.1088 * x[0] + 0.1303533 * x[0] * x[5] - 0.0066033 * x[0] * x[5] ** 2 - x[2]
+        g3 = 6.66173269 * x[5] ** 2 + 172.39878 * x[4] - 56.596669 * x[3] - 191.20592 * x[5] - 10000
+        g4 = 1.08702 * x[5] + 0.32175 * x[3] - 0.03762 * x[5] ** 2 - x[4] + 56.85075
+        g5 = 0.006198 * x[6] * x[3] * x[2] + 2462.3121 * x[1] - 25.125634 * x[1] * x[3] - x[2] * x[3]
+        g6 = 161.18996 * x[2] * x[3] + 5000.0 * x[1] * x[3] - 489510.0 * x[1] - x[2] * x[3] * x[6]
+        g7 = 0.33 * x[6] - x[4] + 44.333333
+        g8 = 0.022556 * x[4] - 0.007595 * x[6] - 1.0
+        g9 = 0.00061 * x[2] - 0.0005 * x[0] - 1.0
+        g10 = 0.819672 * x[0] - x[2] + 0.819672
+        g11 = 24500.0 * x[1] - 250.0 * x[1] * x[3] - x[2] * x[3]
+        g12 = 1020.4082 * x[3] * x[1] + 1.2244898 * x[2] * x[3] - 100000 * x[1]
+        g13 = 6.25 * x[0] * x[5] + 6.25 * x[0] - 7.625 * x[2] - 100000
+        g14 = 1.22 * x[2] - x[5] * x[0] - x[0] + 1.0
+        return np.array([g1, g2, g3, g4, g5, g6, g7, g8, g9, g10, g11, g12, g13, g14])
 
     def get_cons(self, x):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class ReactorNetworkDesignProblem(Engineer):
     """
@@ -385,6 +346,7 @@ class ReactorNetworkDesignProblem(Engineer):
     Reactor Network Design Problem
     """
     name = "Reactor Network Design (Industrial Chemical Processes)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -406,12 +368,11 @@ class ReactorNetworkDesignProblem(Engineer):
         return np.array([f1])
 
     def get_eq_cons(self, x):
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = x[0] + self.k1 * x[1] * x[4] - 1
-        hx[1] = x[1] - x[0] + self.k2 * x[1] * x[5]
-        hx[2] = x[2] + x[0] + self.k3 * x[2] * x[4] - 1
-        hx[3] = x[3] - x[2] + x[1] - x[0] + self.k4 * x[3] * x[5]
-        return hx
+        h1 = x[0] + self.k1 * x[1] * x[4] - 1
+        h2 = x[1] - x[0] + self.k2 * x[1] * x[5]
+        h3 = x[2] + x[0] + self.k3 * x[2] * x[4] - 1
+        h4 = x[3] - x[2] + x[1] - x[0] + self.k4 * x[3] * x[5]
+        return np.array([h1, h2, h3, h4])
 
     def get_ineq_cons(self, x):
         gx = x[4] ** 0.5 + x[5] ** 0.5 - 4
@@ -419,17 +380,10 @@ class ReactorNetworkDesignProblem(Engineer):
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         gx_values = self.get_ineq_cons(x)
         return np.concatenate((hx_values, gx_values))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class ProcessSynthesis01Problem(Engineer):
     """
@@ -438,6 +392,8 @@ class ProcessSynthesis01Problem(Engineer):
     Process synthesis problem 01
     """
     name = "Process synthesis 01 problem (Process design and synthesis problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -447,16 +403,13 @@ class ProcessSynthesis01Problem(Engineer):
         self._n_ineq_cons = 2
         self._n_cons = 2
         self._bounds = np.array([(0., 1.6), (0., 1.99)])
+        self.schema = VariableSchema(self._n_dims, integers=[1])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
         f1 = 2 * x[0] + x[1]
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[1] = int(x[1])
-        return x
-
     def get_ineq_cons(self, x):
         g1 = 1.25 - x[0] ** 2 - x[1]
         g2 = x[0] + x[1] - 1.6
@@ -466,15 +419,6 @@ class ProcessSynthesis01Problem(Engineer):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[1]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class ProcessSynthesisAndDesignProblem(Engineer):
     """
@@ -483,6 +427,8 @@ class ProcessSynthesisAndDesignProblem(Engineer):
     Process synthesis and design problem
     """
     name = "Process synthesis and design problem (Process design and synthesis problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -493,16 +439,13 @@ class ProcessSynthesisAndDesignProblem(Engineer):
         self._n_eq_cons = 1
         self._n_cons = 2
         self._bounds = np.array([(0.5, 1.4), (0.5, 1.4), (0., 1.99)])
+        self.schema = VariableSchema(self._n_dims, integers=[2])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
         f1 = 2 * x[0] + x[1] - x[2]
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[2] = int(x[2])
-        return x
-
     def get_eq_cons(self, x):
         h1 = x[0] - 2 * np.exp(-x[1])
         return np.array([h1, ])
@@ -513,19 +456,10 @@ class ProcessSynthesisAndDesignProblem(Engineer):
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         gx_values = self.get_ineq_cons(x)
         return np.concatenate((hx_values, gx_values))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[2]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class ProcessFlowSheetingProblem(Engineer):
     """
@@ -534,6 +468,8 @@ class ProcessFlowSheetingProblem(Engineer):
     Process flow sheeting problem
     """
     name = "Process flow sheeting problem (Process design and synthesis problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -543,16 +479,13 @@ class ProcessFlowSheetingProblem(Engineer):
         self._n_ineq_cons = 3
         self._n_cons = 3
         self._bounds = np.array([(-2.22554, -1), (0.2, 1.0), (0., 1.99)])
+        self.schema = VariableSchema(self._n_dims, integers=[2])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
         f1 = 5 * (x[0] - 0.5) ** 2 + 0.8 -0.7 * x[2]
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[2] = int(x[2])
-        return x
-
     def get_ineq_cons(self, x):
         g1 = -np.exp(x[0] - 0.2) - x[1]
         g2 = x[1] + 1.1 * x[2] + 1
@@ -563,15 +496,6 @@ class ProcessFlowSheetingProblem(Engineer):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[2]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class TwoReactorProblem(Engineer):
     """
@@ -580,6 +504,8 @@ class TwoReactorProblem(Engineer):
     Two-reactor problem
     """
     name = "Two-reactor problem (Process design and synthesis problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -591,17 +517,13 @@ class TwoReactorProblem(Engineer):
         self._n_cons = 9
         bounds = [(0., 100.), ] * 6 + [(0., 1.99), ]*2
         self._bounds = np.array(bounds)
+        self.schema = VariableSchema(self._n_dims, integers=[6, 7])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
         f1 = 7.5 * x[6] + 5.5 * x[7] + 7 * x[4] + 6 * x[5] + 5 * (x[0] + x[1])
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[-1] = int(x[-1])
-        x[-2] = int(x[-2])
-        return x
-
     def get_eq_cons(self, x):
         h1 = x[6] + x[7] - 1
         h2 = x[2] - 0.9*(1 - np.exp(0.5*x[4]))*x[0]
@@ -619,19 +541,10 @@ class TwoReactorProblem(Engineer):
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         gx_values = self.get_ineq_cons(x)
         return np.concatenate((hx_values, gx_values))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[-1]) != int or type(x[-2]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class ProcessSynthesis02Problem(Engineer):
     """
@@ -640,6 +553,8 @@ class ProcessSynthesis02Problem(Engineer):
     Process synthesis problem 02
     """
     name = "Process synthesis 02 problem (Process design and synthesis problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -650,21 +565,15 @@ class ProcessSynthesis02Problem(Engineer):
         self._n_cons = 9
         bounds = [(0., 100.), ]*3 + [(0., 1.99), ]*4
         self._bounds = np.array(bounds)
+        self.schema = VariableSchema(self._n_dims, integers=[3, 4, 5, 6])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
         f1 = (1-x[3])**2 + (1-x[4])**2 + (1-x[5])**2 - np.log(1 + x[6]) + (1 - x[0])**2 + (2-x[1])**2 + (3-x[2])**2
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[3] = int(x[3])
-        x[4] = int(x[4])
-        x[5] = int(x[5])
-        x[6] = int(x[6])
-        return x
-
     def get_ineq_cons(self, x):
-        g1 = np.sum(x[:5]) - 5
+        g1 = np.sum(x[:5], axis=0) - 5
         g2 = x[0]**2 + x[1]**2 + x[2]**2 + x[5]**3 - 5.5
         g3 = x[0] + x[3] - 1.2
         g4 = x[1] + x[4] - 1.8
@@ -679,15 +588,6 @@ class ProcessSynthesis02Problem(Engineer):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[3]) != int or type(x[4]) != int or type(x[5]) != int or type(x[6]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class ProcessDesignProblem(Engineer):
     """
@@ -696,6 +596,8 @@ class ProcessDesignProblem(Engineer):
     Process design Problem
     """
     name = "Process design Problem (Process design and synthesis problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -706,17 +608,13 @@ class ProcessDesignProblem(Engineer):
         self._n_cons = 3
         self._bounds = np.array([(27., 45), (27., 45), (27., 45), (78, 102.99), (33, 45.99)])
         self.a = [85.334407, 0.0056858, 0.0006262, 0.0022053, 80.51249, 0.0071317, 0.0029955, 0.0021813, 9.300961, 0.0047026, 0.0012547, 0.0019085]
+        self.schema = VariableSchema(self._n_dims, integers=[3, 4])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
         f1 = -5.357854 * x[0] ** 2 + 0.835689 * x[3]*x[2] - 37.29329 * x[3] + 40792.141
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[3] = int(x[3])
-        x[4] = int(x[4])
-        return x
-
     def get_ineq_cons(self, x):
         g1 = -92 + self.a[2]*x[3]*x[1] + self.a[0] + self.a[1]*x[3]*x[2] - self.a[3]*x[3]*x[2]
         g2 = -110 + self.a[6]*x[3]*x[1] + self.a[4] + self.a[5]*x[4]*x[2] + self.a[7]*x[0]**2
@@ -727,15 +625,6 @@ class ProcessDesignProblem(Engineer):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[3]) != int or type(x[4]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class MultiProductBatchPlantProblem(Engineer):
     """
@@ -744,6 +633,8 @@ class MultiProductBatchPlantProblem(Engineer):
     Multi-product batch plant
     """
     name = "Multi-product batch plant (Process design and synthesis problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -762,6 +653,7 @@ class MultiProductBatchPlantProblem(Engineer):
         self.beta = 0.6
         self.Q1 = 40000
         self.Q2 = 20000
+        self.schema = VariableSchema(self._n_dims, integers=[0, 1, 2])
         self.check_penalty_func(f_penalty)
 
     def get_objs(self, x):
@@ -769,12 +661,6 @@ class MultiProductBatchPlantProblem(Engineer):
         f1 = self.alp * (N1 * V1 ** self.beta + N2 * V2 ** self.beta + N3 * V3 ** self.beta)
         return np.array([f1])
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[0] = int(x[0])
-        x[1] = int(x[1])
-        x[2] = int(x[2])
-        return x
-
     def get_ineq_cons(self, x):
         N1, N2, N3, V1, V2, V3, TL1, TL2, B1, B2 = x
         g1 = self.S[0, 0] * B1 - V1
@@ -796,15 +682,6 @@ class MultiProductBatchPlantProblem(Engineer):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[0]) != int or type(x[1]) != int or type(x[2]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class WeightMinimizationSpeedReducerProblem(Engineer):
     """
@@ -813,6 +690,7 @@ class WeightMinimizationSpeedReducerProblem(Engineer):
     Weight minimization of a speed reducer
     """
     name = "Weight minimization of a speed reducer (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -849,13 +727,6 @@ class WeightMinimizationSpeedReducerProblem(Engineer):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class OptimalDesignIndustrialRefrigerationSystemProblem(Engineer):
     """
@@ -864,6 +735,7 @@ class OptimalDesignIndustrialRefrigerationSystemProblem(Engineer):
     Optimal design of industrial refrigeration system
     """
     name = "Optimal design of industrial refrigeration system (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -884,35 +756,27 @@ class OptimalDesignIndustrialRefrigerationSystemProblem(Engineer):
         return np.array([f1])
 
     def get_ineq_cons(self, x):
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = 1.524 * x[6] ** (-1) - 1
-        gx[1] = 1.524 * x[7] ** (-1) - 1
-        gx[2] = 0.07789 * x[0] - 2 * x[6] ** (-1) * x[8] - 1
-        gx[3] = 7.05305 * x[8] ** (-1) * x[0] ** 2 * x[9] * x[7] ** (-1) * x[1] ** (-1) * x[13] ** (-1) - 1
-        gx[4] = 0.0833 / x[12] * x[13] - 1
-        gx[5] = 0.04771 * x[9] * x[7] ** 1.8812 * x[11] ** 0.3424 - 1
-        gx[6] = 0.0488 * x[8] * x[6] ** 1.893 * x[10] ** 0.316 - 1
-        gx[7] = 0.0099 * x[0] / x[2] - 1
-        gx[8] = 0.0193 * x[1] / x[3] - 1
-        gx[9] = 0.0298 * x[0] / x[4] - 1
-        gx[10] = 47.136 * x[1] ** 0.333 / x[9] * x[11] - 1.333 * x[7] * x[12] ** 2.1195 + 62.08 * x[12] ** 2.1195 * x[7] ** 0.2 / (x[11] * x[9]) - 1
-        gx[11] = 0.056 * x[1] / x[5] - 1
-        gx[12] = 2 / x[8] - 1
-        gx[13] = 2 / x[9] - 1
-        gx[14] = x[11] / x[10] - 1
-        return gx
+        g1 = 1.524 * x[6] ** (-1) - 1
+        g2 = 1.524 * x[7] ** (-1) - 1
+        g3 = 0.07789 * x[0] - 2 * x[6] ** (-1) * x[8] - 1
+        g4 = 7.05305 * x[8] ** (-1) * x[0] ** 2 * x[9] * x[7] ** (-1) * x[1] ** (-1) * x[13] ** (-1) - 1
+        g5 = 0.0833 / x[12] * x[13] - 1
+        g6 = 0.04771 * x[9] * x[7] ** 1.8812 * x[11] ** 0.3424 - 1
+        g7 = 0.0488 * x[8] * x[6] ** 1.893 * x[10] ** 0.316 - 1
+        g8 = 0.0099 * x[0] / x[2] - 1
+        g9 = 0.0193 * x[1] / x[3] - 1
+        g10 = 0.0298 * x[0] / x[4] - 1
+        g11 = 47.136 * x[1] ** 0.333 / x[9] * x[11] - 1.333 * x[7] * x[12] ** 2.1195 + 62.08 * x[12] ** 2.1195 * x[7] ** 0.2 / (x[11] * x[9]) - 1
+        g12 = 0.056 * x[1] / x[5] - 1
+        g13 = 2 / x[8] - 1
+        g14 = 2 / x[9] - 1
+        g15 = x[11] / x[10] - 1
+        return np.array([g1, g2, g3, g4, g5, g6, g7, g8, g9, g10, g11, g12, g13, g14, g15])
 
     def get_cons(self, x):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class TensionCompressionSpringDesignProblem(Engineer):
     """
@@ -921,6 +785,7 @@ class TensionCompressionSpringDesignProblem(Engineer):
     Tension/compression spring design
     """
     name = "Tension/compression spring design (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -937,24 +802,16 @@ class TensionCompressionSpringDesignProblem(Engineer):
         return np.array([f1])
 
     def get_ineq_cons(self, x):
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = 1 - (x[1] ** 3 * x[2]) / (71785 * x[0] ** 4)
-        gx[1] = (4 * x[1] ** 2 - x[0] * x[1]) / (12566 * (x[1] * x[0] ** 3 - x[0] ** 4)) + 1 / (5108 * x[0] ** 2) - 1
-        gx[2] = 1 - 140.45 * x[0] / (x[1] ** 2 * x[2])
-        gx[3] = (x[0] + x[1]) / 1.5 - 1
-        return gx
+        g1 = 1 - (x[1] ** 3 * x[2]) / (71785 * x[0] ** 4)
+        g2 = (4 * x[1] ** 2 - x[0] * x[1]) / (12566 * (x[1] * x[0] ** 3 - x[0] ** 4)) + 1 / (5108 * x[0] ** 2) - 1
+        g3 = 1 - 140.45 * x[0] / (x[1] ** 2 * x[2])
+        g4 = (x[0] + x[1]) / 1.5 - 1
+        return np.array([g1, g2, g3, g4])
 
     def get_cons(self, x):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class PressureVesselDesignProblem(Engineer):
     """
@@ -963,6 +820,8 @@ class PressureVesselDesignProblem(Engineer):
     Pressure vessel design
     """
     name = "Pressure vessel design (Mechanical design problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -972,42 +831,29 @@ class PressureVesselDesignProblem(Engineer):
         self._n_ineq_cons = 4
         self._n_cons = 4
         self._bounds = np.array([(1, 99.99), (1, 99.99), (10., 200), (10., 200)])
+        self.schema = VariableSchema(self._n_dims, integers=[0, 1])
         self.check_penalty_func(f_penalty)
 
-    def amend_position(self, x, lb=None, ub=None):
-        x[0] = int(x[0])
-        x[1] = int(x[1])
-        return x
-
-    def get_objs(self, x):
+    def get_objs_cons(self, x):
         z1 = 0.0625 * x[0]
         z2 = 0.0625 * x[1]
         f1 = 0.6224 * z1 * x[2] * x[3] + 1.7781 * z2 * x[2] ** 2 + 3.1661 * z1 ** 2 * x[3] + 19.84 * z1 ** 2 * x[2]
-        return np.array([f1])
+        g1 = 0.00954 * x[2] - z2
+        g2 = 0.0193 * x[2] - z1
+        g3 = x[3] - 240
+        g4 = 1296000 - np.pi * x[2] ** 2 * x[3] - 4 / 3 * np.pi * x[2] ** 3
+        return np.array([f1]), np.array([g1, g2, g3, g4])
+
+    def get_objs(self, x):
+        return self.get_objs_cons(x)[0]
 
     def get_ineq_cons(self, x):
-        z1 = 0.0625 * x[0]
-        z2 = 0.0625 * x[1]
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = 0.00954 * x[2] - z2
-        gx[1] = 0.0193 * x[2] - z1
-        gx[2] = x[3] - 240
-        gx[3] = 1296000 - np.pi * x[2] ** 2 * x[3] - 4 / 3 * np.pi * x[2] ** 3
-        return gx
+        return self.get_objs_cons(x)[1]
 
     def get_cons(self, x):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[0]) != int or type(x[1]) != int:
-            x = self.amend_position(x, self.lb, self.ub)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class WeldedBeamDesignProblem(Engineer):
     """
@@ -1016,6 +862,7 @@ class WeldedBeamDesignProblem(Engineer):
     Welded beam design
     """
     name = "Welded beam design (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -1048,25 +895,17 @@ class WeldedBeamDesignProblem(Engineer):
         ttt = M * R / J
         tt = self.P / (np.sqrt(2) * x[0] * x[1])
         t = np.sqrt(tt ** 2 + 2 * tt * ttt * x[1] / (2 * R) + ttt ** 2)
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = t - self.T_max
-        gx[1] = sigma - self.sigma_max
-        gx[2] = x[0] - x[3]
-        gx[3] = delta - self.delta_max
-        gx[4] = self.P - Pc
-        return gx
+        g1 = t - self.T_max
+        g2 = sigma - self.sigma_max
+        g3 = x[0] - x[3]
+        g4 = delta - self.delta_max
+        g5 = self.P - Pc
+        return np.array([g1, g2, g3, g4, g5])
 
     def get_cons(self, x):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class ThreeBarTrussDesignProblem(Engineer):
     """
@@ -1075,6 +914,7 @@ class ThreeBarTrussDesignProblem(Engineer):
     Three-bar truss design problem
     """
     name = "Three-bar truss design problem (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -1094,23 +934,15 @@ class ThreeBarTrussDesignProblem(Engineer):
         return np.array([f1])
 
     def get_ineq_cons(self, x):
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = x[1] / (np.sqrt(2) * x[0] ** 2 + 2 * x[0] * x[1]) * self.PP - self.xichma
-        gx[0] = (np.sqrt(2) * x[0] + x[1]) / (np.sqrt(2) * x[0] ** 2 + 2 * x[0] * x[1]) * self.PP - self.xichma
-        gx[2] = 1 / (np.sqrt(2) * x[1] + x[0]) * self.PP - self.xichma
-        return gx
+        g1 = (np.sqrt(2) * x[0] + x[1]) / (np.sqrt(2) * x[0] ** 2 + 2 * x[0] * x[1]) * self.PP - self.xichma
+        g2 = x[1] / (np.sqrt(2) * x[0] ** 2 + 2 * x[0] * x[1]) * self.PP - self.xichma
+        g3 = 1 / (np.sqrt(2) * x[1] + x[0]) * self.PP - self.xichma
+        return np.array([g1, g2, g3])
 
     def get_cons(self, x):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class MultipleDiskClutchBrakeDesignProblem(Engineer):
     """
@@ -1119,6 +951,7 @@ class MultipleDiskClutchBrakeDesignProblem(Engineer):
     Multiple disk clutch brake design problem
     """
     name = "Multiple disk clutch brake design problem (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -1144,41 +977,36 @@ class MultipleDiskClutchBrakeDesignProblem(Engineer):
         self.delR = 20
         self.check_penalty_func(f_penalty)
 
-    def get_objs(self, x):
-        f1 = np.pi * (x[1] ** 2 - x[0] ** 2) * x[2] * (x[4] + 1) * self.rho
-        return np.array([f1])
-
-    def get_ineq_cons(self, x):
+    def get_objs_cons(self, x):
+        A = np.pi * (x[1] ** 2 - x[0] ** 2)
+        f1 = A * x[2] * (x[4] + 1) * self.rho
         Rsr = 2 / 3 * (x[1] ** 3 - x[0] ** 3) / (x[1] ** 2 * x[0] ** 2)
         Vsr = np.pi * Rsr * self.n / 30
-        A = np.pi * (x[1] ** 2 - x[0] ** 2)
         Prz = x[3] / A
         w = np.pi * self.n / 30
         Mh = 2 / 3 * self.mu * x[3] * x[4] * (x[1] ** 3 - x[0] ** 3) / (x[1] ** 2 - x[0] ** 2)
         T = self.Iz * w / (Mh + self.Mf)
 
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = Prz - self.pmax
-        gx[1] = Prz * Vsr - self.pmax * self.Vsrmax
-        gx[2] = x[0] + self.delR -x[1]
-        gx[3] = (x[4] + 1) * (x[2] + self.delta) - self.Lmax
-        gx[4] = self.s * self.Ms - Mh
-        gx[5] = -T
-        gx[6] = Vsr - self.Vsrmax
-        gx[7] = T - self.Tmax
-        return gx
+        g1 = Prz - self.pmax
+        g2 = Prz * Vsr - self.pmax * self.Vsrmax
+        g3 = x[0] + self.delR -x[1]
+        g4 = (x[4] + 1) * (x[2] + self.delta) - self.Lmax
+        g5 = self.s * self.Ms - Mh
+        g6 = -T
+        g7 = Vsr - self.Vsrmax
+        g8 = T - self.Tmax
+        return np.array([f1]), np.array([g1, g2, g3, g4, g5, g6, g7, g8])
+
+    def get_objs(self, x):
+        return self.get_objs_cons(x)[0]
+
+    def get_ineq_cons(self, x):
+        return self.get_objs_cons(x)[1]
 
     def get_cons(self, x):
         gx_values = self.get_ineq_cons(x)
         return gx_values
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class PlanetaryGearTrainDesignOptimizationProblem(Engineer):
     """
@@ -1187,6 +1015,8 @@ class PlanetaryGearTrainDesignOptimizationProblem(Engineer):
     Planetary gear train design optimization problem
     """
     name = "Planetary gear train design optimization problem (Mechanical design problems)"
+    vectorized = True
+    deduplicate = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -1199,6 +1029,7 @@ class PlanetaryGearTrainDesignOptimizationProblem(Engineer):
         self._bounds = np.array([(17, 96.99), (14, 54.99), (14, 51.99), (17, 46.99), (14, 51.99), (48, 124.99),
                                  (3, 5.99), (0, 5.99), (0, 5.99)])
         self.mind = [1.75, 2, 2.25, 2.5, 2.75, 3.0]
+        self.mind_codec = DiscreteCodec(self.mind)
         self.Dmax = 220
         self.dlt22 = 0.5
         self.dlt33 = 0.5
@@ -1206,64 +1037,50 @@ class PlanetaryGearTrainDesignOptimizationProblem(Engineer):
         self.dlt35 = 0.5
         self.dlt34 = 0.5
         self.dlt56 = 0.5
+        self.schema = VariableSchema(self._n_dims, integers=range(self._n_dims))
         self.check_penalty_func(f_penalty)
 
-    def amend_position(self, x, lb=None, ub=None):
-        x = np.array(x, dtype=int)
-        return x
-
     def get_objs(self, x):
-        N1, N2, N3, N4, N5, N6, p = x[:6]
+        N1, N2, N3, N4, N5, N6, p = x[:7]
         i1 = N6 / N4
         i01 = 3.11
         i2 = N6 * (N1 * N3 + N2 * N4) / (N1 * N3 * (N6 - N4))
         i02 = 1.84
         iR = -(N2 * N6 / (N1 * N3))
         i0R = -3.11
-        f1 = max([i1 - i01, i2 - i02, iR - i0R])
+        f1 = np.max([i1 - i01, i2 - i02, iR - i0R], axis=0)
         return np.array([f1])
 
     def get_eq_cons(self, x):
-        N1, N2, N3, N4, N5, N6, p = x[:6]
+        N1, N2, N3, N4, N5, N6, p = x[:7]
         hx = np.remainder(N6 - N4, p)
         return np.array([hx, ])
 
     def get_ineq_cons(self, x):
-        N1, N2, N3, N4, N5, N6, p = x[:6]
-        m1 = self.mind[x[7]]
-        m2 = self.mind[x[8]]
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = m2 * (N6 + 2.5) - self.Dmax
-        gx[1] = m1 * (N1 + N2) + m1 * (N2 + 2) - self.Dmax
-        gx[2] = m2 * (N4 + N5) + m2 * (N5 + 2) - self.Dmax
-        gx[3] = np.abs(m1 * (N1 + N2) - m2 * (N6 - N3)) - m1 - m2
-        gx[4] = -((N1 + N2) * np.sin(np.pi / p) - N2 - 2 - self.dlt22)
-        gx[5] = -((N6 - N3) * np.sin(np.pi / p) - N3 - 2 - self.dlt33)
-        gx[6] = -((N4 + N5) * np.sin(np.pi / p) - N5 - 2 - self.dlt55)
+        N1, N2, N3, N4, N5, N6, p = x[:7]
+        m1 = self.mind_codec.decode(x[7])
+        m2 = self.mind_codec.decode(x[8])
+        g1 = m2 * (N6 + 2.5) - self.Dmax
+        g2 = m1 * (N1 + N2) + m1 * (N2 + 2) - self.Dmax
+        g3 = m2 * (N4 + N5) + m2 * (N5 + 2) - self.Dmax
+        g4 = np.abs(m1 * (N1 + N2) - m2 * (N6 - N3)) - m1 - m2
+        g5 = -((N1 + N2) * np.sin(np.pi / p) - N2 - 2 - self.dlt22)
+        g6 = -((N6 - N3) * np.sin(np.pi / p) - N3 - 2 - self.dlt33)
+        g7 = -((N4 + N5) * np.sin(np.pi / p) - N5 - 2 - self.dlt55)
         beta = np.arccos(((N6 - N3) ** 2 + (N4 + N5) ** 2 - (N3 + N5) ** 2) / (2 * (N6 - N3) * (N4 + N5)))
-        if beta == beta.real:
-            gx[7] = (N3 + N5 + 2 + self.dlt35) ** 2 - ((N6 - N3) ** 2 + (N4 + N5) ** 2 - 2 * (N6 - N3) * (N4 + N5) * np.cos(2 * np.pi / p - beta))
-        else:
-            gx[7] = 1e6
-        gx[8] = -(N6 - 2 * N3 - N4 - 4 - 2 * self.dlt34)
-        gx[9] = -(N6 - N4 - 2 * N5 - 4 - 2 * self.dlt56)
-        return gx
+        # arccos is NaN outside [-1, 1], there is no real angle in that case
+        g8 = np.where(np.isnan(beta), 1e6, (N3 + N5 + 2 + self.dlt35) ** 2 -
+                      ((N6 - N3) ** 2 + (N4 + N5) ** 2 - 2 * (N6 - N3) * (N4 + N5) * np.cos(2 * np.pi / p - beta)))
+        g9 = -(N6 - 2 * N3 - N4 - 4 - 2 * self.dlt34)
+        g10 = -(N6 - N4 - 2 * N5 - 4 - 2 * self.dlt56)
+        return np.array([g1, g2, g3, g4, g5, g6, g7, g8, g9, g10])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         gx_values = self.get_ineq_cons(x)
         return np.concatenate((hx_values, gx_values))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        if type(x[0]) != int:
-            x = self.amend_position(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class StepConePulleyProblem(Engineer):
     """
@@ -1272,6 +1089,7 @@ class StepConePulleyProblem(Engineer):
     Step-cone pulley problem
     """
     name = "Step-cone pulley problem (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
@@ -1313,11 +1131,10 @@ class StepConePulleyProblem(Engineer):
         C2 = np.pi * d2 / 2 * (1 + self.N2 / self.N) + (self.N2 / self.N - 1) ** 2 * d2 ** 2 / (4 * self.a) + 2 * self.a
         C3 = np.pi * d3 / 2 * (1 + self.N3 / self.N) + (self.N3 / self.N - 1) ** 2 * d3 ** 2 / (4 * self.a) + 2 * self.a
         C4 = np.pi * d4 / 2 * (1 + self.N4 / self.N) + (self.N4 / self.N - 1) ** 2 * d4 ** 2 / (4 * self.a) + 2 * self.a
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = C1 - C2
-        hx[1] = C1 - C3
-        hx[2] = C1 - C4
-        return np.array([hx, ])
+        h1 = C1 - C2
+        h2 = C1 - C3
+        h3 = C1 - C4
+        return np.array([h1, h2, h3])
 
     def get_ineq_cons(self, x):
         d1 = x[0] * 1e-3
@@ -1325,38 +1142,34 @@ class StepConePulleyProblem(Engineer):
         d3 = x[2] * 1e-3
         d4 = x[3] * 1e-3
         w = x[4] * 1e-3
-        R1 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N1 / self.N - 1) * d1 / (2 * self.a))))
-        R2 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N2 / self.N - 1) * d2 / (2 * self.a))))
-        R3 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N3 / self.N - 1) * d3 / (2 * self.a))))
-        R4 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N4 / self.N - 1) * d4 / (2 * self.a))))
-        P1 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N1 / self.N - 1) * d1 / (2 * self.a))))) * np.pi * d1 * self.N1 / 60
-        P2 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N2 / self.N - 1) * d2 / (2 * self.a))))) * np.pi * d2 * self.N2 / 60
-        P3 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N3 / self.N - 1) * d3 / (2 * self.a))))) * np.pi * d3 * self.N3 / 60
-        P4 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N4 / self.N - 1) * d4 / (2 * self.a))))) * np.pi * d4 * self.N4 / 60
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = -R1 + 2
-        gx[1] = -R2 + 2
-        gx[2] = -R3 + 2
-        gx[3] = -R4 + 2
-        gx[4] = -P1 + (0.75 * 745.6998)
-        gx[5] = -P2 + (0.75 * 745.6998)
-        gx[6] = -P3 + (0.75 * 745.6998)
-        gx[7] = -P4 + (0.75 * 745.6998)
-        return gx
+        theta1 = np.pi - 2 * np.arcsin((self.N1 / self.N - 1) * d1 / (2 * self.a))
+        theta2 = np.pi - 2 * np.arcsin((self.N2 / self.N - 1) * d2 / (2 * self.a))
+        theta3 = np.pi - 2 * np.arcsin((self.N3 / self.N - 1) * d3 / (2 * self.a))
+        theta4 = np.pi - 2 * np.arcsin((self.N4 / self.N - 1) * d4 / (2 * self.a))
+        R1 = np.exp(self.mu * theta1)
+        R2 = np.exp(self.mu * theta2)
+        R3 = np.exp(self.mu * theta3)
+        R4 = np.exp(self.mu * theta4)
+        P1 = self.s * self.t * w * (1 - np.exp(-self.mu * theta1)) * np.pi * d1 * self.N1 / 60
+        P2 = self.s * self.t * w * (1 - np.exp(-self.mu * theta2)) * np.pi * d2 * self.N2 / 60
+        P3 = self.s * self.t * w * (1 - np.exp(-self.mu * theta3)) * np.pi * d3 * self.N3 / 60
+        P4 = self.s * self.t * w * (1 - np.exp(-self.mu * theta4)) * np.pi * d4 * self.N4 / 60
+        g1 = -R1 + 2
+        g2 = -R2 + 2
+        g3 = -R3 + 2
+        g4 = -R4 + 2
+        g5 = -P1 + (0.75 * 745.6998)
+        g6 = -P2 + (0.75 * 745.6998)
+        g7 = -P3 + (0.75 * 745.6998)
+        g8 = -P4 + (0.75 * 745.6998)
+        return np.array([g1, g2, g3, g4, g5, g6, g7, g8])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         gx_values = self.get_ineq_cons(x)
         return np.concatenate((hx_values, gx_values))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 class RobotGripperProblem(Engineer):
     """
@@ -1365,16 +1178,17 @@ class RobotGripperProblem(Engineer):
     Robot gripper problem
     """
     name = "Robot gripper problem (Mechanical design problems)"
+    vectorized = True
 
     def __init__(self, f_penalty=None):
         super().__init__()
         self.epsilon = 10**(-4)
-        self._n_dims = 7
+        self._bounds = np.array([(0, 60.), (0, 60.), (0, 90.), (0, 90.), (0, 90.)])
+        self._n_dims = len(self._bounds)
         self._n_objs = 1
         self._n_ineq_cons = 8
         self._n_eq_cons = 3
         self._n_cons = 11
-        self._bounds = np.array([(0, 60.), (0, 60.), (0, 90.), (0, 90.), (0, 90.)])
         self.N = 350
         self.N1 = 750
         self.N2 = 450
@@ -1406,11 +1220,10 @@ class RobotGripperProblem(Engineer):
         C2 = np.pi * d2 / 2 * (1 + self.N2 / self.N) + (self.N2 / self.N - 1) ** 2 * d2 ** 2 / (4 * self.a) + 2 * self.a
         C3 = np.pi * d3 / 2 * (1 + self.N3 / self.N) + (self.N3 / self.N - 1) ** 2 * d3 ** 2 / (4 * self.a) + 2 * self.a
         C4 = np.pi * d4 / 2 * (1 + self.N4 / self.N) + (self.N4 / self.N - 1) ** 2 * d4 ** 2 / (4 * self.a) + 2 * self.a
-        hx = np.zeros(self.n_eq_cons)
-        hx[0] = C1 - C2
-        hx[1] = C1 - C3
-        hx[2] = C1 - C4
-        return np.array([hx, ])
+        h1 = C1 - C2
+        h2 = C1 - C3
+        h3 = C1 - C4
+        return np.array([h1, h2, h3])
 
     def get_ineq_cons(self, x):
         d1 = x[0] * 1e-3
@@ -1418,38 +1231,34 @@ class RobotGripperProblem(Engineer):
         d3 = x[2] * 1e-3
         d4 = x[3] * 1e-3
         w = x[4] * 1e-3
-        R1 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N1 / self.N - 1) * d1 / (2 * self.a))))
-        R2 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N2 / self.N - 1) * d2 / (2 * self.a))))
-        R3 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N3 / self.N - 1) * d3 / (2 * self.a))))
-        R4 = np.exp(self.mu * (np.pi - 2 * np.arcsin((self.N4 / self.N - 1) * d4 / (2 * self.a))))
-        P1 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N1 / self.N - 1) * d1 / (2 * self.a))))) * np.pi * d1 * self.N1 / 60
-        P2 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N2 / self.N - 1) * d2 / (2 * self.a))))) * np.pi * d2 * self.N2 / 60
-        P3 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N3 / self.N - 1) * d3 / (2 * self.a))))) * np.pi * d3 * self.N3 / 60
-        P4 = self.s * self.t * w * (1 - np.exp(-self.mu * (np.pi - 2 * np.arcsin((self.N4 / self.N - 1) * d4 / (2 * self.a))))) * np.pi * d4 * self.N4 / 60
-        gx = np.zeros(self.n_ineq_cons)
-        gx[0] = -R1 + 2
-        gx[1] = -R2 + 2
-        gx[2] = -R3 + 2
-        gx[3] = -R4 + 2
-        gx[4] = -P1 + (0.75 * 745.6998)
-        gx[5] = -P2 + (0.75 * 745.6998)
-        gx[6] = -P3 + (0.75 * 745.6998)
-        gx[7] = -P4 + (0.75 * 745.6998)
-        return gx
+        theta1 = np.pi - 2 * np.arcsin((self.N1 / self.N - 1) * d1 / (2 * self.a))
+        theta2 = np.pi - 2 * np.arcsin((self.N2 / self.N - 1) * d2 / (2 * self.a))
+        theta3 = np.pi - 2 * np.arcsin((self.N3 / self.N - 1) * d3 / (2 * self.a))
+        theta4 = np.pi - 2 * np.arcsin((self.N4 / self.N - 1) * d4 / (2 * self.a))
+        R1 = np.exp(self.mu * theta1)
+        R2 = np.exp(self.mu * theta2)
+        R3 = np.exp(self.mu * theta3)
+        R4 = np.exp(self.mu * theta4)
+        P1 = self.s * self.t * w * (1 - np.exp(-self.mu * theta1)) * np.pi * d1 * self.N1 / 60
+        P2 = self.s * self.t * w * (1 - np.exp(-self.mu * theta2)) * np.pi * d2 * self.N2 / 60
+        P3 = self.s * self.t * w * (1 - np.exp(-self.mu * theta3)) * np.pi * d3 * self.N3 / 60
+        P4 = self.s * self.t * w * (1 - np.exp(-self.mu * theta4)) * np.pi * d4 * self.N4 / 60
+        g1 = -R1 + 2
+        g2 = -R2 + 2
+        g3 = -R3 + 2
+        g4 = -R4 + 2
+        g5 = -P1 + (0.75 * 745.6998)
+        g6 = -P2 + (0.75 * 745.6998)
+        g7 = -P3 + (0.75 * 745.6998)
+        g8 = -P4 + (0.75 * 745.6998)
+        return np.array([g1, g2, g3, g4, g5, g6, g7, g8])
 
     def get_cons(self, x):
         hx_list = self.get_eq_cons(x)
-        hx_values = np.array([np.abs(hval) - self.epsilon for hval in hx_list])
+        hx_values = np.abs(hx_list) - self.epsilon
         gx_values = self.get_ineq_cons(x)
         return np.concatenate((hx_values, gx_values))
 
-    def evaluate(self, x):
-        self.n_fe += 1
-        self.check_solution(x)
-        list_objs = self.get_objs(x)
-        list_cons = self.get_cons(x)
-        return self.f_penalty(list_objs, list_cons)
-
 
 
 def OBJ11(x, n):
@@ -0,0 +1,691 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 12:30, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import os
+import time
+import queue
+import asyncio
+import weakref
+import threading
+import itertools
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enoppy.engineer import Engineer
+from enoppy.utils.cache import DiskCache
+from enoppy.utils.validator import check_int, check_float, check_str
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+    HAS_SHARED_MEMORY = True
+except ImportError:     # Python 3.7, the chunks are pickled instead
+    shared_memory = resource_tracker = None
+    HAS_SHARED_MEMORY = False
+
+WORKER = threading.local()
+WORKER_BUFFERS = {}
+
+
+class SharedArray:
+    """
+    A float64 array stored in a block of shared memory.
+
+    The process that creates the block owns it and unlinks it in ``close()``; the other processes attach to it by name.
+
+    Parameters
+    ----------
+    shape : tuple
+        The shape of the array
+    name : str, optional
+        The name of an existing block to attach to, default is to create a new block
+    """
+
+    def __init__(self, shape, name=None):
+        self.shape = tuple(shape)
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(self.shape)) * 8, 1))
+        else:
+            self.shm = self.attach(name)
+        self.name = self.shm.name
+        self.array = np.ndarray(self.shape, dtype=float, buffer=self.shm.buf)
+        self._finalizer = weakref.finalize(self, self.release, self.shm, self.owner)
+
+    @staticmethod
+    def attach(name):
+        """
+        Attach to an existing block without registering it with the resource tracker, which would unlink it when the
+        attaching process exits.
+        """
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            register = resource_tracker.register
+            resource_tracker.register = lambda *args, **kwargs: None
+            try:
+                return shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+    @staticmethod
+    def release(shm, owner):
+        shm.close()
+        if owner:
+            shm.unlink()
+
+    def close(self):
+        """
+        Detach from the block, and unlink it if this process owns it.
+        """
+        self.array = None
+        self._finalizer()
+
+
+def get_worker_array(name, shape):
+    """
+    Return the array of a shared block in a worker process, attaching to it on first use and detaching from the blocks
+    of previous populations.
+    """
+    if name not in WORKER_BUFFERS:
+        WORKER_BUFFERS[name] = SharedArray(shape, name=name)
+    return WORKER_BUFFERS[name].array
+
+
+def release_worker_arrays(names):
+    """
+    Detach a worker process from the shared blocks that are not in ``names``.
+    """
+    for name in list(WORKER_BUFFERS):
+        if name not in names:
+            WORKER_BUFFERS.pop(name).close()
+
+
+def initialize_worker(spec, cache_config=None):
+    """
+    Build the problem of a worker (process or thread) once, at startup.
+    """
+    WORKER.problem = Engineer.from_spec(spec)
+    if cache_config is not None:
+        WORKER.problem.set_cache(**cache_config)
+
+
+def get_increments(counters, start):
+    """
+    Return the increments of the counters of the worker problem since ``counters`` were taken, with the wall time since
+    ``start`` as ``eval_time``.
+    """
+    increments = {key: value - counters[key] for key, value in WORKER.problem.get_counters().items()}
+    increments["eval_time"] = time.perf_counter() - start
+    return increments
+
+
+def evaluate_chunk(X):
+    """
+    Compute the objective and constraint values of a chunk of the population in a worker.
+
+    Returns
+    -------
+    (list_objs, list_cons, increments) : tuple
+        The objective values, the constraint values and the increments of the counters of the worker problem
+        (``n_fe``, ``n_saved``, ``n_hits`` and the wall time of the chunk as ``eval_time``)
+    """
+    counters, start = WORKER.problem.get_counters(), time.perf_counter()
+    list_objs, list_cons, _ = WORKER.problem.evaluate_full_batch(X)
+    return list_objs, list_cons, get_increments(counters, start)
+
+
+def evaluate_shared_chunk(blocks, start, stop):
+    """
+    Evaluate the rows ``start:stop`` of the shared population block in a worker process and write the objective and
+    constraint values into the shared result blocks.
+
+    Parameters
+    ----------
+    blocks : tuple
+        The ``(name, shape)`` of the population, objectives and constraints blocks
+
+    Returns
+    -------
+    increments : dict
+        The increments of the counters of the worker problem, see ``evaluate_chunk``
+    """
+    counters, t_start = WORKER.problem.get_counters(), time.perf_counter()
+    release_worker_arrays([name for name, _ in blocks])
+    pop, objs, cons = [get_worker_array(name, shape) for name, shape in blocks]
+    objs[start:stop], cons[start:stop], _ = WORKER.problem.evaluate_full_batch(pop[start:stop])
+    return get_increments(counters, t_start)
+
+
+def get_cache_config(problem):
+    """
+    Return the arguments of ``set_cache`` that give a worker problem the same kind of cache as ``problem``, or None.
+    """
+    cache = problem.cache
+    if cache is None:
+        return None
+    return {"maxsize": cache.maxsize, "count_hits": problem.count_hits,
+            "path": cache.path if isinstance(cache, DiskCache) else None}
+
+
+def shutdown_executor(executor, futures=()):
+    """
+    Cancel the futures that are not running yet, then shut down the executor and wait for the running ones
+    (the ``cancel_futures`` argument of ``Executor.shutdown`` needs Python 3.9).
+    """
+    for future in list(futures):
+        future.cancel()
+    executor.shutdown(wait=True)
+
+
+def create_executor(problem, backend="process", n_workers=None, mp_context=None):
+    """
+    Start a pool of warm workers, each with its own copy of the problem built from ``problem.to_spec()``. The penalty
+    function is left to the caller, the workers only compute the objectives and constraints with ``evaluate_chunk``
+    or ``evaluate_shared_chunk``.
+
+    Parameters
+    ----------
+    problem : Engineer
+        The problem to evaluate
+    backend : str
+        "process" or "thread"
+    n_workers : int, optional
+        The number of workers, default is the number of CPUs
+    mp_context : multiprocessing.context.BaseContext, optional
+        The multiprocessing context of a pool of processes
+
+    Returns
+    -------
+    executor : concurrent.futures.Executor
+        The pool of workers
+    """
+    spec = problem.to_spec()
+    spec["penalty"] = "static"
+    initargs = (spec, get_cache_config(problem))
+    if backend == "thread":
+        return ThreadPoolExecutor(max_workers=n_workers, initializer=initialize_worker, initargs=initargs)
+    return ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context, initializer=initialize_worker, initargs=initargs)
+
+
+class AsyncRunner:
+    """
+    Run the evaluations of a problem in an executor for asyncio code, see ``Engineer.set_executor``.
+
+    With the "thread" executor (or a given ``concurrent.futures.Executor``), the threads evaluate the problem itself,
+    which should be in thread-safe mode (see ``Engineer.set_thread_safe``), otherwise a ``ValueError`` is raised. With
+    the "process" executor, warm worker processes compute the objectives and constraints with their own copies of the
+    problem, and the counters and the penalty are handled in the calling process as in ``ParallelEvaluator``. At most
+    ``max_concurrency`` evaluations of an event loop are in the executor at once, the next ``await`` calls wait for a
+    free slot, so the producers are slowed down to the pace of the workers.
+
+    Parameters
+    ----------
+    problem : Engineer
+        The problem to evaluate
+    executor : str, concurrent.futures.Executor
+        "thread", "process" or an executor whose workers can call the methods of ``problem``
+    max_workers : int, optional
+        The number of workers of a new executor, default is the number of CPUs
+    max_concurrency : int, optional
+        The maximum number of evaluations in the executor, default is twice the number of workers
+    """
+
+    EXECUTORS = ("thread", "process")
+
+    def __init__(self, problem, executor="thread", max_workers=None, max_concurrency=None):
+        self.problem = problem
+        max_workers = (os.cpu_count() or 1) if max_workers is None else check_int("max_workers", max_workers, [1, 1024])
+        if max_concurrency is None:
+            self.max_concurrency = 2 * max_workers
+        else:
+            self.max_concurrency = check_int("max_concurrency", max_concurrency, [1, float("inf")])
+        self.own_executor = isinstance(executor, str)
+        self.backend = check_str("executor", executor, self.EXECUTORS) if self.own_executor else "thread"
+        if self.backend == "thread" and not problem.thread_safe:
+            raise ValueError("The problem should be in thread-safe mode to be evaluated by threads, "
+                             "call problem.set_thread_safe() first or use the 'process' executor.")
+        if not self.own_executor:
+            self.executor = executor
+        elif self.backend == "process":
+            self.executor = create_executor(problem, "process", max_workers)
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._futures = set()
+
+    def get_semaphore(self):
+        """
+        Return the semaphore that bounds the evaluations of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def run(self, func, *args):
+        """
+        Run ``func(*args)`` in the executor once a slot is free.
+        """
+        async with self.get_semaphore():
+            future = self.executor.submit(func, *args)
+            self._futures.add(future)
+            future.add_done_callback(self._futures.discard)
+            return await asyncio.wrap_future(future)
+
+    async def evaluate_full(self, x):
+        """
+        Evaluate a solution, see ``Engineer.evaluate_full``.
+        """
+        if self.backend == "thread":
+            return await self.run(self.problem.evaluate_full, x)
+        self.problem.check_solution(x)
+        list_objs, list_cons = await self.run_chunk(np.asarray(x, dtype=float)[None, :])
+        with self.problem.get_penalty_lock():
+            return list_objs[0], list_cons[0], self.problem.f_penalty(list_objs[0], list_cons[0])
+
+    async def evaluate_full_batch(self, X):
+        """
+        Evaluate a population, see ``Engineer.evaluate_full_batch``.
+        """
+        if self.backend == "thread":
+            return await self.run(self.problem.evaluate_full_batch, X)
+        list_objs, list_cons = await self.run_chunk(self.problem.check_population(X))
+        return list_objs, list_cons, self.problem.get_penalty_batch(list_objs, list_cons)
+
+    async def run_chunk(self, X):
+        """
+        Compute the objectives and constraints of a population in a worker process and add the counters of the worker.
+        The budget of the problem (see ``Engineer.set_budget``) is checked before and updated after.
+        """
+        budget = self.problem.budget
+        if budget is not None and budget.stop(self.problem, X.shape[0]):
+            return self.problem.get_stop_values(X.shape[0])[:2]
+        list_objs, list_cons, increments = await self.run(evaluate_chunk, X)
+        self.problem.add_counters(increments)
+        if budget is not None:
+            budget.observe(self.problem, X, list_objs, list_cons)
+        return list_objs, list_cons
+
+    def close(self):
+        """
+        Cancel the evaluations that are not running yet and shut down the executor, if it was created by the runner.
+        """
+        if self.own_executor:
+            shutdown_executor(self.executor, self._futures)
+
+
+class ParallelEvaluator:
+    """
+    Evaluate populations of a problem with a pool of worker processes (or threads).
+
+    Each worker builds its own copy of the problem once, at startup, from ``problem.to_spec()``. With processes, the population
+    is written into a block of shared memory of shape (n_pop, n_dims), and the workers write their objectives and
+    constraints in place into shared blocks of shape (n_pop, n_objs) and (n_pop, n_cons), so a task is only a pair of row
+    indices and nothing is serialized per population. The blocks are reused across populations and reallocated only
+    when a larger population comes. The workers compute the objectives and constraints (including
+    ``amend_position`` and in-chunk deduplication), and the penalty function of ``problem`` is applied in the parent
+    process to the whole population. A persistent cache of the problem (``set_cache(path=...)``) is opened by every worker,
+    an in-memory one is created in each worker with the same size. The workers keep the configuration the problem had when
+    the pool started; call ``close()`` after changing it. The budget of ``problem`` (see ``Engineer.set_budget``) is
+    checked in the parent process before each population.
+
+    Each chunk returns the increments of the counters of its worker problem (``n_fe``, ``n_saved``, ``n_hits`` and its wall
+    time as ``eval_time``), which are added to ``problem`` with ``add_counters``. So ``problem.n_fe`` counts the real
+    evaluations made by the workers, as if the population had been evaluated by ``problem.evaluate_full_batch``.
+
+    Parameters
+    ----------
+    problem : Engineer
+        The problem to evaluate
+    n_workers : int, optional
+        The number of worker processes, default is the number of CPUs
+    chunk_size : int, optional
+        The number of solutions sent to a worker at once. By default, it is tuned after each population so that a chunk
+        takes about ``target_time`` seconds, with at least one chunk per worker
+    target_time : float
+        The target wall time of a chunk in seconds, used when ``chunk_size`` is None
+    mp_context : multiprocessing.context.BaseContext, optional
+        The multiprocessing context of the pool
+    shared_memory : bool
+        Whether to exchange the population and the results through shared memory, otherwise the chunks are pickled.
+        Only used by the "process" backend, and only on Python 3.8+ (``multiprocessing.shared_memory``)
+    backend : str
+        "process" for a pool of processes, or "thread" for a pool of threads (for kernels that release the GIL)
+
+    Examples
+    --------
+    >>> from enoppy.paper_based.moeosma_2023 import SpringProblem
+    >>> from enoppy.parallel import ParallelEvaluator
+    >>>
+    >>> problem = SpringProblem()
+    >>> with ParallelEvaluator(problem, n_workers=4) as evaluator:
+    >>>     pop = np.random.uniform(problem.lb, problem.ub, (1000, problem.n_dims))
+    >>>     fits = evaluator.evaluate_batch(pop)
+    """
+
+    BACKENDS = ("process", "thread")
+
+    def __init__(self, problem, n_workers=None, chunk_size=None, target_time=0.05, mp_context=None, shared_memory=True,
+                 backend="process"):
+        self.problem = problem
+        self.n_workers = (os.cpu_count() or 1) if n_workers is None else check_int("n_workers", n_workers, [1, 1024])
+        self.chunk_size = None if chunk_size is None else check_int("chunk_size", chunk_size, [1, float("inf")])
+        self.target_time = check_float("target_time", target_time, (0, float("inf")))
+        self.mp_context = mp_context
+        self.shared_memory = shared_memory and HAS_SHARED_MEMORY
+        self.backend = check_str("backend", backend, self.BACKENDS)
+        self.row_time = None
+        self.executor = None
+        self.buffers = None
+        self._futures = []
+
+    def get_executor(self):
+        """
+        Return the pool of warm workers, starting it if needed.
+        """
+        if self.executor is None:
+            self.executor = create_executor(self.problem, self.backend, self.n_workers, self.mp_context)
+        return self.executor
+
+    def get_chunk_size(self, n_pop):
+        """
+        Return the chunk size for a population of ``n_pop`` solutions.
+        """
+        if self.chunk_size is not None:
+            return self.chunk_size
+        max_size = int(np.ceil(n_pop / self.n_workers))
+        if self.row_time is None:
+            return max(1, int(np.ceil(n_pop / (4 * self.n_workers))))
+        return int(np.clip(self.target_time / max(self.row_time, 1e-9), 1, max(1, max_size)))
+
+    def get_buffers(self, n_pop):
+        """
+        Return the shared population, objectives and constraints blocks, with room for at least ``n_pop`` solutions.
+        """
+        if self.buffers is None or self.buffers[0].shape[0] < n_pop:
+            self.release_buffers()
+            n_cols = (self.problem.n_dims, self.problem.n_objs, self.problem.n_cons)
+            self.buffers = [SharedArray((n_pop, n_col)) for n_col in n_cols]
+        return self.buffers
+
+    def release_buffers(self):
+        """
+        Unlink the shared blocks.
+        """
+        if self.buffers is not None:
+            for buffer in self.buffers:
+                buffer.close()
+            self.buffers = None
+
+    def run_tasks(self, fn, list_args):
+        """
+        Run the tasks in the pool and return their results in order. If a task fails, the pending ones are cancelled
+        and its exception is raised.
+        """
+        executor = self.get_executor()
+        futures = self._futures = [executor.submit(fn, *args) for args in list_args]
+        try:
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            self.executor = None
+            raise
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            self._futures = []
+
+    def evaluate_full_batch(self, X):
+        """
+        Evaluate a population in the worker processes. The results are in the order of the rows of ``X``.
+
+        Returns
+        -------
+        (list_objs, list_cons, val) : tuple
+            The objective values of shape (n_pop, n_objs), the constraint values of shape (n_pop, n_cons)
+            and the penalized values
+        """
+        X = self.problem.check_population(X)
+        n_pop = X.shape[0]
+        if n_pop == 0:
+            list_objs, list_cons = np.empty((0, self.problem.n_objs)), np.empty((0, self.problem.n_cons))
+            return list_objs, list_cons, self.problem.get_penalty_batch(list_objs, list_cons)
+        budget = self.problem.budget
+        if budget is not None and budget.stop(self.problem, n_pop):
+            return self.problem.get_stop_values(n_pop)
+        size = self.get_chunk_size(n_pop)
+        if self.shared_memory and self.backend == "process":
+            pop, objs, cons = self.get_buffers(n_pop)
+            pop.array[:n_pop] = X
+            blocks = tuple((buffer.name, buffer.shape) for buffer in (pop, objs, cons))
+            list_args = [(blocks, idx, min(idx + size, n_pop)) for idx in range(0, n_pop, size)]
+            list_increments = self.run_tasks(evaluate_shared_chunk, list_args)
+            list_objs, list_cons = objs.array[:n_pop].copy(), cons.array[:n_pop].copy()
+        else:
+            results = self.run_tasks(evaluate_chunk, [(X[idx:idx + size], ) for idx in range(0, n_pop, size)])
+            list_objs = np.concatenate([res[0] for res in results])
+            list_cons = np.concatenate([res[1] for res in results])
+            list_increments = [res[2] for res in results]
+        for increments in list_increments:
+            self.problem.add_counters(increments)
+        if budget is not None:
+            budget.observe(self.problem, X, list_objs, list_cons)
+        self.row_time = sum(increments["eval_time"] for increments in list_increments) / n_pop
+        return list_objs, list_cons, self.problem.get_penalty_batch(list_objs, list_cons)
+
+    def evaluate_batch(self, X):
+        """
+        Evaluate a population in the worker processes, see ``Engineer.evaluate_batch``.
+        """
+        return self.evaluate_full_batch(X)[2]
+
+    def close(self):
+        """
+        Shut down the workers and unlink the shared blocks.
+        """
+        if self.executor is not None:
+            shutdown_executor(self.executor, self._futures)
+            self.executor = None
+        self.release_buffers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SteadyStateEvaluator:
+    """
+    Evaluate candidates asynchronously, one task per candidate, and return the results in the order they complete.
+
+    This is the ask/tell pattern of steady-state algorithms: ``submit`` a candidate as soon as it is created, and get the
+    finished ones with ``next_result`` (or iterate over ``as_completed``) with their ids. The tasks wait in the queue of the
+    pool, so no worker is idle while candidates are pending, even when the evaluation times vary. The warm workers (see
+    ``create_executor``) compute the objectives and constraints; the penalty function of ``problem`` is applied and the
+    counters of the workers are added to ``problem`` when a result is returned. The budget of ``problem`` (see
+    ``Engineer.set_budget``) is checked by ``submit``, counting the candidates that are still running, and a stopped
+    candidate gets the infinite values of ``on_stop="inf"`` as its result.
+
+    Parameters
+    ----------
+    problem : Engineer
+        The problem to evaluate
+    n_workers : int, optional
+        The number of workers, default is the number of CPUs
+    backend : str
+        "process" or "thread"
+    mp_context : multiprocessing.context.BaseContext, optional
+        The multiprocessing context of a pool of processes
+
+    Examples
+    --------
+    >>> with SteadyStateEvaluator(problem, n_workers=4) as evaluator:
+    >>>     for x in pop:
+    >>>         evaluator.submit(x)
+    >>>     for _ in range(1000):
+    >>>         idx, list_objs, list_cons, fit = evaluator.next_result()
+    >>>         evaluator.submit(make_child(idx, fit))
+    """
+
+    def __init__(self, problem, n_workers=None, backend="process", mp_context=None):
+        self.problem = problem
+        self.n_workers = (os.cpu_count() or 1) if n_workers is None else check_int("n_workers", n_workers, [1, 1024])
+        self.backend = check_str("backend", backend, ParallelEvaluator.BACKENDS)
+        self.executor = create_executor(problem, self.backend, self.n_workers, mp_context)
+        self.pending = {}
+        self.n_running = 0
+        self._inputs = {}
+        self._done = queue.Queue()
+        self._ids = itertools.count()
+
+    @property
+    def n_pending(self):
+        """
+        The number of submitted candidates whose result has not been returned yet.
+        """
+        return len(self.pending)
+
+    def submit(self, x, idx=None):
+        """
+        Queue a candidate for evaluation.
+
+        Parameters
+        ----------
+        x : np.ndarray, list, tuple
+            The candidate, a vector of length ``n_dims``
+        idx : hashable, optional
+            The id of the candidate, default is the next integer
+
+        Returns
+        -------
+        idx : hashable
+            The id of the candidate
+        """
+        self.problem.check_solution(x)
+        idx = next(self._ids) if idx is None else idx
+        if idx in self.pending:
+            raise ValueError(f"The candidate {idx} is already pending.")
+        x = np.array(x, dtype=float)
+        budget = self.problem.budget
+        if budget is not None and budget.stop(self.problem, 1, self.n_running):
+            future = Future()
+            future.set_result(self.problem.get_stop_values(1)[:2] + (None, ))
+        else:
+            future = self.executor.submit(evaluate_chunk, x[None, :])
+            self.n_running += 1
+        self.pending[idx] = future
+        self._inputs[idx] = x
+        future.add_done_callback(lambda _: self._done.put(idx))
+        return idx
+
+    def submit_many(self, X, ids=None):
+        """
+        Queue a population of candidates, see ``submit``.
+
+        Returns
+        -------
+        ids : list
+            The ids of the candidates
+        """
+        X = self.problem.check_population(X)
+        ids = [None] * len(X) if ids is None else list(ids)
+        return [self.submit(x, idx) for x, idx in zip(X, ids)]
+
+    def cancel(self, idx):
+        """
+        Cancel a pending candidate. A candidate that is already running can not be cancelled.
+
+        Returns
+        -------
+        cancelled : bool
+            Whether the candidate was cancelled
+        """
+        future = self.pending.get(idx)
+        if future is not None and future.cancel():
+            del self.pending[idx]
+            del self._inputs[idx]
+            self.n_running -= 1
+            return True
+        return False
+
+    def cancel_all(self):
+        """
+        Cancel all the candidates that are not running yet.
+
+        Returns
+        -------
+        ids : list
+            The ids of the cancelled candidates
+        """
+        return [idx for idx in list(self.pending) if self.cancel(idx)]
+
+    def next_result(self, timeout=None):
+        """
+        Wait for the next finished candidate. If its evaluation failed, its exception is raised.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait, default is to wait until a candidate finishes
+
+        Returns
+        -------
+        (idx, list_objs, list_cons, val) : tuple
+            The id of the candidate, its objective and constraint values and its penalized values
+        """
+        if len(self.pending) == 0:
+            raise ValueError("There is no pending candidate.")
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            try:
+                idx = self._done.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError(f"No candidate finished within {timeout} seconds.") from None
+            future = self.pending.get(idx)
+            if future is not None and future.done() and not future.cancelled():
+                break
+        del self.pending[idx]
+        x = self._inputs.pop(idx)
+        try:
+            list_objs, list_cons, increments = future.result()
+        except BaseException:
+            self.n_running -= 1
+            raise
+        if increments is not None:
+            self.n_running -= 1
+            n_fe_before = self.problem.n_fe
+            self.problem.add_counters(increments)
+            if self.problem.budget is not None:
+                self.problem.budget.observe(self.problem, x[None, :], list_objs, list_cons, n_fe_before)
+        with self.problem.get_penalty_lock():
+            return idx, list_objs[0], list_cons[0], self.problem.f_penalty(list_objs[0], list_cons[0])
+
+    def as_completed(self, timeout=None):
+        """
+        Yield the results of all pending candidates, including the ones submitted during the iteration, in the order they
+        finish, see ``next_result``.
+        """
+        while len(self.pending) > 0:
+            yield self.next_result(timeout)
+
+    def close(self):
+        """
+        Cancel the pending candidates and shut down the workers.
+        """
+        self.cancel_all()
+        shutdown_executor(self.executor, self.pending.values())
+        self.pending.clear()
+        self._inputs.clear()
+        self.n_running = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,492 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 15:20, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import json
+import time
+import queue
+import socket
+import struct
+import argparse
+import importlib
+import threading
+import socketserver
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from enoppy.engineer import Engineer
+from enoppy.utils.spec import get_fingerprint
+from enoppy.utils.budget import BudgetExhaustedError
+from enoppy.utils.validator import check_int
+from enoppy.paper_based import ihaoavoa_2022, moeosma_2023, pdo_2022, rwco_2020  # noqa: F401, the problems the server can host
+
+PREFIX = struct.Struct("!IQ")
+MAX_MESSAGE_SIZE = 2**28
+
+
+def send_message(sock, header, arrays=()):
+    """
+    Send a message: an 12-byte prefix with the lengths of the header and of the body, a JSON header, and a body made of
+    the raw bytes of the arrays, whose dtypes and shapes are listed in the header.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        The connected socket
+    header : dict
+        The JSON-serializable header
+    arrays : list, tuple
+        The NumPy arrays of the body
+    """
+    arrays = [np.ascontiguousarray(arr) for arr in arrays]
+    header = dict(header, arrays=[[arr.dtype.str, list(arr.shape)] for arr in arrays])
+    head = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    sock.sendall(PREFIX.pack(len(head), sum(arr.nbytes for arr in arrays)) + head)
+    for arr in arrays:
+        if arr.nbytes > 0:
+            sock.sendall(memoryview(arr).cast("B"))
+
+
+def recv_exact(sock, size):
+    """
+    Receive exactly ``size`` bytes, or raise ConnectionError if the peer closes the connection.
+    """
+    buffer = bytearray(size)
+    view, n_read = memoryview(buffer), 0
+    while n_read < size:
+        n_bytes = sock.recv_into(view[n_read:])
+        if n_bytes == 0:
+            raise ConnectionError("The connection was closed by the peer.")
+        n_read += n_bytes
+    return buffer
+
+
+def recv_message(sock, max_size=None):
+    """
+    Receive a message sent by ``send_message``.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        The connected socket
+    max_size : int, optional
+        The maximum size in bytes of the header and of the body, checked before they are received. A larger or malformed
+        message raises ConnectionError, since the rest of the stream can not be trusted either
+
+    Returns
+    -------
+    (header, arrays) : tuple
+        The header and the list of arrays, which are views of the received body
+    """
+    head_size, body_size = PREFIX.unpack(recv_exact(sock, PREFIX.size))
+    if max_size is not None and (head_size > max_size or body_size > max_size):
+        raise ConnectionError(f"The message is larger than {max_size} bytes.")
+    try:
+        header = json.loads(recv_exact(sock, head_size).decode("utf-8"))
+        body = recv_exact(sock, body_size)
+        arrays, offset = [], 0
+        for dtype, shape in header.pop("arrays"):
+            dtype = np.dtype(dtype)
+            if dtype.kind not in "biuf":
+                raise ValueError(f"The dtype '{dtype}' is not numeric.")
+            count = int(np.prod(shape))
+            arrays.append(np.frombuffer(body, dtype=dtype, count=count, offset=offset).reshape(shape))
+            offset += count * dtype.itemsize
+    except (ValueError, TypeError, KeyError, AttributeError) as error:
+        raise ConnectionError(f"The message is malformed: {error}") from error
+    return header, arrays
+
+
+def get_problem_spec(problem):
+    """
+    Return the spec of a problem hosted by a server: its ``to_spec()`` with the default penalty, since the penalty is
+    applied by the client. ``problem`` can also be the ``"module:Class"`` path of a problem class.
+    """
+    if isinstance(problem, str):
+        return {"class": problem, "penalty": "static", "attrs": {}}
+    spec = problem.to_spec()
+    spec["penalty"] = "static"
+    return spec
+
+
+class EvaluationHandler(socketserver.BaseRequestHandler):
+    """
+    Serve the requests of one connection, in order, so a client can pipeline them. Each connection builds its own copies
+    of the hosted problems, so the counters returned with each batch are exact.
+    """
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.problems = {}
+
+    def get_problem(self, key):
+        if key not in self.problems:
+            with self.server.lock:
+                spec = self.server.specs.get(key)
+            if spec is None:
+                raise KeyError(f"The problem {key} is not registered.")
+            self.problems[key] = Engineer.from_spec(spec, trusted=False)
+        return self.problems[key]
+
+    def handle(self):
+        while True:
+            try:
+                header, arrays = recv_message(self.request, self.server.max_message_size)
+            except (ConnectionError, OSError):
+                return
+            try:
+                response, arrays = self.process(header, arrays)
+            except Exception as error:
+                response, arrays = {"error": str(error), "type": type(error).__name__}, ()
+                if isinstance(error, BudgetExhaustedError):
+                    response["reason"] = error.reason
+            response["id"] = header.get("id")
+            try:
+                send_message(self.request, response, arrays)
+            except OSError:
+                return
+
+    def process(self, header, arrays):
+        op = header.get("op")
+        if op == "register":
+            return {"key": self.server.register(header["spec"])}, ()
+        if op == "evaluate":
+            problem = self.get_problem(header["key"])
+            ledger, run_id, n_pop = self.server.ledger, header.get("run"), len(arrays[0])
+            if ledger is not None:
+                delay = ledger.charge(run_id, n_pop)
+                if delay > 0:
+                    time.sleep(delay)
+            counters, start = problem.get_counters(), time.perf_counter()
+            try:
+                list_objs, list_cons, _ = problem.evaluate_full_batch(arrays[0])
+            except Exception:
+                if ledger is not None:
+                    ledger.refund(run_id, n_pop)
+                raise
+            increments = {key: value - counters[key] for key, value in problem.get_counters().items()}
+            increments["eval_time"] = time.perf_counter() - start
+            if ledger is not None and increments["n_fe"] < n_pop:
+                ledger.refund(run_id, n_pop - increments["n_fe"])
+            return {"counters": increments}, (np.asarray(list_objs, dtype=float), np.asarray(list_cons, dtype=float))
+        if op == "budget":
+            return {"budget": None if self.server.ledger is None else self.server.ledger.snapshot(header.get("run"))}, ()
+        if op == "ping":
+            return {}, ()
+        raise ValueError(f"Unknown operation '{op}'.")
+
+
+class EvaluationServer(socketserver.ThreadingTCPServer):
+    """
+    A TCP server that hosts problems and evaluates batches of solutions for ``EvaluationClient``.
+
+    A problem is registered from its spec (see ``Engineer.to_spec``), read as untrusted: only the ``Engineer`` subclasses
+    of the modules imported by the server are accepted (``enoppy.paper_based``, and the ``--module`` options of the
+    command line), with plain numeric attributes and the static penalty (the penalty is applied by the client), see
+    ``Engineer.from_spec``. The messages are length-prefixed: a small JSON header and the raw bytes of the NumPy arrays
+    (the population, the objectives and the constraints). Each connection is served by its own thread. The server does
+    not authenticate the clients, so bind it to localhost or to a trusted network only. Larger messages than
+    ``max_message_size`` close the connection.
+
+    With a ``ledger``, each evaluation request is charged to the run id sent by the client before the kernels run: a
+    request that would overrun the budget of its run gets a budget-exhausted error instead of being evaluated, and the
+    rate limit of the run delays it. The evaluations saved by the cache or the deduplication are refunded.
+
+    Parameters
+    ----------
+    host : str
+        The host to bind
+    port : int
+        The port to bind, 0 for a free port (see ``address``)
+    ledger : BudgetLedger, optional
+        The budgets of the runs, see :class:`enoppy.utils.budget.BudgetLedger`
+    max_message_size : int
+        The maximum size in bytes of the header and of the body of a request, default is 256 MiB
+
+    Examples
+    --------
+    >>> server = EvaluationServer("127.0.0.1", 5000).start()       # or: python -m enoppy.server --port 5000
+    >>> server.close()
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=0, ledger=None, max_message_size=MAX_MESSAGE_SIZE):
+        self.max_message_size = check_int("max_message_size", max_message_size, [1, float("inf")])
+        super().__init__((host, check_int("port", port, [0, 65535])), EvaluationHandler)
+        self.ledger = ledger
+        self.specs = {}
+        self.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def address(self):
+        return self.server_address[:2]
+
+    def register(self, spec):
+        """
+        Host a problem and return its key, the fingerprint of its spec. The spec is checked by building the problem, with
+        the static penalty whatever the spec says.
+        """
+        if not isinstance(spec, dict) or not isinstance(spec.get("attrs", {}), dict):
+            raise ValueError("The spec should be a dict with the 'class' and 'attrs' keys.")
+        spec = {"class": spec.get("class"), "penalty": "static", "attrs": spec.get("attrs", {})}
+        Engineer.from_spec(spec, trusted=False)
+        key = get_fingerprint(spec)
+        with self.lock:
+            self.specs[key] = spec
+        return key
+
+    def start(self):
+        """
+        Serve the requests in a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="EvaluationServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """
+        Stop serving and close the listening socket.
+        """
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    A pool of connections to one server, opened on demand, up to ``size`` at once.
+    """
+
+    def __init__(self, address, size=2, timeout=None):
+        self.address = tuple(address)
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+
+    def acquire(self):
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            sock = socket.create_connection(self.address, timeout=self.timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def release(self, sock, broken=False):
+        if broken:
+            sock.close()
+        else:
+            self._idle.put(sock)
+        self._slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class EvaluationClient:
+    """
+    Evaluate populations on one or several ``EvaluationServer``.
+
+    The population is split into chunks of ``chunk_size`` solutions, dealt round-robin to the servers (sharding) and to
+    up to ``pool_size`` connections per server. Each connection sends up to ``max_pipeline`` requests before it waits for
+    their responses. The servers compute the objectives and constraints; the penalty function of the problem is applied,
+    and the counters of the servers (``n_fe``, ``n_saved``, ``n_hits``, ``eval_time``) are added to the problem, on the
+    client side.
+
+    Parameters
+    ----------
+    addresses : list
+        The ``(host, port)`` of the servers
+    pool_size : int
+        The maximum number of connections per server
+    chunk_size : int
+        The number of solutions per request
+    max_pipeline : int
+        The maximum number of requests in flight per connection
+    timeout : float, optional
+        The socket timeout in seconds
+
+    Examples
+    --------
+    >>> client = EvaluationClient([("127.0.0.1", 5000), ("127.0.0.1", 5001)])
+    >>> list_objs, list_cons, list_fits = client.evaluate_full_batch(problem, pop)
+    >>> client.close()
+    """
+
+    def __init__(self, addresses, pool_size=2, chunk_size=1024, max_pipeline=4, timeout=None):
+        if len(addresses) == 0:
+            raise ValueError("At least one server address is needed.")
+        self.pool_size = check_int("pool_size", pool_size, [1, 1024])
+        self.chunk_size = check_int("chunk_size", chunk_size, [1, float("inf")])
+        self.max_pipeline = check_int("max_pipeline", max_pipeline, [1, 1024])
+        self.pools = [ConnectionPool(address, self.pool_size, timeout) for address in addresses]
+        self.executor = ThreadPoolExecutor(max_workers=len(self.pools) * self.pool_size)
+        self.keys = {}
+
+    def call(self, pool, header, arrays=()):
+        """
+        Send one request to a server and return its response.
+        """
+        return self.pipeline(pool, [(header, arrays)])[0]
+
+    def pipeline(self, pool, requests):
+        """
+        Send requests on one connection of ``pool``, with up to ``max_pipeline`` of them in flight, and return the
+        responses in order.
+        """
+        sock = pool.acquire()
+        responses, n_sent = [], 0
+        try:
+            while len(responses) < len(requests):
+                while n_sent < len(requests) and n_sent - len(responses) < self.max_pipeline:
+                    header, arrays = requests[n_sent]
+                    send_message(sock, dict(header, id=n_sent), arrays)
+                    n_sent += 1
+                responses.append(recv_message(sock))
+        except BaseException:
+            pool.release(sock, broken=True)
+            raise
+        pool.release(sock)
+        for header, _ in responses:
+            if "error" in header:
+                message = f"{pool.address}: {header['error']}"
+                if header["type"] == "BudgetExhaustedError":
+                    raise BudgetExhaustedError(message, requests[header["id"]][0].get("run"), header["reason"])
+                error_type = {"ValueError": ValueError, "KeyError": KeyError}.get(header["type"], RuntimeError)
+                raise error_type(message)
+        return responses
+
+    def register(self, problem):
+        """
+        Host a problem on all servers and return its key.
+        """
+        return [self.get_key(pool, problem, refresh=True) for pool in self.pools][0]
+
+    def get_key(self, pool, problem, refresh=False):
+        """
+        Return the key of a problem on a server, registering it if needed.
+        """
+        spec = get_problem_spec(problem)
+        if refresh or (pool.address, get_fingerprint(spec)) not in self.keys:
+            self.keys[(pool.address, get_fingerprint(spec))] = self.call(pool, {"op": "register", "spec": spec})[0]["key"]
+        return self.keys[(pool.address, get_fingerprint(spec))]
+
+    def evaluate_chunks(self, pool, problem, chunks, run_id=None):
+        """
+        Evaluate chunks of a population on one connection of a server. If the server does not know the problem (e.g. it
+        was restarted), the problem is registered again.
+        """
+        try:
+            key = self.get_key(pool, problem)
+            return self.pipeline(pool, [({"op": "evaluate", "key": key, "run": run_id}, (chunk, )) for chunk in chunks])
+        except KeyError:
+            key = self.get_key(pool, problem, refresh=True)
+            return self.pipeline(pool, [({"op": "evaluate", "key": key, "run": run_id}, (chunk, )) for chunk in chunks])
+
+    def get_budget(self, run_id=None):
+        """
+        Return the budget snapshot of a run (or of all runs) on each server, None for a server without a ledger.
+        """
+        return [self.call(pool, {"op": "budget", "run": run_id})[0]["budget"] for pool in self.pools]
+
+    def evaluate_full_batch(self, problem, X, run_id=None):
+        """
+        Evaluate a population on the servers, see ``Engineer.evaluate_full_batch``.
+
+        Parameters
+        ----------
+        problem : Engineer
+            The problem, registered on the servers on first use
+        X : np.ndarray, list
+            The population, a 2D-matrix of shape (n_pop, n_dims)
+        run_id : str, int, optional
+            The run charged by the budget ledgers of the servers. If a budget is exhausted, ``BudgetExhaustedError`` is
+            raised (the chunks accepted by other servers are still accounted)
+
+        The budget of the problem (see ``Engineer.set_budget``) is checked on the client before the population is sent.
+
+        Returns
+        -------
+        (list_objs, list_cons, val) : tuple
+            The objective values, the constraint values and the penalized values, in the order of the rows of ``X``
+        """
+        X = problem.check_population(X)
+        budget = problem.budget
+        if budget is not None and budget.stop(problem, X.shape[0]):
+            return problem.get_stop_values(X.shape[0])
+        chunks = [X[idx:idx + self.chunk_size] for idx in range(0, X.shape[0], self.chunk_size)]
+        n_lanes = len(self.pools) * self.pool_size
+        lanes = [list(range(idx, len(chunks), n_lanes)) for idx in range(min(n_lanes, len(chunks)))]
+        futures = [self.executor.submit(self.evaluate_chunks, self.pools[idx % len(self.pools)], problem,
+                                        [chunks[jdx] for jdx in lane], run_id) for idx, lane in enumerate(lanes)]
+        results = [None] * len(chunks)
+        for lane, future in zip(lanes, futures):
+            for jdx, response in zip(lane, future.result()):
+                results[jdx] = response
+        list_objs = np.concatenate([arrays[0] for _, arrays in results]) if results else np.empty((0, problem.n_objs))
+        list_cons = np.concatenate([arrays[1] for _, arrays in results]) if results else np.empty((0, problem.n_cons))
+        for header, _ in results:
+            problem.add_counters(header["counters"])
+        if budget is not None:
+            budget.observe(problem, X, list_objs, list_cons)
+        return list_objs, list_cons, problem.get_penalty_batch(list_objs, list_cons)
+
+    def evaluate_batch(self, problem, X, run_id=None):
+        """
+        Evaluate a population on the servers, see ``Engineer.evaluate_batch``.
+        """
+        return self.evaluate_full_batch(problem, X, run_id)[2]
+
+    def close(self):
+        """
+        Close the connections.
+        """
+        self.executor.shutdown(wait=True)
+        for pool in self.pools:
+            pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve enoppy problem evaluations over TCP.")
+    parser.add_argument("--host", default="127.0.0.1", help="the host to bind")
+    parser.add_argument("--port", type=int, default=5000, help="the port to bind")
+    parser.add_argument("--max-message-size", type=int, default=MAX_MESSAGE_SIZE, help="the maximum size of a request in bytes")
+    parser.add_argument("--module", action="append", default=[], help="a module of problems to host, besides enoppy.paper_based")
+    args = parser.parse_args()
+    for module in args.module:
+        importlib.import_module(module)
+    with EvaluationServer(args.host, args.port, max_message_size=args.max_message_size) as server:
+        print(f"Serving enoppy evaluations on {server.address[0]}:{server.address[1]}", flush=True)
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
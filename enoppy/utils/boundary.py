@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 19:25, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import numpy as np
+from enoppy.utils.validator import check_str
+
+
+def get_violations(X, lb, ub):
+    """
+    Return the mask of the variables below their lower bound and the mask of those above their upper bound.
+    """
+    return X < lb, X > ub
+
+
+def clip_bounds(X, lb, ub, rng=None):
+    """
+    Move each out-of-bounds variable to the violated bound, in place.
+    """
+    return np.clip(X, lb, ub, out=X)
+
+
+def reflect_bounds(X, lb, ub, rng=None):
+    """
+    Reflect each out-of-bounds variable back into the bounds, as many times as needed, in place.
+    """
+    low, high = get_violations(X, lb, ub)
+    mask = low | high
+    if mask.any():
+        lb, ub = np.broadcast_to(lb, X.shape)[mask], np.broadcast_to(ub, X.shape)[mask]
+        width = ub - lb
+        offset = np.mod(X[mask] - lb, 2 * width)
+        X[mask] = lb + np.where(offset > width, 2 * width - offset, offset)
+    return X
+
+
+def wrap_bounds(X, lb, ub, rng=None):
+    """
+    Wrap each out-of-bounds variable around to the opposite side of the bounds (periodic bounds), in place.
+    """
+    low, high = get_violations(X, lb, ub)
+    mask = low | high
+    if mask.any():
+        lb, ub = np.broadcast_to(lb, X.shape)[mask], np.broadcast_to(ub, X.shape)[mask]
+        X[mask] = lb + np.mod(X[mask] - lb, ub - lb)
+    return X
+
+
+def random_bounds(X, lb, ub, rng=None):
+    """
+    Draw each out-of-bounds variable again, uniformly between its bounds, in place.
+    """
+    low, high = get_violations(X, lb, ub)
+    mask = low | high
+    if mask.any():
+        rng = np.random.default_rng() if rng is None else rng
+        X[mask] = rng.uniform(np.broadcast_to(lb, X.shape)[mask], np.broadcast_to(ub, X.shape)[mask])
+    return X
+
+
+def midpoint_bounds(X, lb, ub, rng=None):
+    """
+    Move each out-of-bounds variable halfway between the violated bound and the center of the bounds, in place.
+    """
+    low, high = get_violations(X, lb, ub)
+    if low.any() or high.any():
+        lb, ub = np.broadcast_to(lb, X.shape), np.broadcast_to(ub, X.shape)
+        X[low] = (3 * lb[low] + ub[low]) / 4
+        X[high] = (lb[high] + 3 * ub[high]) / 4
+    return X
+
+
+BOUND_HANDLERS = {
+    "clip": clip_bounds,
+    "reflect": reflect_bounds,
+    "wrap": wrap_bounds,
+    "random": random_bounds,
+    "midpoint": midpoint_bounds,
+}
+
+
+def repair_bounds(X, lb, ub, method="clip", rng=None):
+    """
+    Repair the out-of-bounds variables of a solution or a population, in place.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        A float solution of shape (n_dims,) or a float population of shape (n_pop, n_dims)
+    lb : np.ndarray
+        The lower bounds, of shape (n_dims,)
+    ub : np.ndarray
+        The upper bounds, of shape (n_dims,)
+    method : str
+        One of "clip", "reflect", "wrap", "random", "midpoint"
+    rng : np.random.Generator, optional
+        The random generator of the "random" method
+
+    Returns
+    -------
+    X : np.ndarray
+        The same array, repaired
+    """
+    method = check_str("bound_handling", method, list(BOUND_HANDLERS.keys()))
+    return BOUND_HANDLERS[method](X, lb, ub, rng)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 16:30, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import time
+import threading
+import numpy as np
+from enoppy.utils.validator import check_int, check_float, check_bool, check_str
+
+
+class BudgetExhaustedError(RuntimeError):
+    """
+    Raised when an evaluation would overrun a budget.
+
+    Attributes
+    ----------
+    run_id : hashable
+        The id of the run
+    reason : str
+        "max_fe", "max_time" or "target"
+    """
+
+    def __init__(self, message, run_id=None, reason=None):
+        super().__init__(message)
+        self.run_id = run_id
+        self.reason = reason
+
+
+class BudgetLedger:
+    """
+    Account and enforce the evaluation budgets of several runs sharing the same problems (e.g. on an evaluation server).
+
+    Each run id has an account with an optional hard cap on the number of function evaluations (``max_fe``), an optional
+    cap on the wall time since the account was opened (``max_time``) and an optional rate limit (a token bucket of
+    ``rate`` evaluations per second, with ``burst`` evaluations of capacity). ``charge`` is called before the kernels run:
+    it rejects the whole request with ``BudgetExhaustedError`` when a cap would be overrun, otherwise it books the
+    evaluations and returns the time the caller should wait to respect the rate limit. All operations are O(1) and
+    thread-safe. An unknown run id gets an account with the default limits on first use.
+
+    Parameters
+    ----------
+    max_fe : int, optional
+        The default cap on the evaluations of a run
+    max_time : float, optional
+        The default cap on the wall time of a run, in seconds
+    rate : float, optional
+        The default rate limit of a run, in evaluations per second
+    burst : int, optional
+        The default capacity of the token bucket, default is one second of ``rate``
+
+    Examples
+    --------
+    >>> ledger = BudgetLedger()
+    >>> ledger.open("run-1", max_fe=10000, max_time=3600)
+    >>> delay = ledger.charge("run-1", 50)     # raises BudgetExhaustedError if it would overrun the budget
+    >>> ledger.snapshot("run-1")["n_fe"]
+    50
+    """
+
+    def __init__(self, max_fe=None, max_time=None, rate=None, burst=None):
+        self.defaults = self.check_limits(max_fe, max_time, rate, burst)
+        self.accounts = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def check_limits(max_fe=None, max_time=None, rate=None, burst=None):
+        rate = None if rate is None else check_float("rate", rate, (0, float("inf")))
+        if burst is not None:
+            burst = check_float("burst", burst, [1, float("inf")])
+        elif rate is not None:
+            burst = max(rate, 1.)
+        return {"max_fe": None if max_fe is None else check_int("max_fe", max_fe, [0, float("inf")]),
+                "max_time": None if max_time is None else check_float("max_time", max_time, (0, float("inf"))),
+                "rate": rate, "burst": burst}
+
+    def open(self, run_id, max_fe=None, max_time=None, rate=None, burst=None):
+        """
+        Open (or reset) the account of a run with its limits, None for no limit. The wall-time clock starts now.
+        """
+        limits = self.check_limits(max_fe, max_time, rate, burst)
+        with self._lock:
+            self.accounts[run_id] = self.create_account(limits)
+
+    @staticmethod
+    def create_account(limits):
+        now = time.monotonic()
+        return {**limits, "n_fe": 0, "n_rejected": 0, "start": now, "tokens": limits["burst"], "updated": now}
+
+    def close(self, run_id):
+        """
+        Remove the account of a run and return its last snapshot.
+        """
+        with self._lock:
+            account = self.accounts.pop(run_id, None)
+        return None if account is None else self.get_snapshot(account)
+
+    def charge(self, run_id, n_fe=1):
+        """
+        Book ``n_fe`` evaluations for a run, before they are computed.
+
+        Parameters
+        ----------
+        run_id : hashable
+            The id of the run
+        n_fe : int
+            The number of evaluations
+
+        Returns
+        -------
+        delay : float
+            The number of seconds to wait before evaluating, to respect the rate limit (0 if there is none)
+
+        Raises
+        ------
+        BudgetExhaustedError
+            If the evaluations would overrun ``max_fe`` or ``max_time``, nothing is booked in that case
+        """
+        with self._lock:
+            account = self.accounts.get(run_id)
+            if account is None:
+                account = self.accounts[run_id] = self.create_account(self.defaults)
+            now = time.monotonic()
+            if account["max_fe"] is not None and account["n_fe"] + n_fe > account["max_fe"]:
+                account["n_rejected"] += n_fe
+                raise BudgetExhaustedError(f"Run {run_id}: the budget of {account['max_fe']} evaluations is exhausted "
+                                           f"({account['max_fe'] - account['n_fe']} left, {n_fe} requested).", run_id, "max_fe")
+            if account["max_time"] is not None and now - account["start"] > account["max_time"]:
+                account["n_rejected"] += n_fe
+                raise BudgetExhaustedError(f"Run {run_id}: the wall-time budget of {account['max_time']} seconds is exhausted.",
+                                           run_id, "max_time")
+            account["n_fe"] += n_fe
+            if account["rate"] is None:
+                return 0.
+            tokens = min(account["burst"], account["tokens"] + (now - account["updated"]) * account["rate"]) - n_fe
+            account["tokens"], account["updated"] = tokens, now
+            return max(0., -tokens / account["rate"])
+
+    def refund(self, run_id, n_fe=1):
+        """
+        Give back evaluations booked by ``charge`` that were not computed (e.g. a failed request, or rows served by a cache).
+        """
+        with self._lock:
+            account = self.accounts.get(run_id)
+            if account is not None:
+                account["n_fe"] = max(0, account["n_fe"] - n_fe)
+                if account["rate"] is not None:
+                    account["tokens"] = min(account["burst"], account["tokens"] + n_fe)
+
+    @staticmethod
+    def get_snapshot(account):
+        elapsed = time.monotonic() - account["start"]
+        remaining = None if account["max_fe"] is None else account["max_fe"] - account["n_fe"]
+        exhausted = remaining == 0 or (account["max_time"] is not None and elapsed > account["max_time"])
+        return {"n_fe": account["n_fe"], "max_fe": account["max_fe"], "remaining_fe": remaining,
+                "elapsed": elapsed, "max_time": account["max_time"], "n_rejected": account["n_rejected"],
+                "rate": account["rate"], "exhausted": exhausted}
+
+    def snapshot(self, run_id=None):
+        """
+        Return the state of the account of a run, or of all runs.
+
+        Returns
+        -------
+        snapshot : dict
+            The keys are "n_fe", "max_fe", "remaining_fe", "elapsed", "max_time", "n_rejected", "rate" and "exhausted",
+            or a dict of those by run id when ``run_id`` is None
+        """
+        with self._lock:
+            if run_id is None:
+                return {key: self.get_snapshot(account) for key, account in self.accounts.items()}
+            account = self.accounts.get(run_id)
+            return None if account is None else self.get_snapshot(account)
+
+
+class TargetReachedError(BudgetExhaustedError):
+    """
+    Raised when an evaluation is requested after the target of an ``EvaluationBudget`` was reached.
+    """
+
+
+class EvaluationBudget:
+    """
+    Stop the evaluations of a problem when its budget is spent or when the target is reached, see ``Engineer.set_budget``.
+
+    The budget is checked before the kernels run: an evaluation that would go over ``max_fe`` (a batch counts as its
+    number of rows), that starts after ``max_time`` seconds, or that comes after the target was reached (with
+    ``stop_on_target``) is stopped. Stopping raises ``BudgetExhaustedError`` (``TargetReachedError`` for the target), or,
+    with ``on_stop="inf"``, returns infinite objectives, constraints and values without evaluating.
+
+    The target is reached by the first feasible solution (all constraints <= 0) whose objective values are all within
+    ``tol`` of ``f_target`` or below it. ``hit_fe``, ``hit_time`` and ``hit_solution`` record when and where it happened.
+
+    Parameters
+    ----------
+    max_fe : int, optional
+        The maximum number of function evaluations
+    max_time : float, optional
+        The maximum wall time in seconds, counted from the creation of the budget (or ``reset``)
+    f_target : float, list, np.ndarray, optional
+        The target objective values, None for no target
+    tol : float
+        The tolerance on the objective values
+    stop_on_target : bool
+        Whether to stop the evaluations once the target is reached
+    on_stop : str
+        "raise" or "inf"
+    """
+
+    def __init__(self, max_fe=None, max_time=None, f_target=None, tol=1e-8, stop_on_target=True, on_stop="raise"):
+        self.max_fe = None if max_fe is None else check_int("max_fe", max_fe, [0, float("inf")])
+        self.max_time = None if max_time is None else check_float("max_time", max_time, (0, float("inf")))
+        self.f_target = None if f_target is None else np.asarray(f_target, dtype=float)
+        self.tol = check_float("tol", tol, [0, float("inf")])
+        self.stop_on_target = check_bool("stop_on_target", stop_on_target)
+        self.on_stop = check_str("on_stop", on_stop, ["raise", "inf"])
+        self.reset()
+
+    def reset(self):
+        """
+        Restart the clock and forget the target hit.
+        """
+        self.start = time.monotonic()
+        self.hit_fe, self.hit_time, self.hit_solution = None, None, None
+        self.stop_reason = None
+
+    @property
+    def target_reached(self):
+        return self.hit_fe is not None
+
+    def get_stop_reason(self, problem, n_fe, n_reserved=0):
+        if self.stop_on_target and self.target_reached:
+            return "target"
+        if self.max_fe is not None and problem.n_fe + n_reserved + n_fe > self.max_fe:
+            return "max_fe"
+        if self.max_time is not None and time.monotonic() - self.start > self.max_time:
+            return "max_time"
+        return None
+
+    def stop(self, problem, n_fe=1, n_reserved=0):
+        """
+        Check the budget before ``n_fe`` evaluations of ``problem``, after ``n_reserved`` evaluations that were dispatched
+        but are not counted in ``problem.n_fe`` yet (e.g. the running candidates of a steady-state evaluator).
+
+        Returns
+        -------
+        stopped : bool
+            Whether the evaluations must be skipped (with ``on_stop="inf"``), otherwise the error is raised
+        """
+        reason = self.get_stop_reason(problem, n_fe, n_reserved)
+        self.n_fe_before = problem.n_fe
+        if reason is None:
+            return False
+        self.stop_reason = reason
+        if self.on_stop == "inf":
+            return True
+        if reason == "target":
+            raise TargetReachedError(f"The target was reached after {self.hit_fe} evaluations.", reason=reason)
+        if reason == "max_fe":
+            raise BudgetExhaustedError(f"The budget of {self.max_fe} evaluations is exhausted "
+                                       f"({self.max_fe - problem.n_fe - n_reserved} left, {n_fe} requested).", reason=reason)
+        raise BudgetExhaustedError(f"The wall-time budget of {self.max_time} seconds is exhausted.", reason=reason)
+
+    def observe(self, problem, X, list_objs, list_cons, n_fe_before=None):
+        """
+        Record the first solution of an evaluated population that reaches the target. ``n_fe_before`` is the value of
+        ``problem.n_fe`` before the population was counted, default is its value at the last ``stop``.
+        """
+        if self.f_target is None or self.target_reached:
+            return
+        n_fe_before = self.n_fe_before if n_fe_before is None else n_fe_before
+        list_objs = np.atleast_2d(list_objs)
+        list_cons = np.asarray(list_cons, dtype=float).reshape(list_objs.shape[0], -1)
+        hits = np.all(list_objs <= self.f_target + self.tol, axis=1) & np.all(list_cons <= 0, axis=1)
+        if np.any(hits):
+            idx = int(np.argmax(hits))
+            self.hit_fe = min(n_fe_before + idx + 1, problem.n_fe)
+            self.hit_time = time.monotonic() - self.start
+            self.hit_solution = np.array(np.atleast_2d(X)[idx], dtype=float)
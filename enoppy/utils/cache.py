@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 11:05, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import os
+import sqlite3
+import threading
+import numpy as np
+from collections import OrderedDict
+from enoppy.utils.validator import check_int, check_str
+
+
+class LRUCache:
+    """
+    A bounded mapping with least-recently-used eviction and hit/miss counters. It can be shared by several threads.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of entries, the least recently used one is dropped when it is exceeded
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = check_int("maxsize", maxsize, [1, float("inf")])
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Return the value of ``key`` and mark it as the most recently used, or ``default`` if it is not cached.
+        """
+        with self._lock:
+            return self._get(key, default)
+
+    def _get(self, key, default=None):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry when the cache is full.
+        """
+        with self._lock:
+            self._put(key, value)
+
+    def _put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def get_many(self, keys):
+        """
+        Return the values of a list of keys, None for the keys that are not cached.
+        """
+        with self._lock:
+            return [self._get(key) for key in keys]
+
+    def put_many(self, keys, values):
+        """
+        Store a list of values under a list of keys.
+        """
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._put(key, value)
+
+    def clear(self):
+        """
+        Drop all entries and reset the counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_info(self):
+        """
+        Return the counters and the size of the cache.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "maxsize": self.maxsize, "size": len(self._data)}
+
+
+class DiskCache:
+    """
+    A persistent evaluation cache stored in a SQLite database, shared across runs and processes.
+
+    The values are the pairs ``(list_objs, list_cons)`` of float vectors. Entries are grouped by ``namespace`` (the identity
+    of the configured problem), so one file can hold the results of many problems. The database uses write-ahead logging,
+    which allows concurrent readers and writers from a process pool; each process (and each copy made by pickling) opens
+    its own connection. When the file holds more than ``maxsize`` entries, the oldest ones are evicted.
+
+    Parameters
+    ----------
+    path : str
+        The path of the database file, created if it does not exist
+    namespace : str
+        The namespace of the entries
+    maxsize : int
+        The maximum number of entries in the file, over all namespaces
+    timeout : float
+        The number of seconds to wait for a lock held by another process
+    """
+
+    chunk_size = 500
+
+    def __init__(self, path, namespace="default", maxsize=1000000, timeout=30.):
+        self.path = str(path)
+        self.namespace = check_str("namespace", namespace)
+        self.maxsize = check_int("maxsize", maxsize, [1, float("inf")])
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._conn, self._pid = None, None
+        self._lock = threading.Lock()
+        self.get_connection()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"], state["_pid"], state["_lock"] = None, None, None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get_connection(self):
+        """
+        Return the connection of the current process, opening it (and creating the table) if needed.
+        """
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS evaluations (namespace TEXT NOT NULL, key BLOB NOT NULL, "
+                         "objs BLOB NOT NULL, cons BLOB NOT NULL, UNIQUE (namespace, key))")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def __len__(self):
+        with self._lock:
+            cursor = self.get_connection().execute("SELECT COUNT(*) FROM evaluations WHERE namespace = ?", (self.namespace,))
+            return cursor.fetchone()[0]
+
+    def get(self, key):
+        """
+        Return the cached ``(list_objs, list_cons)`` of ``key``, or None.
+        """
+        return self.get_many([key])[0]
+
+    def put(self, key, value):
+        """
+        Store ``value = (list_objs, list_cons)`` under ``key``.
+        """
+        self.put_many([key], [value])
+
+    def get_many(self, keys):
+        """
+        Look up a whole population, one query per chunk of keys.
+
+        Returns
+        -------
+        list_results : list
+            The cached ``(list_objs, list_cons)`` of each key, None for the keys that are not cached
+        """
+        found = {}
+        with self._lock:
+            conn = self.get_connection()
+            for idx in range(0, len(keys), self.chunk_size):
+                chunk = keys[idx:idx + self.chunk_size]
+                query = f"SELECT key, objs, cons FROM evaluations WHERE namespace = ? AND key IN ({','.join('?' * len(chunk))})"
+                for key, objs, cons in conn.execute(query, [self.namespace, *chunk]):
+                    found[bytes(key)] = (np.frombuffer(objs, dtype=float).copy(), np.frombuffer(cons, dtype=float).copy())
+        list_results = [found.get(key) for key in keys]
+        n_hits = sum(result is not None for result in list_results)
+        self.hits += n_hits
+        self.misses += len(keys) - n_hits
+        return list_results
+
+    def put_many(self, keys, values):
+        """
+        Store a list of ``(list_objs, list_cons)`` values in a single transaction, then evict the oldest entries above ``maxsize``.
+        """
+        rows = [(self.namespace, key, np.asarray(objs, dtype=float).tobytes(), np.asarray(cons, dtype=float).tobytes())
+                for key, (objs, cons) in zip(keys, values)]
+        with self._lock:
+            conn = self.get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("INSERT OR IGNORE INTO evaluations (namespace, key, objs, cons) VALUES (?, ?, ?, ?)", rows)
+                conn.execute("DELETE FROM evaluations WHERE rowid <= (SELECT MAX(rowid) FROM evaluations) - ?", (self.maxsize,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def clear(self):
+        """
+        Drop the entries of the namespace and reset the counters.
+        """
+        with self._lock:
+            self.get_connection().execute("DELETE FROM evaluations WHERE namespace = ?", (self.namespace,))
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """
+        Close the connection of the current process.
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn, self._pid = None, None
+
+    def get_info(self):
+        """
+        Return the counters and the size of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "maxsize": self.maxsize, "size": len(self)}
@@ -5,6 +5,7 @@
 # --------------------------------------------------%
 
 import numpy as np
+from enoppy.utils.validator import check_str
 
 
 class LabelEncoder:
@@ -78,4 +79,102 @@ class LabelEncoder:
         """
         if self.unique_labels is None:
             raise ValueError("Label encoder has not been fit yet.")
-        return np.array([self.unique_labels[i] if i in self.label_to_index.values() else "unknown" for i in y])
+        n_labels = len(self.unique_labels)
+        return np.array([self.unique_labels[i] if 0 <= i < n_labels else "unknown" for i in y])
+
+
+class DiscreteCodec:
+    """
+    Map the indices of a table of discrete values (e.g. the standard wire diameters of a spring) to the values and back.
+
+    The table is sorted and deduplicated, the same as ``LabelEncoder.fit``. Decoding indexes a NumPy array in O(1) per
+    index, encoding finds the nearest table value with ``np.searchsorted`` in O(log n). Both accept a scalar or an array of
+    any shape, e.g. the (n_pop,) column of a population. Float indices are truncated toward zero, like ``int(x)``.
+    Indices (infinite ones included) and values outside the table are clipped to its ends, or rejected with a
+    ``ValueError``. A NaN index is always rejected with a ``ValueError``.
+
+    Parameters
+    ----------
+    values : list, tuple, np.ndarray
+        The discrete values
+    out_of_range : str
+        "clip" or "raise"
+
+    Examples
+    --------
+    >>> codec = DiscreteCodec([1.75, 2, 2.25, 2.5, 2.75, 3.0])
+    >>> codec.decode(2.7)
+    2.25
+    >>> codec.decode(np.array([0., 5.99, 7.]))
+    array([1.75, 3.  , 3.  ])
+    >>> codec.encode([2.3, 2.9])
+    array([2, 5])
+    """
+
+    def __init__(self, values, out_of_range="clip"):
+        self.values = np.unique(np.asarray(values, dtype=float))
+        if self.values.ndim != 1 or self.values.size == 0:
+            raise ValueError("The discrete values should be a non-empty vector.")
+        self.out_of_range = check_str("out_of_range", out_of_range, ["clip", "raise"])
+
+    def __len__(self):
+        return self.values.size
+
+    def decode(self, indices):
+        """
+        Return the table values at the given indices.
+
+        Parameters
+        ----------
+        indices : int, float, np.ndarray
+            The indices, a scalar or an array
+
+        Returns
+        -------
+        values : float, np.ndarray
+            The values, with the same shape as ``indices``
+        """
+        n_values = self.values.size
+        if isinstance(indices, (int, float, np.integer, np.floating)):
+            if np.isnan(indices):
+                raise ValueError("The index NaN is not a valid index of the discrete values.")
+            idx = int(min(max(indices, -1), n_values))
+            if 0 <= idx < n_values:
+                return float(self.values[idx])
+            if self.out_of_range == "raise":
+                raise ValueError(f"The index {indices} is out of the range [0, {n_values - 1}] of the discrete values.")
+            return float(self.values[0 if idx < 0 else n_values - 1])
+        indices = np.asarray(indices)
+        if indices.dtype.kind == "f":
+            if np.isnan(indices).any():
+                raise ValueError("Some indices are NaN, which is not a valid index of the discrete values.")
+            indices = np.clip(indices, -1, n_values)
+        if indices.dtype.kind not in "iu":
+            indices = indices.astype(np.intp)
+        if self.out_of_range == "raise" and np.any((indices < 0) | (indices >= n_values)):
+            raise ValueError(f"Some indices are out of the range [0, {n_values - 1}] of the discrete values.")
+        return self.values.take(indices, mode="clip")
+
+    def encode(self, values):
+        """
+        Return the indices of the nearest table values, the lower one on a tie.
+
+        Parameters
+        ----------
+        values : float, np.ndarray
+            The values, a scalar or an array
+
+        Returns
+        -------
+        indices : int, np.ndarray
+            The indices, with the same shape as ``values``
+        """
+        values = np.asarray(values, dtype=float)
+        if self.out_of_range == "raise" and np.any((values < self.values[0]) | (values > self.values[-1])):
+            raise ValueError(f"Some values are out of the range [{self.values[0]}, {self.values[-1]}] of the discrete values.")
+        if self.values.size == 1:
+            indices = np.zeros(values.shape, dtype=np.intp)
+        else:
+            indices = np.clip(np.searchsorted(self.values, values), 1, self.values.size - 1)
+            indices -= (values - self.values[indices - 1]) <= (self.values[indices] - values)
+        return int(indices) if indices.ndim == 0 else indices
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 10:40, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import numpy as np
+from abc import ABC, abstractmethod
+from enoppy.utils.validator import check_str
+
+
+def get_violation(list_cons, out=None, work=None):
+    """
+    Compute the total constraint violation ``sum(max(0, g))`` of a solution or of each solution in a population.
+
+    NaN constraint values are treated as satisfied, the same as Python's built-in ``max(0, g)``.
+
+    Parameters
+    ----------
+    list_cons : np.ndarray, list
+        The constraint values, a vector of shape (n_cons,) or a 2D-matrix of shape (n_pop, n_cons)
+    out : np.ndarray, optional
+        Preallocated output buffer of shape () or (n_pop,)
+    work : np.ndarray, optional
+        Preallocated scratch buffer with the same shape as ``list_cons``
+
+    Returns
+    -------
+    violation : float, np.ndarray
+        The total violation, a scalar for a single solution or a vector of shape (n_pop,)
+    """
+    work = np.fmax(list_cons, 0., out=work)
+    return np.sum(work, axis=-1, out=out)
+
+
+def static_penalty(list_objs, list_cons, w=1e8, out=None, work=None, violation=None):
+    """
+    Add the static penalty ``w * sum(max(0, g))`` to every objective value.
+
+    The violation is computed once per solution and broadcast over the objectives, so the cost is O(n_objs + n_cons)
+    per solution. When all buffers are given, no temporary array is allocated.
+
+    Parameters
+    ----------
+    list_objs : np.ndarray, list
+        The objective values, a vector of shape (n_objs,) or a 2D-matrix of shape (n_pop, n_objs)
+    list_cons : np.ndarray, list
+        The constraint values, a vector of shape (n_cons,) or a 2D-matrix of shape (n_pop, n_cons)
+    w : float
+        The penalty coefficient
+    out : np.ndarray, optional
+        Preallocated output buffer with the same shape as ``list_objs``
+    work : np.ndarray, optional
+        Preallocated scratch buffer with the same shape as ``list_cons``
+    violation : np.ndarray, optional
+        Preallocated buffer for the violations, of shape () or (n_pop,)
+
+    Returns
+    -------
+    list_objs_new : np.ndarray
+        The penalized objective values, with the same shape as ``list_objs``
+    """
+    viol = get_violation(list_cons, out=violation, work=work)
+    viol = np.multiply(viol, w, out=violation)
+    return np.add(list_objs, np.expand_dims(viol, -1), out=out)
+
+
+class Penalty(ABC):
+    """
+    Defines an abstract class for the constraint-handling strategies.
+
+    A strategy is called like a penalty function, ``strategy(list_objs, list_cons)``, on a single solution (vectors of shape
+    (n_objs,) and (n_cons,)) or on a whole population (2D-matrices of shape (n_pop, n_objs) and (n_pop, n_cons)), and returns
+    values with the same shape as ``list_objs``. Population calls run in O(n_pop * n_cons) NumPy time and are where adaptive
+    strategies update their state. Those set ``stateful = True``, so a thread-safe problem calls them one thread at a time.
+    """
+
+    name = "Penalty"
+    vectorized = True
+    stateful = False
+
+    @abstractmethod
+    def __call__(self, list_objs, list_cons):
+        pass
+
+    def get_paras(self):
+        """
+        Return the parameters of the strategy.
+        """
+        return {}
+
+
+class StaticPenalty(Penalty):
+    """
+    Static penalty: f + w * sum(max(0, g)).
+
+    Parameters
+    ----------
+    w : float
+        The penalty coefficient
+    """
+
+    name = "static"
+
+    def __init__(self, w=1e8):
+        self.w = w
+
+    def __call__(self, list_objs, list_cons):
+        return static_penalty(list_objs, list_cons, self.w)
+
+    def get_paras(self):
+        return {"w": self.w}
+
+
+class DeathPenalty(Penalty):
+    """
+    Death penalty: infeasible solutions get a constant value, feasible ones keep their objective values.
+
+    Parameters
+    ----------
+    value : float
+        The value given to infeasible solutions
+    """
+
+    name = "death"
+
+    def __init__(self, value=np.inf):
+        self.value = value
+
+    def __call__(self, list_objs, list_cons):
+        infeasible = get_violation(list_cons) > 0
+        return np.where(np.expand_dims(infeasible, -1), self.value, list_objs)
+
+    def get_paras(self):
+        return {"value": self.value}
+
+
+class AdaptivePenalty(Penalty):
+    """
+    Adaptive penalty method (APM) of Barbosa and Lemonge.
+
+    On every population call the coefficient of each constraint is set from the population statistics,
+    ``k_j = |mean(f)| * mean(v_j) / sum_l mean(v_l)^2``, and infeasible solutions get ``max(f, mean(f)) + sum_j k_j * v_j``.
+    Single solutions use the coefficients of the last population, or a static penalty with ``w`` before the first one.
+
+    Parameters
+    ----------
+    w : float
+        The static penalty coefficient used until the first population is seen
+    """
+
+    name = "adaptive"
+    stateful = True
+
+    def __init__(self, w=1e8):
+        self.w = w
+        self.coefs = None
+        self.f_mean = None
+
+    def update(self, list_objs, list_viols):
+        """
+        Update the mean objective values and the coefficients of each constraint from a population.
+        """
+        self.f_mean = np.mean(list_objs, axis=0)
+        v_mean = np.mean(list_viols, axis=0)
+        denominator = np.sum(v_mean ** 2)
+        if denominator > 0:
+            self.coefs = np.abs(self.f_mean)[:, None] * v_mean[None, :] / denominator
+        elif self.coefs is None:
+            self.coefs = np.zeros((len(self.f_mean), len(v_mean)))
+
+    def __call__(self, list_objs, list_cons):
+        list_objs = np.asarray(list_objs, dtype=float)
+        list_viols = np.fmax(list_cons, 0.)
+        if list_viols.ndim == 2 and len(list_viols) > 0:
+            self.update(list_objs, list_viols)
+        if self.coefs is None:
+            return static_penalty(list_objs, list_cons, self.w)
+        infeasible = np.expand_dims(np.sum(list_viols, axis=-1) > 0, -1)
+        f_bar = np.fmax(list_objs, self.f_mean)
+        return np.where(infeasible, f_bar + list_viols @ self.coefs.T, list_objs)
+
+    def get_paras(self):
+        return {"w": self.w}
+
+
+class FeasibilityRules(Penalty):
+    """
+    Deb's feasibility rules, returned as a sort key.
+
+    Feasible solutions keep their objective values, infeasible ones get ``f_worst + sum(max(0, g))``, where ``f_worst`` is the
+    worst feasible objective value of the population (0 if there is none). Sorting by the key gives: feasible before infeasible,
+    feasible by objective, infeasible by violation. Single solutions use ``f_worst`` of the last population.
+    """
+
+    name = "feasibility"
+    stateful = True
+
+    def __init__(self):
+        self.f_worst = 0.
+
+    def get_threshold(self, list_viols):
+        """
+        Return the violation up to which a solution is considered feasible.
+        """
+        return 0.
+
+    def __call__(self, list_objs, list_cons):
+        list_objs = np.asarray(list_objs, dtype=float)
+        violation = get_violation(list_cons)
+        feasible = violation <= self.get_threshold(violation)
+        if np.ndim(violation) == 1:
+            self.f_worst = np.max(list_objs[feasible], axis=0) if np.any(feasible) else 0.
+        return np.where(np.expand_dims(feasible, -1), list_objs, self.f_worst + np.expand_dims(violation, -1))
+
+
+class EpsilonConstrained(FeasibilityRules):
+    """
+    Epsilon-constrained method of Takahama and Sakai, returned as a sort key.
+
+    Solutions with a violation up to epsilon are treated as feasible (see :class:`FeasibilityRules`). Epsilon starts at the
+    violation of the ``theta``-quantile of the first population (or at the given value) and decreases on every population call:
+    ``eps(t) = eps(0) * (1 - t / max_gen) ** cp`` for ``t < max_gen`` and 0 afterwards.
+
+    Parameters
+    ----------
+    epsilon : float, optional
+        The initial epsilon level, default is computed from the first population
+    theta : float
+        The quantile of the violations of the first population used as initial epsilon
+    cp : float
+        The exponent of the epsilon schedule
+    max_gen : int
+        The number of population calls after which epsilon is 0
+    """
+
+    name = "epsilon"
+
+    def __init__(self, epsilon=None, theta=0.2, cp=5., max_gen=1000):
+        super().__init__()
+        self.epsilon0 = epsilon
+        self.theta = theta
+        self.cp = cp
+        self.max_gen = max_gen
+        self.gen = 0
+        self.epsilon = 0. if epsilon is None else epsilon
+
+    def update(self, list_viols):
+        """
+        Move the epsilon level one step along its schedule.
+        """
+        if self.epsilon0 is None:
+            self.epsilon0 = float(np.quantile(list_viols, self.theta))
+        if self.gen < self.max_gen:
+            self.epsilon = self.epsilon0 * (1 - self.gen / self.max_gen) ** self.cp
+        else:
+            self.epsilon = 0.
+        self.gen += 1
+
+    def get_threshold(self, list_viols):
+        if np.ndim(list_viols) == 1 and len(list_viols) > 0:
+            self.update(list_viols)
+        return self.epsilon
+
+    def get_paras(self):
+        return {"epsilon": self.epsilon0, "theta": self.theta, "cp": self.cp, "max_gen": self.max_gen}
+
+
+PENALTIES = {
+    StaticPenalty.name: StaticPenalty,
+    DeathPenalty.name: DeathPenalty,
+    AdaptivePenalty.name: AdaptivePenalty,
+    EpsilonConstrained.name: EpsilonConstrained,
+    FeasibilityRules.name: FeasibilityRules,
+}
+
+
+def get_penalty(name, **kwargs):
+    """
+    Create a constraint-handling strategy by its name.
+
+    Parameters
+    ----------
+    name : str
+        One of "static", "death", "adaptive", "epsilon", "feasibility"
+    kwargs : dict
+        The parameters of the strategy
+
+    Returns
+    -------
+    strategy : Penalty
+        The constraint-handling strategy
+    """
+    name = check_str("f_penalty", name, list(PENALTIES.keys()))
+    return PENALTIES[name](**kwargs)
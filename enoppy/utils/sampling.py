@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 20:10, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import warnings
+import numpy as np
+from enoppy.utils.validator import check_int, check_str
+
+SAMPLING_METHODS = ("uniform", "lhs", "sobol")
+
+
+def get_generator(seed=None, stream=None):
+    """
+    Return the random generator of a seed, or of the independent stream number ``stream`` spawned from the seed.
+
+    The stream ``k`` of a seed is the generator of the ``k``-th child of ``np.random.SeedSequence(seed).spawn``, so each
+    worker can build its own stream from the shared seed and its rank, without any communication.
+
+    Parameters
+    ----------
+    seed : int, np.random.SeedSequence, np.random.Generator, optional
+        The seed, a seed sequence or a generator (used as it is)
+    stream : int, optional
+        The number of the stream, None for the generator of the seed itself
+
+    Returns
+    -------
+    rng : np.random.Generator
+        The random generator
+    """
+    if stream is None:
+        return np.random.default_rng(seed)
+    stream = check_int("stream", stream, [0, float("inf")])
+    if isinstance(seed, np.random.Generator):
+        raise ValueError("The streams should be spawned from an int seed or a SeedSequence, not from a Generator.")
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return np.random.default_rng(np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (stream, )))
+
+
+def spawn_generators(seed=None, n_streams=1):
+    """
+    Return ``n_streams`` independent random generators spawned from one seed, see ``get_generator``.
+    """
+    n_streams = check_int("n_streams", n_streams, [1, float("inf")])
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed.spawn(n_streams)]
+
+
+def get_qmc_engine(name, n_dims, rng):
+    """
+    Create a ``scipy.stats.qmc`` engine with its default (randomized) design: scrambled points for Sobol, and points
+    drawn inside their cells for the Latin hypercube (``scramble`` for scipy>=1.10, ``centered=False`` before).
+    The generator is passed as ``rng`` (scipy>=1.15), or as ``seed`` on older versions.
+    """
+    from scipy.stats import qmc
+    engine = qmc.Sobol if name == "sobol" else qmc.LatinHypercube
+    try:
+        return engine(n_dims, rng=rng)
+    except TypeError:
+        return engine(n_dims, seed=rng)
+
+
+def sample_unit(n, n_dims, method="uniform", rng=None):
+    """
+    Draw ``n`` points of the unit hypercube [0, 1)^n_dims at once.
+
+    Parameters
+    ----------
+    n : int
+        The number of points
+    n_dims : int
+        The number of dimensions
+    method : str
+        "uniform" (independent uniform draws), "lhs" (Latin hypercube) or "sobol" (scrambled Sobol sequence, whose balance
+        properties hold when ``n`` is a power of 2; scipy's warning about it is silenced, any other warning goes through)
+    rng : np.random.Generator, optional
+        The random generator
+
+    Returns
+    -------
+    U : np.ndarray
+        The points, a 2D-matrix of shape (n, n_dims)
+    """
+    n = check_int("n", n, [1, float("inf")])
+    method = check_str("method", method, list(SAMPLING_METHODS))
+    rng = np.random.default_rng() if rng is None else rng
+    if method == "uniform":
+        return rng.random((n, n_dims))
+    engine = get_qmc_engine(method, n_dims, rng)
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="The balance properties of Sobol", category=UserWarning)
+        return engine.random(n)
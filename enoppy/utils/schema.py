@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 18:40, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import numpy as np
+from enoppy.utils.encoder import DiscreteCodec
+from enoppy.utils.validator import check_int
+
+INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def get_int_dtype(low, high):
+    """
+    Return the smallest signed integer dtype that holds all the integers in [low, high].
+    """
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class VariableSchema:
+    """
+    Declare the type of each decision variable of a problem.
+
+    A variable is either "float" (continuous, the default), "int" (an integer, amended by truncation toward zero like
+    ``int(x)``) or "discrete" (an index into a table of values, amended by truncation and replaced by the table value, see
+    ``DiscreteCodec``). ``amend`` repairs a single solution or a whole population in one vectorized pass, and ``pack``
+    stores a population column by column with compact dtypes (e.g. int8 for gear teeth, the table index for a discrete
+    value), see ``CompactPopulation``.
+
+    Parameters
+    ----------
+    n_dims : int
+        The number of variables
+    integers : list, tuple, optional
+        The indices of the integer variables
+    tables : dict, optional
+        Map the index of each discrete variable to its ``DiscreteCodec`` or its list of values
+
+    Examples
+    --------
+    >>> schema = VariableSchema(3, integers=[2], tables={0: [0.009, 0.0095, 0.0104]})
+    >>> schema.var_types
+    ['discrete', 'float', 'int']
+    >>> schema.amend(np.array([[1.7, 2.5, 3.9], [0.2, 1.5, 7.1]]))
+    array([[0.0095, 2.5   , 3.    ],
+           [0.009 , 1.5   , 7.    ]])
+    """
+
+    def __init__(self, n_dims, integers=None, tables=None):
+        self.n_dims = check_int("n_dims", n_dims, [1, float("inf")])
+        self.integers = sorted(int(idx) for idx in (integers or ()))
+        self.tables = {int(idx): table if isinstance(table, DiscreteCodec) else DiscreteCodec(table)
+                       for idx, table in (tables or {}).items()}
+        indices = self.integers + list(self.tables)
+        if len(set(indices)) != len(indices) or any(idx < 0 or idx >= self.n_dims for idx in indices):
+            raise ValueError(f"The integer and discrete variables should be distinct indices in [0, {self.n_dims - 1}].")
+        self.int_indices = np.array(self.integers, dtype=np.intp)
+        contiguous = len(self.integers) > 0 and self.integers[-1] - self.integers[0] == len(self.integers) - 1
+        self.int_slice = slice(self.integers[0], self.integers[-1] + 1) if contiguous else None
+
+    @property
+    def var_types(self):
+        var_types = ["float"] * self.n_dims
+        for idx in self.integers:
+            var_types[idx] = "int"
+        for idx in self.tables:
+            var_types[idx] = "discrete"
+        return var_types
+
+    @property
+    def amends(self):
+        """
+        Whether some variables are not continuous, so ``amend`` changes the solutions.
+        """
+        return len(self.integers) + len(self.tables) > 0
+
+    def amend(self, X):
+        """
+        Round the integer variables and decode the discrete variables, in place.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            A float solution of shape (n_dims,) or a float population of shape (n_pop, n_dims)
+
+        Returns
+        -------
+        X : np.ndarray
+            The same array, amended
+        """
+        if X.ndim == 1:
+            for idx in self.integers:
+                value = X[idx]
+                if value - value == 0:
+                    X[idx] = int(value)
+            for idx, codec in self.tables.items():
+                X[idx] = codec.decode(X[idx])
+            return X
+        if len(self.integers) == self.n_dims:
+            np.trunc(X, out=X)
+        elif self.int_slice is not None:
+            np.trunc(X[:, self.int_slice], out=X[:, self.int_slice])
+        elif len(self.integers) > 0:
+            X[:, self.int_indices] = np.trunc(X[:, self.int_indices])
+        for idx, codec in self.tables.items():
+            X[:, idx] = codec.decode(X[:, idx])
+        return X
+
+    def amend_list(self, x):
+        """
+        Round the integer variables and decode the discrete variables of a solution given as a list of floats, in place.
+        """
+        for idx in self.integers:
+            value = x[idx]
+            if value - value == 0:
+                x[idx] = float(int(value))
+        for idx, codec in self.tables.items():
+            x[idx] = codec.decode(x[idx])
+        return x
+
+    def pack(self, X):
+        """
+        Store a population column by column with compact dtypes.
+
+        The population is stored in the search space: the continuous variables stay float64, the integer variables are
+        truncated and use the smallest integer dtype that holds their values, and the discrete variables are stored as
+        their (valid) table index, not as their value.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            The population, a float 2D-matrix of shape (n_pop, n_dims)
+
+        Returns
+        -------
+        population : CompactPopulation
+            The packed population
+        """
+        X = np.asarray(X, dtype=float)
+        columns = []
+        for idx in range(self.n_dims):
+            column = X[:, idx]
+            if idx in self.tables:
+                codec = self.tables[idx]
+                indices = codec.encode(codec.decode(column))
+                columns.append(indices.astype(get_int_dtype(0, len(codec) - 1)))
+            elif idx in self.integers:
+                column = np.trunc(column)
+                low, high = (column.min(), column.max()) if column.size > 0 else (0, 0)
+                columns.append(column.astype(get_int_dtype(low, high)))
+            else:
+                columns.append(column.copy())
+        return CompactPopulation(columns, self)
+
+
+class CompactPopulation:
+    """
+    A population stored as one array per variable (struct of arrays) with compact dtypes, see ``VariableSchema.pack``.
+
+    It converts back to the float 2D-matrix of shape (n_pop, n_dims) with ``to_array`` or ``np.asarray``, so it can be
+    passed to the batch evaluation methods directly, and ``to_values`` gives the amended population.
+
+    Parameters
+    ----------
+    columns : list
+        The arrays of the variables, of shape (n_pop,)
+    schema : VariableSchema
+        The schema of the variables
+    """
+
+    def __init__(self, columns, schema):
+        self.columns = columns
+        self.schema = schema
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns)
+
+    @property
+    def dtypes(self):
+        return [column.dtype for column in self.columns]
+
+    def to_array(self):
+        """
+        Return the population as a float 2D-matrix of shape (n_pop, n_dims), in the search space (the table index of
+        each discrete variable).
+        """
+        X = np.empty((len(self), self.schema.n_dims))
+        for idx, column in enumerate(self.columns):
+            X[:, idx] = column
+        return X
+
+    def to_values(self):
+        """
+        Return the population as a float 2D-matrix of shape (n_pop, n_dims), with the value of each discrete variable.
+        """
+        return self.schema.amend(self.to_array())
+
+    def __array__(self, dtype=None, copy=None):
+        X = self.to_array()
+        return X if dtype is None else X.astype(dtype, copy=False)
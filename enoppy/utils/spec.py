@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 11:50, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import json
+import hashlib
+import importlib
+import numpy as np
+
+
+def import_object(path):
+    """
+    Import an object from its ``"module:qualname"`` path.
+    """
+    module_name, _, qualname = path.partition(":")
+    if "<" in qualname:
+        raise ValueError(f"'{path}' is a local object and can not be imported.")
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def get_object_path(obj):
+    """
+    Return the ``"module:qualname"`` path of a class or a function.
+    """
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def encode(value):
+    """
+    Convert a value to a JSON-compatible structure that ``decode`` turns back into an equal value.
+
+    NumPy arrays keep their dtype, NumPy scalars become Python scalars, tuples become lists, functions and classes are
+    stored by their import path and other objects by their class and attributes.
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": encode(value.tolist()), "dtype": value.dtype.str}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: encode(item) for key, item in value.items()}
+        return {"__items__": [[encode(key), encode(item)] for key, item in value.items()]}
+    if isinstance(value, type) or (callable(value) and hasattr(value, "__qualname__")):
+        return {"__callable__": get_object_path(value)}
+    if hasattr(value, "__dict__"):
+        return {"__object__": get_object_path(type(value)), "state": encode(vars(value))}
+    return {"__type__": get_object_path(type(value))}
+
+
+def to_key(key):
+    """
+    Return a decoded dict key, with the lists (the tuples converted by ``encode``) as tuples.
+    """
+    if isinstance(key, list):
+        return tuple(to_key(item) for item in key)
+    return key
+
+
+def decode(value):
+    """
+    Rebuild a value converted by ``encode``.
+    """
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__ndarray__" in value:
+        return np.array(decode(value["__ndarray__"]), dtype=value["dtype"])
+    if "__items__" in value:
+        return {to_key(decode(key)): decode(item) for key, item in value["__items__"]}
+    if "__callable__" in value:
+        return import_object(value["__callable__"])
+    if "__object__" in value:
+        obj_class = import_object(value["__object__"])
+        obj = obj_class.__new__(obj_class)
+        obj.__dict__.update(decode(value["state"]))
+        return obj
+    if "__type__" in value:
+        raise ValueError(f"An object of type '{value['__type__']}' can not be rebuilt.")
+    return {key: decode(item) for key, item in value.items()}
+
+
+def decode_data(value):
+    """
+    Rebuild a plain value converted by ``encode``: numbers, strings, lists, dicts and numeric arrays.
+
+    Unlike ``decode``, it never imports or builds an object, so it can read untrusted input. The functions, classes and
+    other objects raise ValueError.
+    """
+    if isinstance(value, list):
+        return [decode_data(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if not isinstance(value, dict):
+        raise ValueError(f"A value of type '{type(value).__name__}' is not plain data.")
+    for marker in ("__callable__", "__object__", "__type__"):
+        if marker in value:
+            raise ValueError(f"A '{marker}' value can not be rebuilt from untrusted data.")
+    if "__ndarray__" in value:
+        dtype = np.dtype(value["dtype"])
+        if dtype.kind not in "biuf":
+            raise ValueError(f"An array of dtype '{dtype}' is not plain data.")
+        return np.array(decode_data(value["__ndarray__"]), dtype=dtype)
+    if "__items__" in value:
+        items = value["__items__"]
+        if not isinstance(items, list) or not all(isinstance(item, list) and len(item) == 2 for item in items):
+            raise ValueError("The '__items__' value should be a list of [key, value] pairs.")
+        result = {}
+        for key, item in items:
+            key = to_key(decode_data(key))
+            try:
+                hash(key)
+            except TypeError:
+                raise ValueError(f"A key of type '{type(key).__name__}' is not a valid dict key.") from None
+            result[key] = decode_data(item)
+        return result
+    return {key: decode_data(item) for key, item in value.items()}
+
+
+def get_fingerprint(value):
+    """
+    Return a deterministic SHA-256 hex digest of a value, computed from the canonical JSON of ``encode(value)``.
+    """
+    text = json.dumps(encode(value), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 17:20, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+# Compare the scalar path (evaluate_scalar, math on Python floats) with the NumPy path (evaluate)
+# for every problem of the PDO-2022 and IHAOAVOA-2022 papers.
+
+import inspect
+import timeit
+import numpy as np
+from enoppy.engineer import Engineer
+from enoppy.paper_based import pdo_2022, ihaoavoa_2022
+
+N_SOLUTIONS = 1000
+N_REPEATS = 5
+
+
+def get_problems(module):
+    for name, cls in inspect.getmembers(module, inspect.isclass):
+        if issubclass(cls, Engineer) and cls.__module__ == module.__name__ and cls.__name__ == name:
+            yield cls()
+
+
+def get_time(func, pop):
+    return min(timeit.repeat(lambda: [func(x) for x in pop], number=1, repeat=N_REPEATS)) / len(pop)
+
+
+np.random.seed(42)
+print(f"{'Problem':<45} {'evaluate (us)':>14} {'scalar (us)':>12} {'speedup':>8} {'max rel. diff':>14}")
+for module in (pdo_2022, ihaoavoa_2022):
+    for problem in get_problems(module):
+        pop = np.random.uniform(problem.lb, problem.ub, (N_SOLUTIONS, problem.n_dims))
+        with np.errstate(all="ignore"):
+            list_fits = np.array([problem.evaluate(x)[0] for x in pop])
+            list_fits_scalar = np.array([problem.evaluate_scalar(x) for x in pop])
+            t_numpy = get_time(problem.evaluate, pop)
+            t_scalar = get_time(problem.evaluate_scalar, pop)
+        diff = np.nanmax(np.abs(list_fits - list_fits_scalar) / np.maximum(np.abs(list_fits), 1e-300))
+        title = f"{module.__name__.split('.')[-1]}.{type(problem).__name__}"
+        print(f"{title:<45} {t_numpy * 1e6:>14.2f} {t_scalar * 1e6:>12.2f} {t_numpy / t_scalar:>7.1f}x {diff:>14.1e}")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 10:12, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import inspect
+import numpy as np
+import pytest
+from enoppy.engineer import Engineer
+from enoppy.paper_based import moeosma_2023, ihaoavoa_2022, pdo_2022, rwco_2020
+
+PROBLEMS = [cls for module in (moeosma_2023, ihaoavoa_2022, pdo_2022, rwco_2020)
+            for _, cls in inspect.getmembers(module, inspect.isclass)
+            if issubclass(cls, Engineer) and cls.__module__ == module.__name__]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("problem_class", PROBLEMS, ids=lambda cls: f"{cls.__module__.split('.')[-1]}.{cls.__name__}")
+def test_evaluate_batch_matches_evaluate(problem_class):
+    problem = problem_class()
+    assert len(problem.bounds) == problem.n_dims
+    X = np.random.default_rng(42).uniform(problem.lb, problem.ub, (20, problem.n_dims))
+    X_copy = X.copy()
+
+    list_fits = problem.evaluate_batch(X)
+    assert problem.n_fe == 20
+    assert np.array_equal(X, X_copy)
+    assert problem.get_objs_batch(X).shape == (20, problem.n_objs)
+    assert problem.get_cons_batch(X).shape == (20, problem.n_cons)
+
+    expected = np.array([problem.evaluate(x.copy()) for x in X])
+    assert list_fits.shape == expected.shape
+    assert np.allclose(list_fits, expected, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("problem_class", PROBLEMS, ids=lambda cls: f"{cls.__module__.split('.')[-1]}.{cls.__name__}")
+def test_evaluate_full_matches_getters(problem_class):
+    problem = problem_class()
+    assert len(problem.bounds) == problem.n_dims
+    X = np.random.default_rng(7).uniform(problem.lb, problem.ub, (5, problem.n_dims))
+    amends = problem.schema is not None
+
+    for x in X:
+        list_objs, list_cons, fit = problem.evaluate_full(x.copy())
+        x_amended = problem.amend_position(x.copy(), problem.lb, problem.ub) if amends else x
+        assert np.array_equal(list_objs, problem.get_objs(x_amended), equal_nan=True)
+        assert np.array_equal(list_cons, problem.get_cons(x_amended), equal_nan=True)
+        assert np.array_equal(fit, problem.evaluate(x.copy()), equal_nan=True)
+    assert problem.n_fe == 10
+
+    list_objs, list_cons, list_fits = problem.evaluate_full_batch(X)
+    assert problem.n_fe == 15
+    X_amended = problem.amend_batch(X, problem.lb, problem.ub) if amends else X
+    assert np.array_equal(list_objs, problem.get_objs_batch(X_amended), equal_nan=True)
+    assert np.array_equal(list_cons, problem.get_cons_batch(X_amended), equal_nan=True)
+    assert np.array_equal(list_fits, problem.evaluate_batch(X), equal_nan=True)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_evaluate_batch_deduplicates_amended_rows():
+    problem = rwco_2020.PlanetaryGearTrainDesignOptimizationProblem()
+    rng = np.random.default_rng(5)
+    X_unique = rng.uniform(problem.lb, problem.ub, (8, problem.n_dims))
+    X = X_unique[rng.integers(0, 8, 40)] + rng.uniform(0, 0.5, (40, problem.n_dims))
+    X = np.clip(X, problem.lb, problem.ub)
+    n_distinct = len(np.unique(problem.amend_batch(X), axis=0))
+
+    list_objs, list_cons, list_fits = problem.evaluate_full_batch(X)
+    assert problem.n_saved == 40 - n_distinct > 0
+    assert problem.n_fe == n_distinct
+    expected = np.array([problem.evaluate(x.copy()) for x in X])
+    assert np.allclose(list_fits, expected, equal_nan=True)
+    assert list_objs.shape == (40, problem.n_objs) and list_cons.shape == (40, problem.n_cons)
+
+    problem.count_hits = True
+    problem.n_fe = 0
+    problem.evaluate_batch(X)
+    assert problem.n_fe == 40
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("problem_class", PROBLEMS, ids=lambda cls: f"{cls.__module__.split('.')[-1]}.{cls.__name__}")
+def test_evaluate_scalar_matches_evaluate(problem_class):
+    problem = problem_class()
+    assert len(problem.bounds) == problem.n_dims
+    X = np.random.default_rng(3).uniform(problem.lb, problem.ub, (10, problem.n_dims))
+    X = np.vstack([X, problem.lb, problem.ub])
+
+    for x in X:
+        fit = problem.evaluate_scalar(x.copy())
+        expected = problem.evaluate(x.copy())
+        if problem.n_objs == 1:
+            assert type(fit) is float
+        assert np.allclose(fit, expected, rtol=1e-12, equal_nan=True)
+    assert problem.n_fe == 2 * len(X)
+
+
+def test_evaluate_scalar_fallbacks():
+    problem = pdo_2022.WeldedBeamProblem()
+    x = problem.create_solution()
+    fit = problem.evaluate_scalar(list(x))
+    assert fit == problem.evaluate(x)[0]
+    problem.set_cache(maxsize=16, count_hits=True)
+    assert problem.evaluate_scalar(x) == problem.evaluate_scalar(x) == fit
+    assert problem.n_hits == 1
+
+    problem = pdo_2022.WeldedBeamProblem(f_penalty=lambda list_objs, list_cons: np.sum(list_objs))
+    assert problem.evaluate_scalar(x) == problem.get_objs(x)[0]
+
+    problem = moeosma_2023.SpringProblem()
+    out = np.empty(problem.n_objs)
+    assert problem.evaluate_scalar(problem.lb, out=out) is out
+    assert np.array_equal(out, problem.evaluate(problem.lb))
@@ -20,3 +20,13 @@ def test_SpeedReducerProblem():
     assert np.all(p1.get_objs(x0) - np.array([2352.44784872, 1695.96387746]))
     assert len(p1.get_cons(x0)) == p1.n_cons
     assert np.all(p1.evaluate(x0) - np.array([7.49307543e+10, 7.49307536e+10]))
+
+
+def test_SpringProblem_constraints_use_spring_index():
+    p1 = moeosma_2023.SpringProblem()
+    d, D, N = 0.207, 1.5, 10.
+    list_objs, list_cons = p1.get_objs_cons(np.array([d, D, N]))
+    assert np.all(np.isfinite(list_cons))
+    assert np.isclose(list_cons[0], list_objs[0] - 30)
+    assert np.isclose(list_cons[1], list_objs[1] - 189000)
+    assert np.isclose(list_cons[5], 3 - D / d)
@@ -4,8 +4,14 @@
 #       Github: https://github.com/thieu1995        %                         
 # --------------------------------------------------%
 
+import sys
+import pickle
+import tracemalloc
 import numpy as np
-from enoppy.engineer import Engineer
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from enoppy.engineer import Engineer, unique_rows
+from enoppy.paper_based import moeosma_2023, pdo_2022, rwco_2020
 
 
 def test_Benchmark_class():
@@ -20,3 +26,133 @@ def test_Benchmark_class():
     assert isinstance(problem.lb, np.ndarray)
     assert isinstance(problem.bounds, np.ndarray)
     assert problem.bounds.shape[0] == ndim
+
+
+def test_cached_bounds():
+    problem = moeosma_2023.SpringProblem()
+    assert problem.bounds.dtype == np.float64 and problem.bounds.shape == (problem.n_dims, 2)
+    assert problem.lb is problem.lb and np.shares_memory(problem.lb, problem.bounds)
+    assert np.array_equal(problem.range, problem.ub - problem.lb)
+    assert np.array_equal(problem.center, (problem.lb + problem.ub) / 2)
+    with pytest.raises(ValueError):
+        problem.lb[0] = 0.
+    with pytest.raises(ValueError):
+        problem.bounds = [(0., 1., 2.)]
+
+    problem.bounds = [(0, 10), (1., 2.), (3, 4)]
+    assert np.array_equal(problem.lb, [0., 1., 3.]) and np.array_equal(problem.center, [5., 1.5, 3.5])
+    problem._bounds = np.array([(0, 1), (0, 1), (0, 1)])
+    assert np.array_equal(problem.ub, [1., 1., 1.])
+    problem = pickle.loads(pickle.dumps(problem))
+    assert np.array_equal(problem.range, [1., 1., 1.]) and not problem.bounds.flags.writeable
+
+
+def test_evaluate_batch_fallback():
+    class Problem(Engineer):
+        def __init__(self):
+            super().__init__()
+            self._n_dims = 3
+            self._n_cons = 1
+            self._bounds = [(-1., 1.), ] * 3
+            self.check_penalty_func(None)
+
+        def get_objs(self, x):
+            return np.array([np.sum(np.square(x))])
+
+        def get_cons(self, x):
+            return np.array([x[0] - 0.5])
+
+        def evaluate(self, x):
+            self.n_fe += 1
+            return self.f_penalty(self.get_objs(x), self.get_cons(x))
+
+    problem = Problem()
+    X = np.random.uniform(problem.lb, problem.ub, (10, problem.n_dims))
+    list_fits = problem.evaluate_batch(X)
+
+    assert problem.n_fe == 10
+    assert list_fits.shape == (10, 1)
+    assert np.allclose(list_fits, [problem.evaluate(x) for x in X])
+    with pytest.raises(ValueError):
+        problem.evaluate_batch(X[:, :2])
+
+
+def test_unique_rows():
+    X = np.array([[1., 2.], [3., 4.], [1., 2.], [2., 1.], [3., 4.]])
+    X_unique, inverse = unique_rows(X)
+    assert len(X_unique) == 3
+    assert np.array_equal(X_unique[inverse], X)
+
+
+def test_thread_safe_evaluation():
+    problem = moeosma_2023.SpringProblem(f_penalty="adaptive")
+    problem.set_thread_safe()
+    problem.set_cache(maxsize=50)
+    rng = np.random.default_rng(7)
+    X = rng.uniform(problem.lb, problem.ub, (400, problem.n_dims))
+    X[:, 2] = np.arange(400) % 13 + 2
+    x = X[0].copy()
+    expected = moeosma_2023.SpringProblem().evaluate_full(x.copy())[0]
+    assert np.array_equal(problem.evaluate_full(x)[0], expected)
+    assert np.array_equal(x, X[0])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(problem.evaluate, X[1:200]))
+        list(executor.map(problem.evaluate_batch, np.split(X[200:], 10)))
+    assert problem.n_fe + problem.n_hits + problem.n_saved == 400
+    state = pickle.loads(pickle.dumps(problem))
+    assert state.thread_safe and state.n_fe == problem.n_fe
+    assert problem.get_scratch("work", (2, 3)).shape == (2, 3)
+    assert problem.get_scratch("work", (4, )).base is problem.get_scratch("work", (1, )).base
+
+
+def get_traced_memory(func, x, n_calls=2000):
+    for _ in range(10):
+        func(x)
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for _ in range(n_calls):
+            func(x)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - start, peak - start
+
+
+def test_workspace_evaluation():
+    problem = pdo_2022.WeldedBeamProblem()
+    X = np.random.default_rng(5).uniform(problem.lb, problem.ub, (10, problem.n_dims))
+    list_results = [problem.evaluate_full(x) for x in X]
+    result_size = sum(sys.getsizeof(item) for item in list_results[0])
+
+    problem.set_workspace()
+    buffers = problem.get_workspace()
+    for x, expected in zip(X, list_results):
+        result = problem.evaluate_full(x)
+        assert all(item is buffer for item, buffer in zip(result, buffers))
+        assert all(np.array_equal(item, value) for item, value in zip(result, expected))
+    assert problem.n_fe == 20
+
+    # No memory is retained, and the peak stays below the result arrays of a single allocating evaluation
+    retained, peak = get_traced_memory(problem.evaluate, X[0])
+    assert retained < sys.getsizeof(np.empty(0))
+    assert peak < result_size
+
+    problem.set_workspace(copy=True)
+    result = problem.evaluate_full(X[0])
+    assert not any(item is buffer for item, buffer in zip(result, buffers))
+    assert all(np.array_equal(item, value) for item, value in zip(result, list_results[0]))
+
+
+def test_workspace_evaluation_numpy_kernel():
+    problem = rwco_2020.HaverlyPoolingProblem()
+    x = problem.create_solution()
+    expected = problem.evaluate_full(x)
+    problem.set_workspace()
+    for item, value in zip(problem.evaluate_full(x), expected):
+        assert np.array_equal(item, value)
+
+    problem = rwco_2020.HaverlyPoolingProblem(f_penalty="adaptive")
+    expected = problem.evaluate(x)
+    problem.set_workspace()
+    assert np.array_equal(problem.evaluate(x), expected)
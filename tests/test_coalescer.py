@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 14:40, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import asyncio
+import threading
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from enoppy.coalescer import BatchCoalescer
+from enoppy.paper_based import moeosma_2023, rwco_2020
+
+
+def test_coalescer_threads():
+    problem = moeosma_2023.SpringProblem()
+    X = np.random.default_rng(2).uniform(problem.lb, problem.ub, (200, problem.n_dims))
+    x0 = X[0].copy()
+    with BatchCoalescer(problem, max_batch_size=16, max_latency=0.01) as coalescer:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list_fits = list(executor.map(coalescer.evaluate, X))
+        stats = coalescer.get_stats()
+    assert np.array_equal(list_fits, moeosma_2023.SpringProblem().evaluate_batch(X))
+    assert np.array_equal(X[0], x0)
+    assert stats["n_requests"] == 200 and stats["n_batches"] < 200
+    assert max(stats["batch_sizes"]) <= 16
+    assert sum(stats["queue_depths"].values()) == stats["n_batches"]
+    assert problem.n_fe + problem.n_saved == 200
+
+
+def test_coalescer_asyncio_and_errors():
+    problem = rwco_2020.PressureVesselDesignProblem()
+    X = np.random.default_rng(4).uniform(problem.lb, problem.ub, (30, problem.n_dims))
+
+    async def run(coalescer):
+        return await asyncio.gather(*[coalescer.evaluate_async(x) for x in X])
+
+    with BatchCoalescer(problem, max_batch_size=100, max_latency=0.05) as coalescer:
+        list_fits = asyncio.run(run(coalescer))
+        assert coalescer.get_stats()["batch_sizes"] == {30: 1}
+        with pytest.raises(ValueError):
+            coalescer.evaluate(X[0, :2])
+    assert np.array_equal(list_fits, problem.evaluate_batch(X))
+    with pytest.raises(ValueError):
+        BatchCoalescer(problem, max_batch_size=0)
+
+
+def test_coalescer_close():
+    problem = moeosma_2023.SpringProblem()
+    X = np.random.default_rng(5).uniform(problem.lb, problem.ub, (2000, problem.n_dims))
+    coalescer = BatchCoalescer(problem, max_batch_size=8, max_latency=0.)
+    futures, barrier = [], threading.Barrier(5)
+
+    def submit(rows):
+        barrier.wait()
+        futures.extend(coalescer.submit(x) for x in rows)
+
+    threads = [threading.Thread(target=submit, args=(rows, )) for rows in np.array_split(X, 4)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    coalescer.close()
+    for thread in threads:
+        thread.join()
+    assert coalescer.closed and len(futures) == 2000
+    for future in futures:
+        assert future.exception(timeout=5) is None or isinstance(future.exception(), RuntimeError)
+    with pytest.raises(RuntimeError, match="closed"):
+        coalescer.evaluate(X[0])
+    with pytest.raises(RuntimeError, match="closed"):
+        coalescer.start()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 12:45, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import time
+import asyncio
+import numpy as np
+import pytest
+from enoppy.engineer import Engineer
+from enoppy import parallel
+from enoppy.parallel import ParallelEvaluator, SteadyStateEvaluator, AsyncRunner
+from enoppy.utils.budget import BudgetExhaustedError
+from enoppy.paper_based import moeosma_2023, rwco_2020
+
+
+class FailingProblem(Engineer):
+    vectorized = True
+
+    def __init__(self, f_penalty=None):
+        super().__init__()
+        self._n_dims = 2
+        self._bounds = [(-1., 1.), ] * 2
+        self.check_penalty_func(f_penalty)
+
+    def get_objs(self, x):
+        if np.any(np.asarray(x[0]) > 0.9):
+            raise ValueError("x[0] is too large")
+        return np.array([x[0] + x[1]])
+
+    def get_cons(self, x):
+        return np.zeros((0,) + np.shape(x[0]))
+
+
+class SlowProblem(FailingProblem):
+    def get_objs(self, x):
+        time.sleep(float(np.max(x[1])))
+        return super().get_objs(x)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_parallel_evaluator_matches_serial():
+    problem = moeosma_2023.SpringProblem(f_penalty="adaptive")
+    serial = moeosma_2023.SpringProblem(f_penalty="adaptive")
+    X = np.random.default_rng(11).uniform(problem.lb, problem.ub, (101, problem.n_dims))
+    with ParallelEvaluator(problem, n_workers=2) as evaluator:
+        for _ in range(2):
+            list_objs, list_cons, list_fits = evaluator.evaluate_full_batch(X)
+            expected = serial.evaluate_full_batch(X)
+            assert np.array_equal(list_objs, expected[0], equal_nan=True)
+            assert np.array_equal(list_cons, expected[1], equal_nan=True)
+            assert np.array_equal(list_fits, expected[2], equal_nan=True)
+        assert evaluator.row_time > 0
+        assert 1 <= evaluator.get_chunk_size(101) <= 51
+    assert problem.n_fe == serial.n_fe and problem.n_saved == serial.n_saved
+    assert problem.eval_time > 0
+    assert evaluator.executor is None
+
+
+def test_parallel_evaluator_propagates_errors():
+    problem = FailingProblem()
+    with ParallelEvaluator(problem, n_workers=2, chunk_size=3) as evaluator:
+        assert evaluator.evaluate_batch(np.zeros((10, 2))).shape == (10, 1)
+        with pytest.raises(ValueError, match="too large"):
+            evaluator.evaluate_batch(np.full((10, 2), 0.95))
+        with pytest.raises(ValueError):
+            evaluator.evaluate_batch(np.zeros((10, 3)))
+        assert np.array_equal(evaluator.evaluate_batch(np.ones((4, 2)) * 0.5), np.ones((4, 1)))
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_parallel_evaluator_without_shared_memory(monkeypatch):
+    monkeypatch.setattr(parallel, "HAS_SHARED_MEMORY", False)
+    problem = rwco_2020.PressureVesselDesignProblem()
+    X = np.random.default_rng(3).uniform(problem.lb, problem.ub, (30, problem.n_dims))
+    with ParallelEvaluator(problem, n_workers=2) as evaluator:
+        assert not evaluator.shared_memory
+        assert np.array_equal(evaluator.evaluate_batch(X), problem.evaluate_batch(X), equal_nan=True)
+        assert evaluator.buffers is None
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_parallel_evaluator_reuses_shared_buffers():
+    problem = rwco_2020.PressureVesselDesignProblem()
+    rng = np.random.default_rng(5)
+    with ParallelEvaluator(problem, n_workers=2) as evaluator:
+        evaluator.evaluate_batch(rng.uniform(problem.lb, problem.ub, (40, problem.n_dims)))
+        names = [buffer.name for buffer in evaluator.buffers]
+        assert [buffer.shape for buffer in evaluator.buffers] == [(40, problem.n_dims), (40, problem.n_objs), (40, problem.n_cons)]
+        X = rng.uniform(problem.lb, problem.ub, (25, problem.n_dims))
+        assert np.array_equal(evaluator.evaluate_batch(X), problem.evaluate_batch(X), equal_nan=True)
+        assert [buffer.name for buffer in evaluator.buffers] == names
+        X = rng.uniform(problem.lb, problem.ub, (60, problem.n_dims))
+        assert np.array_equal(evaluator.evaluate_batch(X), problem.evaluate_batch(X), equal_nan=True)
+        assert evaluator.buffers[0].shape == (60, problem.n_dims)
+    assert evaluator.buffers is None
+    with ParallelEvaluator(problem, n_workers=2, shared_memory=False) as evaluator:
+        assert np.array_equal(evaluator.evaluate_batch(X), problem.evaluate_batch(X), equal_nan=True)
+        assert evaluator.buffers is None
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_parallel_evaluator_aggregates_counters(backend):
+    problem = moeosma_2023.SpringProblem()
+    X = np.random.default_rng(3).uniform(problem.lb, problem.ub, (30, problem.n_dims))
+    X[:, 2] = np.arange(30) + 2
+    with ParallelEvaluator(problem, n_workers=2, chunk_size=6, backend=backend) as evaluator:
+        evaluator.evaluate_batch(np.repeat(X, 2, axis=0))
+    assert problem.get_counters()["n_fe"] == 30 and problem.n_saved == 30 and problem.n_hits == 0
+    problem = moeosma_2023.SpringProblem()
+    problem.set_cache(maxsize=100)
+    with ParallelEvaluator(problem, n_workers=1, backend=backend) as evaluator:
+        first = evaluator.evaluate_batch(X)
+        assert np.array_equal(evaluator.evaluate_batch(X), first)
+    assert problem.n_fe == 30 and problem.n_hits == 30 and problem.eval_time > 0
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_evaluate_async(executor):
+    problem = rwco_2020.PressureVesselDesignProblem(f_penalty="adaptive")
+    serial = rwco_2020.PressureVesselDesignProblem(f_penalty="adaptive")
+    X = np.random.default_rng(9).uniform(problem.lb, problem.ub, (20, problem.n_dims))
+    problem.set_executor(executor, max_workers=2, max_concurrency=3)
+
+    async def run():
+        list_fits = await asyncio.gather(*[problem.evaluate_async(x) for x in X])
+        return np.array(list_fits), await problem.evaluate_batch_async(X)
+
+    try:
+        list_fits, batch_fits = asyncio.run(run())
+        assert np.array_equal(list_fits, [serial.evaluate(x) for x in X])
+        assert np.array_equal(batch_fits, serial.evaluate_batch(X))
+        assert problem.n_fe == 40
+        assert problem._async.max_concurrency == 3
+    finally:
+        problem.set_executor(None)
+    assert problem._async is None and not problem.thread_safe
+
+
+def test_async_runner_thread_safety():
+    problem = rwco_2020.PressureVesselDesignProblem()
+    with pytest.raises(ValueError, match="thread-safe"):
+        AsyncRunner(problem, "thread")
+    assert not problem.thread_safe
+    problem.set_executor("thread", max_workers=1)
+    assert problem.thread_safe
+    problem.set_executor("process", max_workers=1)
+    assert not problem.thread_safe
+    problem.set_executor(None)
+
+    problem.set_thread_safe()
+    runner = AsyncRunner(problem, "thread", max_workers=1)
+    assert asyncio.run(runner.evaluate_full(problem.lb))[2].shape == (1, )
+    runner.close()
+    problem.set_executor("thread", max_workers=1)
+    problem.set_executor(None)
+    assert problem.thread_safe
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_steady_state_evaluator(backend):
+    problem = SlowProblem()
+    with SteadyStateEvaluator(problem, n_workers=2, backend=backend) as evaluator:
+        ids = evaluator.submit_many([[0.1, 0.3], [0.2, 0.], [0.3, 0.], [0.4, 0.]], ids="abcd")
+        assert ids == list("abcd")
+        results = list(evaluator.as_completed(timeout=5))
+        assert [res[0] for res in results][-1] == "a"
+        assert {res[0]: float(res[3][0]) for res in results} == pytest.approx({"a": 0.4, "b": 0.2, "c": 0.3, "d": 0.4})
+        assert problem.n_fe == 4 and evaluator.n_pending == 0
+
+        running = [evaluator.submit([0., 0.2]) for _ in range(2)]
+        time.sleep(0.1)
+        queued = [evaluator.submit([0.5, 0.]) for _ in range(5)]
+        cancelled = evaluator.cancel_all()
+        assert len(cancelled) >= 2 and set(cancelled) <= set(queued)
+        assert {res[0] for res in evaluator.as_completed()} == set(running + queued) - set(cancelled)
+        evaluator.submit([0.95, 0.])
+        with pytest.raises(ValueError, match="too large"):
+            list(evaluator.as_completed())
+        with pytest.raises(ValueError):
+            evaluator.next_result()
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_steady_state_evaluator_budget():
+    problem = rwco_2020.PressureVesselDesignProblem()
+    X = np.random.default_rng(4).uniform(problem.lb, problem.ub, (20, problem.n_dims))
+    problem.set_budget(max_fe=5)
+    with SteadyStateEvaluator(problem, n_workers=2, backend="thread") as evaluator:
+        evaluator.submit_many(X[:5])
+        with pytest.raises(BudgetExhaustedError):
+            evaluator.submit(X[5])
+        assert len(list(evaluator.as_completed())) == 5
+    assert problem.n_fe == 5
+
+    problem = rwco_2020.PressureVesselDesignProblem()
+    problem.set_budget(max_fe=5, on_stop="inf")
+    with SteadyStateEvaluator(problem, n_workers=2, backend="thread") as evaluator:
+        evaluator.submit_many(X)
+        fits = dict((idx, fit) for idx, _, _, fit in evaluator.as_completed())
+    assert problem.n_fe == 5 and sum(np.isinf(fit[0]) for fit in fits.values()) == 15
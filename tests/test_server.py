@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 15:50, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import os
+import sys
+import socket
+import subprocess
+import numpy as np
+import pytest
+from enoppy.engineer import Engineer
+from enoppy.server import EvaluationServer, EvaluationClient, send_message, recv_message
+from enoppy.utils.budget import BudgetLedger, BudgetExhaustedError
+from enoppy.paper_based import moeosma_2023, rwco_2020
+
+
+class FailingProblem(Engineer):
+    def __init__(self, f_penalty=None):
+        super().__init__()
+        self._n_dims = 2
+        self._bounds = [(-1., 1.), ] * 2
+        self.check_penalty_func(f_penalty)
+
+    def get_objs(self, x):
+        raise ValueError("always fails")
+
+    def get_cons(self, x):
+        return np.zeros(0)
+
+
+def test_message_roundtrip():
+    left, right = socket.socketpair()
+    with left, right:
+        arrays = [np.arange(12.).reshape(3, 4), np.empty((2, 0)), np.array([1, 2], dtype=np.int32)]
+        send_message(left, {"op": "ping", "id": 3}, arrays)
+        header, received = recv_message(right)
+    assert header == {"op": "ping", "id": 3}
+    for arr, res in zip(arrays, received):
+        assert res.dtype == arr.dtype and np.array_equal(res, arr)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_client_shards_across_servers():
+    with EvaluationServer().start() as server1, EvaluationServer().start() as server2:
+        with EvaluationClient([server1.address, server2.address], pool_size=2, chunk_size=7, max_pipeline=2) as client:
+            for problem_class, penalty in [(moeosma_2023.SpringProblem, "adaptive"), (rwco_2020.PressureVesselDesignProblem, None)]:
+                problem, serial = problem_class(f_penalty=penalty), problem_class(f_penalty=penalty)
+                X = np.random.default_rng(1).uniform(problem.lb, problem.ub, (100, problem.n_dims))
+                result = client.evaluate_full_batch(problem, X)
+                for res, exp in zip(result, serial.evaluate_full_batch(X)):
+                    assert np.array_equal(res, exp, equal_nan=True)
+                assert problem.n_fe + problem.n_saved == 100 and problem.eval_time > 0
+            assert len(server1.specs) == len(server2.specs) == 2
+
+            with pytest.raises(ValueError, match="always fails"):
+                client.evaluate_batch(FailingProblem(), np.zeros((3, 2)))
+            with pytest.raises(ValueError, match="not a subclass of Engineer"):
+                client.register("enoppy.utils.cache:LRUCache")
+            server1.specs.clear()           # the problems are registered again
+            assert client.evaluate_batch(rwco_2020.PressureVesselDesignProblem(), X).shape == (100, 1)
+
+
+def test_server_rejects_untrusted_specs(tmp_path):
+    target = tmp_path / "pwned"
+    payload = b"cos\nsystem\n(S'touch " + str(target).encode() + b"'\ntR."
+    payload += b"." * (-len(payload) % 8)
+    spec = {"class": "enoppy.paper_based.moeosma_2023:SpringProblem", "penalty": "static", "attrs": {}}
+    bad_specs = [
+        {**spec, "attrs": {"get_objs_cons_batch": {"__callable__": "pickle:loads"}}},
+        {**spec, "attrs": {"_bounds": {"__object__": "collections:OrderedDict", "state": {}}}},
+        {**spec, "class": "os:system"},
+    ]
+    with EvaluationServer(max_message_size=1024).start() as server:
+        with socket.create_connection(server.address) as sock:
+            for bad_spec in bad_specs:
+                send_message(sock, {"op": "register", "spec": bad_spec})
+                assert recv_message(sock)[0]["type"] == "ValueError"
+            send_message(sock, {"op": "register", "spec": {**spec, "penalty": {"__callable__": "os:system"}}})
+            key = recv_message(sock)[0]["key"]
+            assert server.specs[key]["penalty"] == "static"
+            send_message(sock, {"op": "evaluate", "key": key}, [np.frombuffer(payload, dtype=float).reshape(-1, 1)])
+            assert "error" in recv_message(sock)[0]
+        assert not target.exists()
+
+        with socket.create_connection(server.address) as sock:
+            with pytest.raises(ConnectionError):
+                send_message(sock, {"op": "ping"}, [np.zeros(1000)])
+                recv_message(sock)
+
+
+PROBLEM_MODULE = """
+import numpy as np
+from enoppy.engineer import Engineer
+
+
+class SphereProblem(Engineer):
+    def __init__(self, f_penalty=None):
+        super().__init__()
+        self._n_dims = 3
+        self._bounds = [(-1., 1.), ] * 3
+        self.check_penalty_func(f_penalty)
+
+    def get_objs(self, x):
+        return np.array([np.sum(x ** 2)])
+
+    def get_cons(self, x):
+        return np.zeros(0)
+"""
+
+
+def test_server_cli(tmp_path, monkeypatch):
+    (tmp_path / "cli_problems.py").write_text(PROBLEM_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from cli_problems import SphereProblem
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.dirname(os.path.dirname(os.path.abspath(__file__))), str(tmp_path)]))
+    process = subprocess.Popen([sys.executable, "-m", "enoppy.server", "--port", "0", "--module", "cli_problems"],
+                               stdout=subprocess.PIPE, env=env, text=True)
+    try:
+        host, port = process.stdout.readline().split()[-1].rsplit(":", 1)
+        with EvaluationClient([(host, int(port))]) as client:
+            for problem in [rwco_2020.PressureVesselDesignProblem(), moeosma_2023.SpringProblem(), SphereProblem()]:
+                X = np.random.default_rng(1).uniform(problem.lb, problem.ub, (20, problem.n_dims))
+                assert np.array_equal(client.evaluate_batch(problem, X), type(problem)().evaluate_batch(X), equal_nan=True)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def test_server_enforces_budgets():
+    ledger = BudgetLedger()
+    ledger.open("run-1", max_fe=50)
+    problem = moeosma_2023.SpringProblem()
+    X = np.random.default_rng(1).uniform(problem.lb, problem.ub, (20, problem.n_dims))
+    with EvaluationServer(ledger=ledger).start() as server, EvaluationClient([server.address]) as client:
+        client.evaluate_batch(problem, np.vstack([X, X]), run_id="run-1")
+        assert ledger.snapshot("run-1")["n_fe"] == problem.n_fe == 20      # the duplicated rows are refunded
+        client.evaluate_batch(problem, X, run_id="run-1")
+        with pytest.raises(BudgetExhaustedError) as info:
+            client.evaluate_batch(problem, X, run_id="run-1")
+        assert info.value.reason == "max_fe" and info.value.run_id == "run-1"
+        assert problem.n_fe == 40
+        assert client.get_budget("run-1")[0]["n_rejected"] == 20
+        client.evaluate_batch(problem, X, run_id="run-2")
+
+
+def test_client_checks_problem_budget():
+    problem = rwco_2020.PressureVesselDesignProblem()
+    X = np.random.default_rng(0).uniform(problem.lb, problem.ub, (10, problem.n_dims))
+    list_objs, list_cons, _ = rwco_2020.PressureVesselDesignProblem().evaluate_full_batch(X)
+    feasible = np.flatnonzero(np.all(list_cons <= 0, axis=1))
+    idx = feasible[np.argmin(list_objs[feasible, 0])]
+    problem.set_budget(max_fe=25, f_target=list_objs[idx, 0], tol=1e-6, stop_on_target=False)
+    with EvaluationServer().start() as server, EvaluationClient([server.address], chunk_size=3) as client:
+        client.evaluate_batch(problem, X)
+        assert problem.n_fe == 10 and problem.budget.hit_fe == idx + 1
+        client.evaluate_batch(problem, X)
+        with pytest.raises(BudgetExhaustedError):
+            client.evaluate_batch(problem, X)
+    assert problem.n_fe == 20
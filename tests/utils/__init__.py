@@ -0,0 +1,5 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 10:55, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 19:40, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import numpy as np
+import pytest
+from enoppy.utils.boundary import repair_bounds
+from enoppy.paper_based.pdo_2022 import GearTrainProblem, SpeedReducerProblem
+
+LB, UB = np.array([0., -1.]), np.array([1., 3.])
+
+
+@pytest.mark.parametrize("method, expected", [
+    ("clip", [[0.5, 3.], [0., -1.], [1., 2.]]),
+    ("reflect", [[0.5, 1.], [0.25, 0.], [0.5, 2.]]),
+    ("wrap", [[0.5, 1.], [0.75, 2.], [0.5, 2.]]),
+    ("midpoint", [[0.5, 2.], [0.25, 0.], [0.75, 2.]]),
+])
+def test_repair_bounds(method, expected):
+    X = np.array([[0.5, 5.], [-0.25, -2.], [1.5, 2.]])
+    assert repair_bounds(X, LB, UB, method) is X
+    assert np.allclose(X, expected)
+    x = np.array([0.5, 5.])
+    assert np.allclose(repair_bounds(x, LB, UB, method), expected[0])
+
+
+def test_repair_bounds_random():
+    X = np.array([[0.5, 5.], [-0.25, 2.]] * 100)
+    repair_bounds(X, LB, UB, "random", np.random.default_rng(42))
+    assert np.all((X >= LB) & (X <= UB))
+    assert np.all(X[::2, 0] == 0.5) and np.all(X[1::2, 1] == 2.)
+    with pytest.raises(ValueError):
+        repair_bounds(X, LB, UB, "bounce")
+
+
+def test_set_bound_handling():
+    problem = GearTrainProblem()
+    X = np.random.uniform(problem.lb - 10, problem.ub + 10, (50, problem.n_dims))
+    assert np.array_equal(problem.amend_batch(X), np.trunc(X))
+    problem.set_bound_handling("clip")
+    X_amended = problem.amend_batch(X)
+    assert np.array_equal(X_amended, np.trunc(np.clip(X, problem.lb, problem.ub)))
+    assert np.array_equal(problem.evaluate_batch(X), problem.evaluate_batch(X_amended))
+    assert problem.evaluate(X[0]) == problem.evaluate(X_amended[0]) == problem.evaluate_scalar(X[0])
+    problem.set_bound_handling(None)
+    assert problem.bound_handling is None and np.array_equal(problem.amend_batch(X), np.trunc(X))
+    with pytest.raises(ValueError):
+        problem.set_bound_handling("bounce")
+
+    problem = SpeedReducerProblem()
+    problem.set_bound_handling("random", seed=42)
+    X = problem.amend_batch(np.full((20, problem.n_dims), 1e3))
+    assert np.all((X >= problem.lb) & (X <= problem.ub)) and len(np.unique(X[:, 0])) == 20
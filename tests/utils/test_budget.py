@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 16:55, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import time
+import numpy as np
+import pytest
+from enoppy.utils.budget import BudgetLedger, BudgetExhaustedError, TargetReachedError
+from enoppy.paper_based import rwco_2020, moeosma_2023
+
+
+def test_budget_ledger_caps():
+    ledger = BudgetLedger(max_fe=100)
+    ledger.open("a", max_fe=10)
+    assert ledger.charge("a", 6) == 0
+    with pytest.raises(BudgetExhaustedError) as info:
+        ledger.charge("a", 5)
+    assert info.value.reason == "max_fe" and info.value.run_id == "a"
+    ledger.refund("a", 2)
+    ledger.charge("a", 6)
+    assert ledger.snapshot("a")["remaining_fe"] == 0 and ledger.snapshot("a")["exhausted"]
+    assert ledger.snapshot("a")["n_rejected"] == 5
+
+    ledger.charge("b", 100)               # default limits
+    assert ledger.snapshot()["b"]["max_fe"] == 100
+    ledger.open("c", max_time=0.01)
+    time.sleep(0.02)
+    with pytest.raises(BudgetExhaustedError, match="wall-time"):
+        ledger.charge("c")
+    assert ledger.close("c")["exhausted"] and ledger.snapshot("c") is None
+    with pytest.raises(ValueError):
+        ledger.open("d", max_fe=-1)
+
+
+def test_budget_ledger_rate_limit():
+    ledger = BudgetLedger()
+    ledger.open("a", rate=100, burst=10)
+    assert ledger.charge("a", 10) == 0
+    assert ledger.charge("a", 5) == pytest.approx(0.05, abs=0.01)
+
+
+def test_problem_budget_and_target():
+    problem = rwco_2020.PressureVesselDesignProblem()
+    X = np.random.default_rng(0).uniform(problem.lb, problem.ub, (10, problem.n_dims))
+    list_objs, list_cons, _ = problem.evaluate_full_batch(X)
+    feasible = np.flatnonzero(np.all(list_cons <= 0, axis=1))
+    idx = feasible[np.argmin(list_objs[feasible, 0])]
+
+    problem = rwco_2020.PressureVesselDesignProblem()
+    problem.set_budget(max_fe=25, f_target=list_objs[idx, 0], tol=1e-6)
+    problem.evaluate(X[0])
+    problem.evaluate_batch(X)
+    assert problem.budget.hit_fe == idx + 2 and np.array_equal(problem.budget.hit_solution, problem.amend_batch(X)[idx])
+    with pytest.raises(TargetReachedError):
+        problem.evaluate(X[0])
+    assert problem.n_fe == 11
+
+    problem.set_budget(max_fe=15, on_stop="inf")
+    assert problem.evaluate_batch(X[:4]).shape == (4, 1)
+    assert np.all(np.isinf(problem.evaluate_batch(X[:1])))
+    assert problem.budget.stop_reason == "max_fe" and problem.n_fe == 15
+    problem.set_budget(max_fe=15)
+    with pytest.raises(BudgetExhaustedError, match="exhausted"):
+        problem.evaluate(X[0])
+    problem.set_budget()
+    assert problem.budget is None and problem.evaluate(X[0]).shape == (1, )
+
+
+def test_multi_objective_target():
+    problem = moeosma_2023.SpeedReducerProblem()
+    X = problem.create_population(2000, seed=0)
+    list_objs, list_cons, _ = problem.evaluate_full_batch(X)
+    feasible = np.all(list_cons <= 0, axis=1)
+    idx, idx_infeasible = np.flatnonzero(feasible)[0], np.flatnonzero(~feasible)[0]
+
+    problem = moeosma_2023.SpeedReducerProblem()
+    problem.set_budget(max_fe=100, f_target=[1e9, 1e9])
+    problem.evaluate(X[idx_infeasible])
+    assert not problem.budget.target_reached
+    problem.evaluate(X[idx])
+    assert problem.budget.hit_fe == 2 and np.array_equal(problem.budget.hit_solution, problem.amend_batch(X[idx:idx + 1])[0])
+
+    problem.set_budget(max_fe=100, f_target=list_objs[idx] - 1e-3)
+    problem.evaluate(X[idx])
+    assert not problem.budget.target_reached
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 11:20, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import numpy as np
+import pytest
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from enoppy.utils.cache import LRUCache, DiskCache
+from enoppy.paper_based import rwco_2020
+
+
+def test_LRUCache_eviction_and_counters():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.get("b") is None
+    assert cache.get_info() == {"hits": 1, "misses": 1, "maxsize": 2, "size": 2}
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_LRUCache_clear_under_lock():
+    class RecordingLock:
+        def __init__(self):
+            self.lock, self.released = threading.Lock(), []
+
+        def __enter__(self):
+            self.lock.acquire()
+
+        def __exit__(self, *args):
+            self.released.append((cache.hits, cache.misses, len(cache._data)))
+            self.lock.release()
+
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache._lock = RecordingLock()
+    cache.clear()
+    assert cache._lock.released == [(0, 0, 0)]          # no lookup can see the emptied cache with the old counters
+    assert cache.get_info() == {"hits": 0, "misses": 0, "maxsize": 2, "size": 0}
+
+
+def test_evaluate_with_cache():
+    problem = rwco_2020.ProcessSynthesis01Problem()
+    problem.set_cache(maxsize=16)
+    fit1 = problem.evaluate(np.array([0.5, 1.2]))
+    fit2 = problem.evaluate(np.array([0.5, 1.7]))     # the same solution after amend_position
+    assert np.array_equal(fit1, fit2)
+    assert problem.n_fe == 1 and problem.n_hits == 1
+    assert problem.cache.get_info()["hits"] == 1
+
+    fit2[:] = 0
+    assert np.array_equal(problem.evaluate(np.array([0.5, 1.3])), fit1)
+
+    problem.set_cache(maxsize=16, count_hits=True)
+    problem.evaluate(np.array([0.5, 1.2]))
+    problem.evaluate(np.array([0.5, 1.2]))
+    assert problem.n_fe == 3
+
+    problem.check_penalty_func("death")
+    assert np.all(np.isinf(problem.evaluate(np.array([1.5, 1.7]))))
+    assert np.all(np.isinf(problem.evaluate(np.array([1.5, 1.2]))))
+    assert len(problem.cache) == 2
+
+
+def test_evaluate_batch_with_cache():
+    problem = rwco_2020.ProcessSynthesis01Problem()
+    X = np.random.default_rng(3).uniform(problem.lb, problem.ub, (20, problem.n_dims))
+    expected = problem.evaluate_full_batch(X)
+
+    problem = rwco_2020.ProcessSynthesis01Problem()
+    problem.set_cache(maxsize=100)
+    problem.evaluate_batch(X[:10])
+    result = problem.evaluate_full_batch(X)
+    assert problem.n_fe == 20 and problem.n_hits == 10
+    assert problem.cache.get_info()["hits"] == 10
+    for res, exp in zip(result, expected):
+        assert np.array_equal(res, exp)
+
+
+def test_DiskCache_bulk_lookup_and_eviction(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = DiskCache(path, namespace="a", maxsize=5)
+    keys = [bytes([idx]) for idx in range(4)]
+    cache.put_many(keys, [(np.array([idx]), np.array([idx, -idx])) for idx in range(4)])
+    results = cache.get_many(keys + [b"missing"])
+    assert results[-1] is None
+    assert np.array_equal(results[3][1], [3., -3.])
+    assert cache.get_info()["hits"] == 4
+
+    other = DiskCache(path, namespace="b", maxsize=5)
+    assert other.get(keys[0]) is None
+    other.put_many([b"x", b"y"], [(np.zeros(1), np.zeros(2))] * 2)
+    assert len(cache) + len(other) == 5
+    assert cache.get(keys[0]) is None
+
+    copied = pickle.loads(pickle.dumps(cache))
+    assert np.array_equal(copied.get(keys[1])[0], [1.])
+    cache.clear()
+    assert len(cache) == 0 and len(other) == 2
+
+
+def evaluate_in_worker(args):
+    path, X = args
+    problem = rwco_2020.ProcessSynthesis01Problem()
+    problem.set_cache(maxsize=1000, path=path)
+    list_fits = problem.evaluate_batch(X)
+    return list_fits, problem.n_fe
+
+
+def test_disk_cache_shared_across_runs_and_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    X = np.random.default_rng(9).uniform([0., 0.], [1.6, 1.99], (30, 2))
+    expected = rwco_2020.ProcessSynthesis01Problem().evaluate_batch(X)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(evaluate_in_worker, [(path, X[:20]), (path, X[10:])]))
+    assert np.array_equal(np.concatenate([results[0][0], results[1][0][10:]]), expected)
+
+    problem = rwco_2020.ProcessSynthesis01Problem()
+    problem.set_cache(maxsize=1000, path=path)
+    assert np.array_equal(problem.evaluate_batch(X), expected)
+    assert problem.n_fe == 0
+    problem.check_penalty_func("death")
+    problem.evaluate(X[0])
+    assert problem.n_fe == 0
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 18:05, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import numpy as np
+import pytest
+from enoppy.utils.encoder import LabelEncoder, DiscreteCodec
+
+
+def test_label_encoder():
+    le = LabelEncoder()
+    assert np.array_equal(le.fit_transform([0.3, 0.1, 0.2, 0.1]), [2, 0, 1, 0])
+    assert list(le.inverse_transform([1, 5, -1])) == ["0.2", "unknown", "unknown"]
+
+
+def test_discrete_codec_decode():
+    codec = DiscreteCodec([3.0, 1.75, 2, 2.25, 2.5, 2.75, 2])
+    assert len(codec) == 6
+    assert codec.decode(2.7) == 2.25 and type(codec.decode(2.7)) is float
+    assert codec.decode(np.int64(5)) == 3.0
+    assert codec.decode(-1) == 1.75 and codec.decode(9.5) == 3.0
+
+    indices = np.array([[0., 5.99], [-2., 7.]])
+    assert np.array_equal(codec.decode(indices), [[1.75, 3.0], [1.75, 3.0]])
+    assert np.array_equal(codec.decode(np.arange(6)), codec.values)
+    assert codec.decode(np.inf) == 3.0 and codec.decode(-np.inf) == 1.75
+    assert np.array_equal(codec.decode([np.inf, -np.inf, 1e30]), [3.0, 1.75, 3.0])
+    with pytest.raises(ValueError, match="NaN"):
+        codec.decode(np.nan)
+    with pytest.raises(ValueError, match="NaN"):
+        codec.decode(np.array([0., np.nan]))
+
+    codec = DiscreteCodec([1.75, 2, 2.25], out_of_range="raise")
+    assert np.array_equal(codec.decode([0, 2.9]), [1.75, 2.25])
+    with pytest.raises(ValueError):
+        codec.decode(3)
+    with pytest.raises(ValueError):
+        codec.decode(np.array([0, -1]))
+    with pytest.raises(ValueError):
+        codec.decode(np.inf)
+    with pytest.raises(ValueError):
+        codec.decode(np.array([0., np.inf]))
+
+
+def test_discrete_codec_encode():
+    codec = DiscreteCodec([1.75, 2, 2.25, 2.5, 2.75, 3.0])
+    assert codec.encode(2.1) == 1 and type(codec.encode(2.1)) is int
+    assert codec.encode(2.125) == 1
+    assert np.array_equal(codec.encode([0., 1.8, 2.3, 2.9, 10.]), [0, 0, 2, 5, 5])
+    assert np.array_equal(codec.decode(codec.encode(codec.values)), codec.values)
+    assert np.array_equal(DiscreteCodec([4.]).encode([1., 9.]), [0, 0])
+    with pytest.raises(ValueError):
+        DiscreteCodec([1.75, 2], out_of_range="raise").encode([1.5])
+    with pytest.raises(ValueError):
+        DiscreteCodec([])
+    with pytest.raises(ValueError):
+        DiscreteCodec([1., 2.], out_of_range="wrap")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 10:55, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import numpy as np
+import pytest
+from enoppy.utils.penalty import get_violation, static_penalty, get_penalty
+from enoppy.paper_based import moeosma_2023
+
+
+def loop_penalty(list_objs, list_cons, w):
+    return np.array([val + w * np.sum([max(0, f_con) for f_con in list_cons]) for val in list_objs])
+
+
+def test_static_penalty_single_and_batch():
+    rng = np.random.default_rng(1)
+    objs = rng.normal(size=(50, 3))
+    cons = rng.normal(size=(50, 7))
+
+    assert np.isclose(get_violation(cons[0]), np.sum(np.maximum(cons[0], 0)))
+    assert np.allclose(static_penalty(objs[0], cons[0], 1e8), loop_penalty(objs[0], cons[0], 1e8))
+    expected = np.array([loop_penalty(o, c, 1e8) for o, c in zip(objs, cons)])
+    assert np.allclose(static_penalty(objs, cons, 1e8), expected)
+
+    out, work, violation = np.empty_like(objs), np.empty_like(cons), np.empty(50)
+    res = static_penalty(objs, cons, 1e8, out=out, work=work, violation=violation)
+    assert res is out
+    assert np.allclose(out, expected)
+
+
+def test_default_penalty_keeps_callback_contract():
+    prob = moeosma_2023.SpeedReducerProblem()
+    X = np.random.uniform(prob.lb, prob.ub, (10, prob.n_dims))
+    X_amended = prob.amend_batch(X)
+    objs, cons = prob.get_objs_batch(X_amended), prob.get_cons_batch(X_amended)
+    assert np.allclose(prob.evaluate_batch(X), [loop_penalty(o, c, prob.w) for o, c in zip(objs, cons)])
+
+    def penalty_func(list_objs, list_cons):
+        list_cons[list_cons < 0] = 0
+        return np.sum(list_objs) + 1e5 * np.sum(list_cons ** 2)
+
+    prob = moeosma_2023.SpeedReducerProblem(penalty_func)
+    assert prob.evaluate_batch(X).shape == (10,)
+    assert np.isclose(prob.evaluate(X[0].copy()), prob.evaluate_batch(X)[0])
+
+
+def test_constraint_handling_strategies():
+    rng = np.random.default_rng(7)
+    objs = rng.normal(size=(40, 2))
+    cons = rng.normal(size=(40, 5))
+    feasible = np.all(cons <= 0, axis=1)
+    feasible[:3] = True
+    cons[:3] = -1.
+
+    death = get_penalty("death")
+    res = death(objs, cons)
+    assert np.array_equal(res[feasible], objs[feasible])
+    assert np.all(np.isinf(res[~feasible]))
+
+    adaptive = get_penalty("adaptive")
+    res = adaptive(objs, cons)
+    assert adaptive.coefs.shape == (2, 5)
+    assert np.array_equal(res[feasible], objs[feasible])
+    assert np.all(res[~feasible] >= np.mean(objs, axis=0))
+
+    rules = get_penalty("feasibility")
+    key = rules(objs, cons)[:, 0]
+    assert np.max(key[feasible]) < np.min(key[~feasible])
+    order = np.argsort(key[~feasible])
+    assert np.all(np.diff(get_violation(cons[~feasible])[order]) >= 0)
+
+    epsilon = get_penalty("epsilon", max_gen=10)
+    epsilon(objs, cons)
+    eps0 = epsilon.epsilon
+    assert eps0 == epsilon.epsilon0 > 0
+    for _ in range(10):
+        epsilon(objs, cons)
+    assert epsilon.epsilon == 0
+
+    with pytest.raises(ValueError):
+        get_penalty("unknown")
+
+
+def test_strategy_by_name_on_problem():
+    prob = moeosma_2023.SpeedReducerProblem(f_penalty="feasibility")
+    X = np.random.uniform(prob.lb, prob.ub, (30, prob.n_dims))
+    assert prob.evaluate_batch(X).shape == (30, 2)
+    assert prob.evaluate(X[0]).shape == (2,)
+    prob = moeosma_2023.SpeedReducerProblem(f_penalty="static")
+    assert prob.f_penalty == prob.default_penalty
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 20:30, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import warnings
+import numpy as np
+import pytest
+from enoppy.utils import sampling
+from enoppy.utils.sampling import get_generator, spawn_generators, sample_unit
+from enoppy.paper_based.pdo_2022 import ReinforcedConcreateBeamProblem
+from enoppy.paper_based.moeosma_2023 import SpeedReducerProblem
+
+
+def test_generators():
+    streams = spawn_generators(42, 3)
+    assert [rng.random() for rng in streams] == [get_generator(42, k).random() for k in range(3)]
+    assert len({rng.random() for rng in spawn_generators(42, 3)}) == 3
+    assert get_generator(7).random() == np.random.default_rng(7).random()
+    with pytest.raises(ValueError):
+        get_generator(np.random.default_rng(7), 1)
+
+
+@pytest.mark.parametrize("method", ["uniform", "lhs", "sobol"])
+def test_sample_unit(method):
+    U = sample_unit(64, 3, method, np.random.default_rng(1))
+    assert U.shape == (64, 3) and np.all((U >= 0) & (U < 1))
+    assert np.array_equal(U, sample_unit(64, 3, method, np.random.default_rng(1)))
+    if method != "uniform":
+        assert all(len(np.unique(np.floor(U[:, idx] * 64))) == 64 for idx in range(3))
+
+
+def test_sample_unit_warnings(monkeypatch):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        sample_unit(10, 2, "sobol", np.random.default_rng(1))
+
+    class Engine:
+        def random(self, n):
+            warnings.warn("unrelated warning", UserWarning)
+            return np.zeros((n, 2))
+
+    monkeypatch.setattr(sampling, "get_qmc_engine", lambda name, n_dims, rng: Engine())
+    with pytest.warns(UserWarning, match="unrelated warning"):
+        sample_unit(10, 2, "lhs")
+
+
+def test_create_population():
+    problem = SpeedReducerProblem()
+    X = problem.create_population(100, method="lhs", seed=3)
+    assert X.shape == (100, problem.n_dims) and np.all((X >= problem.lb) & (X <= problem.ub))
+    assert np.array_equal(X, problem.create_population(100, method="lhs", seed=3))
+    assert np.array_equal(X[:, 2], np.trunc(X[:, 2]))
+    assert not np.array_equal(problem.create_population(10, seed=3, stream=0), problem.create_population(10, seed=3, stream=1))
+
+    problem = ReinforcedConcreateBeamProblem()
+    X = problem.create_population(50, method="sobol", seed=np.random.default_rng(5))
+    assert set(X[:, 0]) <= set(problem.codec.values)
+    with pytest.raises(ValueError):
+        problem.create_population(10, method="halton")
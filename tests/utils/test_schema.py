@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 18:55, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import inspect
+import numpy as np
+import pytest
+from enoppy.engineer import Engineer
+from enoppy.paper_based import moeosma_2023, ihaoavoa_2022, pdo_2022, rwco_2020
+from enoppy.utils.schema import VariableSchema, CompactPopulation, get_int_dtype
+from enoppy.paper_based.rwco_2020 import PlanetaryGearTrainDesignOptimizationProblem
+from enoppy.paper_based.pdo_2022 import ReinforcedConcreateBeamProblem
+
+
+def test_variable_schema_amend():
+    schema = VariableSchema(4, integers=[3, 1], tables={0: [0.009, 0.0095, 0.0104]})
+    assert schema.var_types == ["discrete", "int", "float", "int"]
+    X = np.array([[1.7, 2.5, 3.9, -1.5], [2.9, 7.9, 1.5, np.inf]])
+    assert schema.amend(X) is X
+    assert np.array_equal(X, [[0.0095, 2., 3.9, -1.], [0.0104, 7., 1.5, np.inf]])
+
+    x = np.array([0.2, 2.5, 3.9, -1.5])
+    assert np.array_equal(schema.amend(x), [0.009, 2., 3.9, -1.])
+    assert schema.amend_list([0.2, 2.5, 3.9, -1.5]) == [0.009, 2., 3.9, -1.]
+    assert not VariableSchema(2).amends and np.array_equal(VariableSchema(2).amend(np.ones((3, 2))), np.ones((3, 2)))
+
+    with pytest.raises(ValueError):
+        VariableSchema(3, integers=[0], tables={0: [1., 2.]})
+    with pytest.raises(ValueError):
+        VariableSchema(3, integers=[3])
+
+
+def test_pack_population():
+    np.random.seed(42)
+    assert get_int_dtype(12, 60) == np.int8 and get_int_dtype(0, 1000) == np.int16 and get_int_dtype(0, 2**40) == np.int64
+    problem = PlanetaryGearTrainDesignOptimizationProblem()
+    X = problem.amend_batch(np.random.uniform(problem.lb, problem.ub, (50, problem.n_dims)))
+    pop = problem.pack_population(X)
+    assert isinstance(pop, CompactPopulation) and len(pop) == 50
+    assert pop.dtypes[0] == np.int8 and pop.dtypes[7] == np.int8
+    assert pop.nbytes < X.nbytes
+    assert np.array_equal(pop.to_array(), X) and np.array_equal(np.asarray(pop), X)
+    assert np.array_equal(problem.evaluate_batch(pop), problem.evaluate_batch(X), equal_nan=True)
+
+    problem = ReinforcedConcreateBeamProblem()
+    X = np.random.uniform(problem.lb, problem.ub, (20, problem.n_dims))
+    pop = problem.pack_population(X)
+    assert problem.var_types == ["discrete", "int", "float"]
+    assert np.array_equal(pop.columns[0], np.trunc(X[:, 0])) and np.array_equal(pop.to_values(), problem.amend_batch(X))
+    assert np.array_equal(problem.evaluate_batch(pop), problem.evaluate_batch(X), equal_nan=True)
+
+
+def test_amend_in_evaluate():
+    np.random.seed(42)
+    problem = PlanetaryGearTrainDesignOptimizationProblem()
+    x = np.random.uniform(problem.lb, problem.ub)
+    x_int = np.trunc(x).astype(np.int64)
+    assert problem.evaluate(x) == problem.evaluate(x_int) == problem.evaluate(list(x_int))
+    assert np.array_equal(problem.evaluate_batch(np.array([x, x_int])), [problem.evaluate(x)] * 2)
+
+
+def test_amended_problems_deduplicate():
+    for module in (moeosma_2023, ihaoavoa_2022, pdo_2022, rwco_2020):
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, Engineer) and cls.__module__ == module.__name__ and cls().schema is not None:
+                assert cls.deduplicate, f"{module.__name__}.{cls.__name__}"
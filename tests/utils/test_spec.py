@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# Created by "Thieu" at 12:10, 18/10/2026 ----------%
+#       Email: nguyenthieu2102@gmail.com            %
+#       Github: https://github.com/thieu1995        %
+# --------------------------------------------------%
+
+import json
+import subprocess
+import sys
+import numpy as np
+import pytest
+from enoppy.engineer import Engineer
+from enoppy.utils.spec import encode, decode, decode_data, get_fingerprint
+from enoppy.utils.penalty import DeathPenalty
+from enoppy.paper_based import moeosma_2023, rwco_2020
+
+
+def test_encode_decode_roundtrip():
+    value = {"a": np.array([[1, 2], [3, 4]], dtype=np.int32), "b": [(1.5, np.float64(2.5)), None], 3: np.sum}
+    result = decode(json.loads(json.dumps(encode(value))))
+    assert result["a"].dtype == np.int32 and np.array_equal(result["a"], value["a"])
+    assert result["b"] == [[1.5, 2.5], None]
+    assert result[3] is np.sum
+    assert get_fingerprint(value) == get_fingerprint(result)
+
+
+def test_fingerprint_identifies_the_configuration():
+    problem = moeosma_2023.HydrostaticThrustBearingProblem()
+    assert problem.fingerprint() == moeosma_2023.HydrostaticThrustBearingProblem().fingerprint()
+    code = "from enoppy.paper_based import moeosma_2023; print(moeosma_2023.HTBP().fingerprint())"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+    assert output == problem.fingerprint()
+
+    other = moeosma_2023.HydrostaticThrustBearingProblem()
+    other.gamma = 0.04
+    assert other.fingerprint() != problem.fingerprint()
+    other = moeosma_2023.HydrostaticThrustBearingProblem(f_penalty="death")
+    assert other.fingerprint() != problem.fingerprint()
+    assert other.fingerprint(penalty=False) == problem.fingerprint(penalty=False)
+    problem.evaluate(problem.create_solution())
+    assert problem.fingerprint() == moeosma_2023.HydrostaticThrustBearingProblem().fingerprint()
+
+
+def test_spec_roundtrip():
+    problem = moeosma_2023.SpringProblem(f_penalty=DeathPenalty(value=1e10))
+    problem._bounds = [(0, 41.99), (1.0, 20.0), (1, 32)]
+    spec = json.loads(json.dumps(problem.to_spec()))
+    assert list(spec["attrs"]) == ["_bounds"]
+
+    rebuilt = Engineer.from_spec(spec)
+    assert type(rebuilt) is moeosma_2023.SpringProblem
+    assert rebuilt.fingerprint() == problem.fingerprint()
+    X = np.random.default_rng(2).uniform(problem.lb, problem.ub, (10, problem.n_dims))
+    assert np.array_equal(rebuilt.evaluate_batch(X), problem.evaluate_batch(X))
+
+    assert rwco_2020.PGTDOP().to_spec()["attrs"] == {}
+    with pytest.raises(ValueError):
+        Engineer.from_spec(rwco_2020.PGTDOP(f_penalty=lambda objs, cons: objs).to_spec())
+
+
+def test_from_spec_untrusted():
+    problem = moeosma_2023.SpringProblem(f_penalty=DeathPenalty(value=1e10))
+    problem._bounds = [(0, 41.99), (1.0, 20.0), (1, 32)]
+    spec = json.loads(json.dumps(problem.to_spec()))
+    rebuilt = Engineer.from_spec(spec, trusted=False)
+    assert rebuilt.fingerprint() == problem.fingerprint()
+    assert np.array_equal(decode_data(encode([np.arange(3), {"a": 1.5}])[0]), np.arange(3))
+
+    bad_specs = [
+        {**spec, "attrs": {"get_objs_cons_batch": {"__callable__": "pickle:loads"}}},
+        {**spec, "attrs": {"evaluate": 1.0}},
+        {**spec, "attrs": {"cache": None}},
+        {**spec, "attrs": {"_bounds": {"__object__": "collections:OrderedDict", "state": {}}}},
+        {**spec, "attrs": {"paras": {"a": 1}}},
+        {**spec, "penalty": {"__callable__": "os:system"}},
+        {**spec, "class": "subprocess:Popen"},
+        {**spec, "class": "enoppy.utils.spec:decode"},
+    ]
+    for bad_spec in bad_specs:
+        with pytest.raises(ValueError):
+            Engineer.from_spec(bad_spec, trusted=False)
+    with pytest.raises(ValueError):
+        Engineer.from_spec({**spec, "attrs": {"evaluate": 1.0}})
+    with pytest.raises(ValueError):
+        decode_data({"__ndarray__": [1], "dtype": "|O"})
+    value = {(1, (2, 3)): "a", 4: [5]}
+    assert decode_data(json.loads(json.dumps(encode(value)))) == decode(encode(value)) == value
+    for bad_items in [[[{"a": 1}, 1]], [[{"__ndarray__": [1], "dtype": "<f8"}, 1]], [[1, 2, 3]], 5]:
+        with pytest.raises(ValueError):
+            decode_data({"__items__": bad_items})